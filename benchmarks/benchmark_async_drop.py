@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""Benchmark the longest GUI thread stall while dropping many objects."""
+
+import time
+
+from objetto.applications import Application
+from objetto.objects import Object, attribute, list_cls
+from Qt import QtCore, QtWidgets
+
+from objettoqt.models import BinaryJsonMimeCodec, OQListModel
+
+MIME_TYPE = "application/x-objettoqt-benchmark"
+
+
+class Thing(Object):
+    name = attribute(str, default="Foo")
+
+
+def benchmark_async_drop(sizes=(200, 2000), chunk_size=100):
+    qt_app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    app = Application()
+
+    for size in sizes:
+        source = list_cls(Thing)(app)
+        serialized_objs = [
+            source.serialize_value(Thing(app, name=str(i))) for i in range(size)
+        ]
+        data = BinaryJsonMimeCodec().encode({"serialized_objs": serialized_objs})
+
+        for threshold in (None, 1):
+            target = list_cls(Thing)(app)
+            model = OQListModel(mime_type=MIME_TYPE)
+            model.setObj(target)
+            model.setAsyncDropThreshold(threshold)
+            model.setDropChunkSize(chunk_size)
+
+            # Measure the longest interval between ticks of the event loop.
+            ticks = [time.perf_counter()]
+            timer = QtCore.QTimer()
+            timer.setInterval(0)
+            timer.timeout.connect(lambda: ticks.append(time.perf_counter()))
+            timer.start()
+
+            loop = QtCore.QEventLoop()
+            model.asyncDropFinished.connect(loop.quit)
+            mime_data = QtCore.QMimeData()
+            mime_data.setData(MIME_TYPE, data)
+            start = time.perf_counter()
+            model.dropMimeData(mime_data, QtCore.Qt.CopyAction, 0, 0)
+            if model.isAsyncDropRunning():
+                loop.exec_()
+            ticks.append(time.perf_counter())
+            total = ticks[-1] - start
+            timer.stop()
+
+            stall = max(b - a for a, b in zip(ticks, ticks[1:]))
+            print(
+                "{} objects, {}: {:.0f} ms total, {:.0f} ms longest stall".format(
+                    size,
+                    "sync" if threshold is None else "async",
+                    total * 1e3,
+                    stall * 1e3,
+                )
+            )
+            assert len(target) == size
+            model.deleteLater()
+    qt_app.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+
+
+if __name__ == "__main__":
+    benchmark_async_drop()
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""Benchmark getting data for visible rows from a slow header, sync versus async."""
+
+import time
+import timeit
+
+from objetto.applications import Application
+from objetto.objects import Object, attribute, list_cls
+from Qt import QtCore, QtWidgets
+
+from objettoqt.models import AsyncListModelHeader, OQListModel
+
+
+class Thing(Object):
+    name = attribute(str, default="Foo")
+
+
+class SlowHeader(AsyncListModelHeader):
+    delay = 0.002
+
+    def compute(self, snapshot, role):
+        time.sleep(self.delay)
+        return snapshot["name"].upper()
+
+
+def benchmark_async_header(rows=10000, visible_rows=50):
+    qt_app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    app = Application()
+    lst = list_cls(Thing)(app, (Thing(app, name=str(i)) for i in range(rows)))
+    header = SlowHeader(title="name")
+    model = OQListModel(headers=(header,))
+    model.setObj(lst)
+    thread_pool = QtCore.QThreadPool.globalInstance()
+
+    def sync_pass():
+        for row in range(visible_rows):
+            header.data(lst, row)
+
+    def async_pass():
+        for row in range(visible_rows):
+            model.data(model.index(row))
+
+    sync_seconds = timeit.timeit(sync_pass, number=1)
+    print(
+        "{} visible rows, sync: {:.2f} ms blocking the gui thread".format(
+            visible_rows, sync_seconds * 1e3
+        )
+    )
+
+    start = time.time()
+    async_seconds = timeit.timeit(async_pass, number=1)
+    while model.asyncDataInFlightCount():
+        thread_pool.waitForDone()
+        qt_app.processEvents()
+    total_seconds = time.time() - start
+    print(
+        "{} visible rows, async: {:.2f} ms blocking the gui thread, "
+        "{:.2f} ms until all data arrives ({} threads)".format(
+            visible_rows,
+            async_seconds * 1e3,
+            total_seconds * 1e3,
+            model.asyncDataLimit(),
+        )
+    )
+    assert model.data(model.index(visible_rows - 1)) == str(visible_rows - 1)
+
+    # Cached afterwards.
+    cached_seconds = timeit.timeit(async_pass, number=1)
+    print(
+        "{} visible rows, cached: {:.2f} ms".format(visible_rows, cached_seconds * 1e3)
+    )
+
+
+if __name__ == "__main__":
+    benchmark_async_header()
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""Benchmark bursts of updates to adjacent rows of a list shown in a view."""
+
+import timeit
+
+from objetto.applications import Application
+from objetto.objects import list_cls
+from Qt import QtCore, QtWidgets
+
+from objettoqt.models import OQListModel
+from objettoqt.views import OQTreeListView
+
+
+def benchmark_data_changed(rows=1000, burst=200, bursts=20):
+    qt_app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    app = Application()
+    lst = list_cls(str)(app, (str(i) for i in range(rows)))
+
+    model = OQListModel(headers=("", ""))
+    model.setObj(lst)
+    view = OQTreeListView()
+    view.setModel(model)
+    view.resize(400, 600)
+    view.show()
+    qt_app.processEvents()
+
+    emitted = []
+    model.dataChanged.connect(lambda *_: emitted.append(True))
+    counter = iter(range(bursts * 10))
+
+    def update_burst():
+        value = str(next(counter))
+        with app.write_context():
+            for row in range(burst):
+                lst[row] = value
+        qt_app.processEvents()
+        view.viewport().repaint()
+
+    seconds = min(timeit.repeat(update_burst, number=bursts, repeat=3))
+    print(
+        "{} updates per burst: {:.2f} ms/burst, {} dataChanged emitted".format(
+            burst, seconds / bursts * 1e3, len(emitted)
+        )
+    )
+    view.deleteLater()
+    qt_app.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+
+
+if __name__ == "__main__":
+    benchmark_data_changed()
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""Benchmark `OQListModel.data` while repainting a window of a 100k-row list."""
+
+import timeit
+
+from objetto.applications import Application
+from objetto.objects import list_cls
+from Qt import QtCore, QtWidgets
+
+from objettoqt.models import OQListModel
+
+
+def benchmark_list_model_data(rows=100000, visible_rows=50, repaints=200):
+    qt_app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    app = Application()
+    lst = list_cls(str)(app, (str(i) for i in range(rows)))
+
+    for cache_size in (None, visible_rows * 4):
+        model = OQListModel()
+        model.setObj(lst)
+        model.setDataCacheSize(cache_size)
+        first_row = rows // 2
+        indexes = [
+            model.index(row) for row in range(first_row, first_row + visible_rows)
+        ]
+
+        def repaint():
+            for index in indexes:
+                model.data(index, QtCore.Qt.DisplayRole)
+
+        seconds = min(timeit.repeat(repaint, number=repaints, repeat=5))
+        calls = repaints * len(indexes)
+        print(
+            "data (cache size {}): {:.0f} calls/s ({:.2f} us/call)".format(
+                cache_size, calls / seconds, seconds / calls * 1e6
+            )
+        )
+
+        # Scroll a page down for every repaint, so rows are not cached yet.
+        scroll_indexes = [model.index(row) for row in range(rows)]
+        pages = iter(range(0, rows, visible_rows))
+
+        def scroll():
+            page = next(pages)
+            for index in scroll_indexes[page : page + visible_rows]:
+                model.data(index, QtCore.Qt.DisplayRole)
+
+        scrolls = rows // visible_rows // 5
+        seconds = min(timeit.repeat(scroll, number=scrolls, repeat=5))
+        calls = scrolls * visible_rows
+        print(
+            "data while scrolling (cache size {}): {:.2f} us/call".format(
+                cache_size, seconds / calls * 1e6
+            )
+        )
+        model.setObj(None)
+        model.deleteLater()
+    qt_app.processEvents()
+
+
+if __name__ == "__main__":
+    benchmark_list_model_data()
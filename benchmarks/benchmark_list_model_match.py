@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""Benchmark finding items in a large list, scanning versus indexed."""
+
+import timeit
+
+from objetto.applications import Application
+from objetto.objects import list_cls
+from Qt import QtCore, QtWidgets
+
+from objettoqt.models import OQListModel
+
+
+def benchmark_list_model_match(rows=200000, number=10):
+    qt_app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    app = Application()
+    lst = list_cls(str)(app, ("item {}".format(i) for i in range(rows)))
+    model = OQListModel()
+    model.setObj(lst)
+    start = model.index(0)
+    value = "item {}".format(rows - 1)
+    flags = QtCore.Qt.MatchExactly
+
+    def scan():
+        assert super(OQListModel, model).match(start, QtCore.Qt.DisplayRole, value)
+
+    def match():
+        assert model.match(start, QtCore.Qt.DisplayRole, value, 1, flags)
+
+    scan_seconds = min(timeit.repeat(scan, number=1, repeat=3))
+    print("{} rows, scan: {:.2f} ms/match".format(rows, scan_seconds * 1e3))
+
+    for kind in ("hash", "sorted"):
+        model.addIndex(kind, kind=kind)
+        build_seconds = timeit.timeit(match, number=1)
+        match_seconds = min(timeit.repeat(match, number=number, repeat=3)) / number
+        print(
+            "{} rows, {} index: {:.2f} ms to build, {:.4f} ms/match".format(
+                rows, kind, build_seconds * 1e3, match_seconds * 1e3
+            )
+        )
+        model.removeIndex(kind)
+
+    # Updating a row patches the index.
+    model.addIndex("hash")
+    model.findRows("hash", value)
+    counter = iter(range(number * 10))
+
+    def update():
+        lst[rows // 2] = "updated {}".format(next(counter))
+        assert model.findRows("hash", "item 0") == [0]
+
+    update_seconds = min(timeit.repeat(update, number=number, repeat=3)) / number
+    print("{} rows, update + find: {:.3f} ms".format(rows, update_seconds * 1e3))
+
+    # Inserting and deleting rows shifts the indexes without renumbering rows.
+    def insert_delete():
+        lst.insert(rows // 2, "inserted")
+        del lst[rows // 2]
+
+    model.removeIndex("hash")
+    for kinds in ((), ("hash", "sorted")):
+        for kind in kinds:
+            model.addIndex(kind, kind=kind)
+            model.findRows(kind, value)
+        shift_seconds = (
+            min(timeit.repeat(insert_delete, number=number, repeat=3)) / number
+        )
+        print(
+            "{} rows, insert + delete with indexes {}: {:.3f} ms".format(
+                rows, kinds, shift_seconds * 1e3
+            )
+        )
+    assert model.findRows("hash", value) == [rows - 1]
+    qt_app.processEvents()
+
+
+if __name__ == "__main__":
+    benchmark_list_model_match()
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""Benchmark the first paint of a 200k-row list view, with and without paging."""
+
+from timeit import default_timer
+
+from objetto.applications import Application
+from objetto.objects import list_cls
+from Qt import QtWidgets
+
+from objettoqt.models import OQListModel
+from objettoqt.views import OQListView
+
+
+def benchmark_list_model_paging(rows=200000, page_size=256):
+    qt_app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    app = Application()
+    lst = list_cls(str)(app, (str(i) for i in range(rows)))
+
+    for size in (None, page_size):
+        start = default_timer()
+        model = OQListModel()
+        model.setPageSize(size)
+        model.setObj(lst)
+        view = OQListView()
+        view.setUniformItemSizes(True)
+        view.setModel(model)
+        view.resize(400, 600)
+        view.show()
+        qt_app.processEvents()
+        view.viewport().repaint()
+        print(
+            "first paint (page size {}): {:.1f} ms".format(
+                size, (default_timer() - start) * 1e3
+            )
+        )
+        view.deleteLater()
+        model.deleteLater()
+        qt_app.processEvents()
+
+
+if __name__ == "__main__":
+    benchmark_list_model_paging()
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""Benchmark the drag and drop round trip of a list model's mime data per codec."""
+
+import timeit
+
+from objetto.applications import Application
+from objetto.objects import list_cls
+from Qt import QtCore, QtWidgets
+
+from objettoqt.models import OQListModel, get_mime_codec
+
+MIME_TYPE = "application/x-objettoqt-benchmark"
+
+
+def benchmark_mime_codecs(sizes=(10, 1000, 100000), codecs=("yaml", "binary_json")):
+    qt_app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    app = Application()
+
+    for size in sizes:
+        source = list_cls(str)(app, ("item {}".format(i) for i in range(size)))
+        source_model = OQListModel(mime_type=MIME_TYPE)
+        source_model.setObj(source)
+        indexes = [source_model.index(row) for row in range(size)]
+
+        for codec in codecs:
+            source_model.setMimeCodec(codec)
+            target = list_cls(str)(app)
+            target_model = OQListModel(mime_type=MIME_TYPE)
+            target_model.setObj(target)
+
+            def round_trip():
+                # Copy the data as it would arrive from another process.
+                mime_data = QtCore.QMimeData()
+                data = source_model.mimeData(indexes).data(MIME_TYPE)
+                mime_data.setData(MIME_TYPE, data)
+                target_model.dropMimeData(mime_data, QtCore.Qt.CopyAction, 0, 0)
+
+            number = max(1, 1000 // size)
+            seconds = min(timeit.repeat(round_trip, number=number, repeat=3))
+            data = source_model.mimeData(indexes).data(MIME_TYPE)
+            print(
+                "{} rows, {}: {:.2f} ms/round trip, {} bytes".format(
+                    size, codec, seconds / number * 1e3, data.size()
+                )
+            )
+            target_model.deleteLater()
+        source_model.deleteLater()
+    qt_app.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+
+
+def benchmark_in_process_drop(sizes=(10, 1000, 100000)):
+    qt_app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    app = Application()
+
+    for size in sizes:
+        source = list_cls(str)(app, ("item {}".format(i) for i in range(size)))
+        source_model = OQListModel(mime_type=MIME_TYPE)
+        source_model.setObj(source)
+        indexes = [source_model.index(row) for row in range(size)]
+        target = list_cls(str)(app)
+        target_model = OQListModel(mime_type=MIME_TYPE)
+        target_model.setObj(target)
+
+        def drop():
+            mime_data = source_model.mimeData(indexes)
+            target_model.dropMimeData(mime_data, QtCore.Qt.CopyAction, 0, 0)
+
+        number = max(1, 1000 // size)
+        seconds = min(timeit.repeat(drop, number=number, repeat=3))
+        print(
+            "{} rows, in-process: {:.2f} ms/drop".format(size, seconds / number * 1e3)
+        )
+        source_model.deleteLater()
+        target_model.deleteLater()
+    qt_app.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+
+
+def benchmark_mime_codecs_encoding(sizes=(10, 1000, 100000)):
+    for size in sizes:
+        contents = {
+            "obj_id": 0,
+            "first_row": 0,
+            "last_row": size - 1,
+            "serialized_objs": ["item {}".format(i) for i in range(size)],
+        }
+        for name in ("yaml", "binary_json"):
+            codec = get_mime_codec(name)
+
+            def encode_decode():
+                codec.decode(codec.encode(contents))
+
+            number = max(1, 1000 // size)
+            seconds = min(timeit.repeat(encode_decode, number=number, repeat=3))
+            print(
+                "{} rows, {} (codec only): {:.3f} ms/round trip".format(
+                    size, name, seconds / number * 1e3
+                )
+            )
+
+
+if __name__ == "__main__":
+    benchmark_mime_codecs_encoding()
+    benchmark_mime_codecs()
+    benchmark_in_process_drop()
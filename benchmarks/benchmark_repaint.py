@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""Benchmark full-viewport repaints of a 40-row, 6-column tree list view."""
+
+import timeit
+
+from objetto.applications import Application
+from objetto.objects import Object, attribute, list_cls
+from Qt import QtWidgets
+
+from objettoqt._render import render_pass
+from objettoqt.models import OQListModel
+from objettoqt.views import OQTreeListView
+
+HEADERS = ("a", "b", "c", "d", "e", "f")
+
+
+class Thing(Object):
+    a = attribute(str, default="a")
+    b = attribute(str, default="b")
+    c = attribute(str, default="c")
+    d = attribute(str, default="d")
+    e = attribute(str, default="e")
+    f = attribute(str, default="f")
+
+
+class PerCallListModel(OQListModel):
+    """Enters a read context per data query, like before render passes."""
+
+    def renderPass(self):
+        return render_pass()
+
+
+def benchmark_repaint(rows=40, repaints=10):
+    qt_app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    app = Application()
+    lst = list_cls(Thing)(app, [Thing(app) for _ in range(rows)])
+
+    for model_cls in (PerCallListModel, OQListModel):
+        model = model_cls(headers=HEADERS)
+        model.setObj(lst)
+        view = OQTreeListView()
+        view.setModel(model)
+        view.resize(800, 20 * rows)
+        view.show()
+        qt_app.processEvents()
+
+        def repaint():
+            view.viewport().repaint()
+
+        seconds = min(timeit.repeat(repaint, number=repaints, repeat=3))
+        print(
+            "{}: {:.2f} ms/repaint".format(model_cls.__name__, seconds / repaints * 1e3)
+        )
+        view.deleteLater()
+        model.deleteLater()
+        qt_app.processEvents()
+
+
+if __name__ == "__main__":
+    benchmark_repaint()
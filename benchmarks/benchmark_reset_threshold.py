@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""Benchmark inserting and deleting many rows in a list shown with a selection."""
+
+from timeit import default_timer
+
+from objetto.applications import Application
+from objetto.objects import list_cls
+from Qt import QtCore, QtWidgets
+
+from objettoqt.models import OQListModel
+from objettoqt.views import OQTreeListView
+
+
+def benchmark_reset_threshold(rows=1000, changed_rows=50000, small_changes=2000):
+    qt_app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    for threshold, policy in ((None, "reset"), (1000, "reset"), (1000, "layout")):
+        app = Application()
+        lst = list_cls(str)(app, (str(i) for i in range(rows)))
+        model = OQListModel(headers=("", ""))
+        model.setObj(lst)
+        model.setResetThreshold(threshold)
+        model.setResetPolicy(policy)
+        view = OQTreeListView()
+        view.setUniformRowHeights(True)
+        view.setModel(model)
+        view.resize(400, 600)
+        view.show()
+        view.selectionModel().select(
+            QtCore.QItemSelection(model.index(0, 0), model.index(rows - 1, 1)),
+            QtCore.QItemSelectionModel.Select,
+        )
+        qt_app.processEvents()
+
+        start = default_timer()
+        lst.extend(str(i) for i in range(changed_rows))
+        qt_app.processEvents()
+        del lst[rows:]
+        qt_app.processEvents()
+        bulk_seconds = default_timer() - start
+
+        start = default_timer()
+        with app.write_context():
+            for i in range(small_changes):
+                lst.insert(i % rows, str(i))
+        qt_app.processEvents()
+        small_seconds = default_timer() - start
+
+        print(
+            "threshold {} ({}): {:.0f} ms for {} rows in bulk, {:.0f} ms for {} "
+            "single inserts, {} fallbacks, {} row signals".format(
+                threshold,
+                policy,
+                bulk_seconds * 1e3,
+                changed_rows,
+                small_seconds * 1e3,
+                small_changes,
+                model.fallbackCount(),
+                model.rowSignalCount(),
+            )
+        )
+        view.deleteLater()
+        qt_app.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+
+
+if __name__ == "__main__":
+    benchmark_reset_threshold()
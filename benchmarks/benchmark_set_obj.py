@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""Benchmark `OQObjectMixin.setObj` throughput (recycled editors)."""
+
+import timeit
+
+from objetto.applications import Application
+from objetto.objects import Object, attribute
+from Qt import QtWidgets
+
+from objettoqt.widgets import OQWidget
+
+
+class Thing(Object):
+    name = attribute(str, default="Foo")
+
+
+def benchmark_set_obj(number=100000):
+    qt_app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    app = Application()
+    things = [Thing(app, name=str(i)) for i in range(100)]
+    editor = OQWidget()
+
+    def set_obj():
+        for thing in things:
+            editor.setObj(thing)
+
+    repeat = number // len(things)
+    seconds = min(timeit.repeat(set_obj, number=repeat, repeat=5))
+    print(
+        "setObj: {:.0f} calls/s ({:.2f} us/call)".format(
+            number / seconds, seconds / number * 1e6
+        )
+    )
+    editor.setObj(None)
+    editor.deleteLater()
+    qt_app.processEvents()
+
+
+if __name__ == "__main__":
+    benchmark_set_obj()
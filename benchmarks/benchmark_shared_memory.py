@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""Benchmark large drags to another process, inline versus in shared memory."""
+
+import timeit
+
+from objetto.applications import Application
+from objetto.objects import list_cls
+from Qt import QtCore, QtWidgets
+
+from objettoqt.models import OQListModel
+
+MIME_TYPE = "application/x-objettoqt-benchmark"
+
+
+def benchmark_shared_memory(sizes=(10000, 100000)):
+    qt_app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    app = Application()
+
+    for size in sizes:
+        source = list_cls(str)(app, ("item {}".format(i) for i in range(size)))
+        source_model = OQListModel(mime_type=MIME_TYPE)
+        source_model.setObj(source)
+        indexes = [source_model.index(row) for row in range(size)]
+        target = list_cls(str)(app)
+        target_model = OQListModel(mime_type=MIME_TYPE)
+        target_model.setObj(target)
+
+        for threshold in (None, 0):
+            source_model.setSharedMemoryThreshold(threshold)
+            mime_datas = []
+
+            def retrieve():
+                mime_data = source_model.mimeData(indexes)
+                mime_datas.append(mime_data)
+                return mime_data.data(MIME_TYPE)
+
+            def drop():
+                # Copy the data as it would arrive in another process.
+                mime_data = QtCore.QMimeData()
+                mime_data.setData(MIME_TYPE, retrieve())
+                target_model.dropMimeData(mime_data, QtCore.Qt.CopyAction, 0, 0)
+
+            retrieve_seconds = min(timeit.repeat(retrieve, number=1, repeat=3))
+            drop_seconds = min(timeit.repeat(drop, number=1, repeat=3))
+            print(
+                "{} rows, {}: {:.2f} ms/retrieval, {:.2f} ms/drop, {} bytes".format(
+                    size,
+                    "inline" if threshold is None else "shared memory",
+                    retrieve_seconds * 1e3,
+                    drop_seconds * 1e3,
+                    retrieve().size(),
+                )
+            )
+            del mime_datas[:]
+        source_model.deleteLater()
+        target_model.deleteLater()
+    qt_app.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+
+
+if __name__ == "__main__":
+    benchmark_shared_memory()
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""Benchmark sorting proxies of a 100k-row list while inserting and updating rows."""
+
+import random
+import timeit
+
+from objetto.applications import Application
+from objetto.objects import list_cls
+from Qt import QtCore, QtWidgets
+
+from objettoqt.models import OQListModel, OQSortFilterListModel
+
+
+def benchmark_sort_filter_list_model(rows=100000, changes=50):
+    qt_app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    app = Application()
+    random.seed(0)
+
+    def random_value():
+        return "{:08d}".format(random.randrange(rows * 10))
+
+    for proxy_cls in (QtCore.QSortFilterProxyModel, OQSortFilterListModel):
+        lst = list_cls(str)(app, (random_value() for _ in range(rows)))
+        model = OQListModel()
+        model.setObj(lst)
+        proxy = proxy_cls()
+        proxy.setSourceModel(model)
+        proxy.sort(0)
+
+        def change():
+            lst.insert(random.randrange(len(lst)), random_value())
+            lst[random.randrange(len(lst))] = random_value()
+
+        seconds = min(timeit.repeat(change, number=changes, repeat=3))
+        print(
+            "{}: {:.2f} ms/change".format(proxy_cls.__name__, seconds / changes * 1e3)
+        )
+        proxy.setSourceModel(None)
+        model.setObj(None)
+    qt_app.processEvents()
+
+
+if __name__ == "__main__":
+    benchmark_sort_filter_list_model()
@@ -1,37 +1,143 @@
 # -*- coding: utf-8 -*-
 """Base mix-in class for `Qt` types."""
 
+from collections import OrderedDict
+from contextlib import contextmanager
 from inspect import getmro
+from itertools import count
+from sys import exc_info
+from threading import Lock
 from weakref import WeakKeyDictionary, ref
 
-from objetto import POST, PRE
+from objetto import POST, PRE, Data, data_attribute
 from objetto.bases import BaseObject
+from objetto.changes import Update
 from objetto.observers import ActionObserver
 from objetto.utils.reraise_context import ReraiseContext
 from objetto.utils.type_checking import assert_is_instance
 from Qt import QtCore, QtWidgets
+from six import reraise
+
+from . import _profiling
+from ._render import render_pass
 
 __all__ = [
+    "ActionSubscription",
+    "SubscriberToken",
     "OQObjectMixin",
     "OQAbstractItemModelMixin",
     "OQWidgetMixin",
     "OQAbstractItemViewMixin",
+    "detach_all",
 ]
 
 
-class _InternalObserver(ActionObserver):
-    """The actual action observer."""
+class ActionSubscription(Data):
+    """
+    Declares interest in actions received by :class:`objettoqt.mixins.OQObjectMixin`.
+
+    Empty filters match anything.
+
+    .. code:: python
+
+        >>> from objetto.changes import Update
+        >>> from objettoqt.mixins import ActionSubscription
+
+        >>> subscription = ActionSubscription(
+        ...     change_types=(Update,), names=("name",), from_children=False
+        ... )
+
+    Inherits from:
+      - :class:`objetto.data.Data`
+    """
+
+    change_types = data_attribute(tuple, checked=False, factory=tuple, default=())
+    """
+    Change types (subclasses are also matched).
+
+    :type: tuple[type[objetto.bases.BaseChange]]
+    """
+
+    names = data_attribute(tuple, checked=False, factory=tuple, default=())
+    """
+    Attribute names (only applies to :class:`objetto.changes.Update` changes).
+
+    :type: tuple[str]
+    """
+
+    phases = data_attribute(tuple, checked=False, factory=tuple, default=())
+    """
+    Phases.
+
+    :type: tuple[objetto.bases.Phase]
+    """
+
+    from_self = data_attribute(bool, default=True)
+    """
+    Whether to match actions sent from the object being observed.
+
+    :type: bool
+    """
+
+    from_children = data_attribute(bool, default=True)
+    """
+    Whether to match actions sent from children of the object being observed.
+
+    :type: bool
+    """
 
-    def __init__(self, qobj):
+    def match(self, change_type, phase, from_self):
         """
-        :param qobj: Objetto Qt object mixin.
-        :type qobj: OQObjectMixin
+        Get whether this matches an action, regardless of attribute names.
+
+        :param change_type: Change type.
+        :type change_type: type[objetto.bases.BaseChange]
+
+        :param phase: Phase.
+        :type phase: objetto.bases.Phase
+
+        :param from_self: Whether sent from the object being observed.
+        :type from_self: bool
+
+        :return: True if matches.
+        :rtype: bool
         """
-        self.__qobj_ref = ref(qobj)
+        if from_self:
+            if not self.from_self:
+                return False
+        elif not self.from_children:
+            return False
+        if self.phases and phase not in self.phases:
+            return False
+        if self.change_types and not issubclass(change_type, self.change_types):
+            return False
+        return True
+
+
+class _SharedObserver(ActionObserver):
+    """
+    The actual action observer.
+
+    A single one observes an object on behalf of all the mixed `Qt` objects
+    subscribed to it, so objetto only has to notify one observer per object.
+    It stays registered while the object is alive, so subscribing and unsubscribing
+    don't have to register and de-register observers with objetto.
+    """
+
+    def __init__(self, obj):
+        """
+        :param obj: Object to observe.
+        :type obj: objetto.bases.BaseObject
+        """
+        self.__subscribers = OrderedDict()
+        self.__pending = None
+        self.__payload = None
+        self.__token = self.start_observing(obj)
 
     def __observe__(self, action, phase):
         """
-        Observe an action (and its execution phase) from an object.
+        Observe an action (and its execution phase) from an object and relay it to
+        the subscribers.
 
         :param action: Action.
         :type action: objetto.objects.Action
@@ -39,15 +145,358 @@ class _InternalObserver(ActionObserver):
         :param phase: Phase.
         :type phase: objetto.bases.Phase
         """
-        qobj = self.__qobj_ref()
+        if not self.__subscribers:
+            return
+        pending = self.__pending = OrderedDict(self.__subscribers)
+        self.__payload = action, phase
+        exception_info = None
+        try:
+            while pending:
+                _, qobj_ref = pending.popitem(last=False)
+                try:
+                    self.__relay(qobj_ref())
+                except Exception:
+                    if exception_info is None:
+                        exception_info = exc_info()
+        finally:
+            self.__pending = None
+            self.__payload = None
+
+        # Other subscribers still received the action, re-raise the first exception.
+        if exception_info is not None:
+            reraise(*exception_info)
+
+    def __relay(self, qobj):
         if qobj is not None and not qobj.isDestroyed():
-            qobj.__onActionReceived__(action, phase)
-            qobj._onActionReceived(action, phase)
-            qobj.actionReceived.emit(action, phase)
+            qobj.__receiveAction__(*self.__payload)
+
+    def __prune(self, key, qobj_ref):
+        if self.__subscribers.get(key) is qobj_ref:
+            self.__detach(key)
+
+    def __detach(self, key):
+        self.__subscribers.pop(key, None)
+        if self.__pending is not None:
+            self.__pending.pop(key, None)
+
+    def attach(self, qobj, obj):
+        """
+        Subscribe a mixed `Qt` object.
+
+        :param qobj: Mixed `Qt` object.
+        :type qobj: OQObjectMixin
+
+        :param obj: Object being observed.
+        :type obj: objetto.bases.BaseObject
+
+        :return: Subscriber token.
+        :rtype: SubscriberToken
+        """
+        key = id(qobj)
+        self_ref = ref(self)
+
+        def prune(qobj_ref):
+            shared_observer = self_ref()
+            if shared_observer is not None:
+                shared_observer.__prune(key, qobj_ref)
+
+        self.__subscribers[key] = ref(qobj, prune)
+        return SubscriberToken(self, qobj, obj)
+
+    def detach(self, qobj):
+        """
+        Unsubscribe a mixed `Qt` object.
+
+        :param qobj: Mixed `Qt` object.
+        :type qobj: OQObjectMixin
+        """
+        self.__detach(id(qobj))
+
+    def wait(self, qobj):
+        """
+        Wait for a subscriber to receive the current action before continuing.
+
+        :param qobj: Mixed `Qt` object.
+        :type qobj: OQObjectMixin
+        """
+        pending = self.__pending
+        if pending is None:
+            self.__token.wait()
+        else:
+            qobj_ref = pending.pop(id(qobj), None)
+            if qobj_ref is not None:
+                self.__relay(qobj_ref())
+
+
+class SubscriberToken(object):
+    """
+    Token for a mixed `Qt` object observing an object.
+
+    Actions are observed by a single :class:`objetto.observers.ActionObserver`
+    shared by every mixed `Qt` object observing the same object, which relays them
+    to each of them. Use :meth:`objettoqt.mixins.SubscriberToken.wait` to make sure
+    the mixed `Qt` object receives the current action before continuing.
+
+    .. note::
+        This class can't be instantiated directly. A token is retrieved with
+        :meth:`objettoqt.mixins.OQObjectMixin.objToken`.
+    """
+
+    __slots__ = ("__shared_observer_ref", "__qobj_ref", "__obj_ref")
+
+    def __init__(self, shared_observer, qobj, obj):
+        self.__shared_observer_ref = ref(shared_observer)
+        self.__qobj_ref = ref(qobj)
+        self.__obj_ref = ref(obj)
+
+    def wait(self):
+        """Wait for the mixed `Qt` object to receive the action before continuing."""
+        shared_observer = self.__shared_observer_ref()
+        qobj = self.__qobj_ref()
+        if shared_observer is not None and qobj is not None:
+            shared_observer.wait(qobj)
+
+    @property
+    def observer(self):
+        """
+        Shared action observer (or None if no longer alive).
+
+        :rtype: objetto.observers.ActionObserver or None
+        """
+        return self.__shared_observer_ref()
+
+    @property
+    def obj(self):
+        """
+        Object being observed (or None if no longer alive).
+
+        :rtype: objetto.bases.BaseObject or None
+        """
+        return self.__obj_ref()
+
+    @property
+    def qobj(self):
+        """
+        Mixed `Qt` object subscribed (or None if no longer alive).
+
+        :rtype: OQObjectMixin or None
+        """
+        return self.__qobj_ref()
+
+
+# Shared observers per object.
+_shared_observers = WeakKeyDictionary()
 
 
-# Cache for mixed class checking.
-_mixin_check_cache = WeakKeyDictionary()
+def _attach(qobj, obj):
+    """
+    Subscribe a mixed `Qt` object to the shared observer of an object.
+
+    :param qobj: Mixed `Qt` object.
+    :type qobj: OQObjectMixin
+
+    :param obj: Object to observe.
+    :type obj: objetto.bases.BaseObject
+
+    :return: Subscriber token.
+    :rtype: SubscriberToken
+    """
+    try:
+        shared_observer = _shared_observers[obj]
+    except KeyError:
+        shared_observer = _shared_observers[obj] = _SharedObserver(obj)
+    return shared_observer.attach(qobj, obj)
+
+
+def _detach(qobj, obj):
+    """
+    Unsubscribe a mixed `Qt` object from the shared observer of an object.
+
+    :param qobj: Mixed `Qt` object.
+    :type qobj: OQObjectMixin
+
+    :param obj: Object being observed.
+    :type obj: objetto.bases.BaseObject
+    """
+    shared_observer = _shared_observers.get(obj)
+    if shared_observer is not None:
+        shared_observer.detach(qobj)
+
+
+class _DestroyedRelay(QtCore.QObject):
+    """Relays the `destroyed` signal of mixed `Qt` objects."""
+
+    def __init__(self):
+        super(_DestroyedRelay, self).__init__()
+        self.__qobj_refs = {}
+        self.__keys = count()
+
+    def track(self, qobj):
+        """
+        Start relaying the `destroyed` signal of a mixed `Qt` object.
+
+        :param qobj: Mixed `Qt` object.
+        :type qobj: OQObjectMixin
+        """
+        key = next(self.__keys)
+        qobj_refs = self.__qobj_refs
+
+        def discard(_):
+            qobj_refs.pop(key, None)
+
+        qobj_refs[key] = ref(qobj, discard)
+        qobj.setProperty(_DESTROYED_RELAY_KEY, key)
+        qobj.destroyed.connect(self.onDestroyed, QtCore.Qt.DirectConnection)
+
+    @QtCore.Slot(QtCore.QObject)
+    def onDestroyed(self, qobj):
+        """
+        Relay the `destroyed` signal to the mixed `Qt` object still alive in Python.
+
+        :param qobj: Destroyed `Qt` object.
+        :type qobj: QtCore.QObject
+        """
+        qobj_ref = self.__qobj_refs.pop(qobj.property(_DESTROYED_RELAY_KEY), None)
+        if qobj_ref is not None:
+            qobj = qobj_ref()
+            if qobj is not None:
+                qobj.__receiveDestroyed__()
+
+
+# `PySide` can't resolve slots that are name-mangled or bound to the object being
+# destroyed, falling back to a connection registry that gets slower with every
+# instance. A single relay keeps construction and destruction linear.
+_DESTROYED_RELAY_KEY = "_objettoqt_destroyed_relay_key"
+_destroyed_relay = None
+_destroyed_relay_lock = Lock()
+
+
+def _track_destroyed(qobj):
+    """
+    Call `__receiveDestroyed__` on a mixed `Qt` object when it gets destroyed.
+
+    :param qobj: Mixed `Qt` object.
+    :type qobj: OQObjectMixin
+    """
+    global _destroyed_relay
+    if _destroyed_relay is None:
+        with _destroyed_relay_lock:
+            if _destroyed_relay is None:
+                _destroyed_relay = _DestroyedRelay()
+    _destroyed_relay.track(qobj)
+
+
+def _reduce_bases(bases):
+    """
+    Get unique bases, leaving out the ones already implied by more specific ones.
+
+    :param bases: Bases.
+    :type bases: collections.abc.Iterable[type]
+
+    :return: Reduced bases.
+    :rtype: tuple[type]
+    """
+    unique_bases = []
+    for base in bases:
+        if base not in unique_bases:
+            unique_bases.append(base)
+    return tuple(
+        base
+        for base in unique_bases
+        if not any(b is not base and issubclass(b, base) for b in unique_bases)
+    )
+
+
+def _is_overridden(cls, name):
+    """
+    Get whether a mix-in method is overridden by a class.
+
+    :param cls: Mixed class.
+    :type cls: type[OQObjectMixin]
+
+    :param name: Method name.
+    :type name: str
+
+    :return: True if overridden.
+    :rtype: bool
+    """
+    method = getattr(cls, name)
+    base_method = getattr(OQObjectMixin, name)
+    return getattr(method, "__func__", method) is not getattr(
+        base_method, "__func__", base_method
+    )
+
+
+class _MixinPlan(object):
+    """Metadata compiled once per mixed class."""
+
+    __slots__ = (
+        "qbase_error",
+        "obases",
+        "obj_changed_internal",
+        "obj_changed",
+        "action_received_internal",
+        "action_received",
+        "actions_received_internal",
+        "actions_received",
+    )
+
+    def __init__(self, cls):
+        """
+        :param cls: Mixed class.
+        :type cls: type[OQObjectMixin]
+        """
+        mixin_bases = [
+            base for base in reversed(getmro(cls)) if issubclass(base, OQObjectMixin)
+        ]
+
+        # Check for expected Qt base classes.
+        self.qbase_error = None
+        for qbase in _reduce_bases(base.QBase for base in mixin_bases):
+            if not issubclass(cls, qbase):
+                self.qbase_error = "class '{}' is not a subclass of '{}'".format(
+                    cls.__name__, qbase.__name__
+                )
+                break
+
+        # Expected objetto base classes.
+        self.obases = _reduce_bases(base.OBase for base in mixin_bases)
+
+        # Which hooks are actually implemented.
+        self.obj_changed_internal = _is_overridden(cls, "__onObjChanged__")
+        self.obj_changed = _is_overridden(cls, "_onObjChanged")
+        self.action_received_internal = _is_overridden(cls, "__onActionReceived__")
+        self.action_received = _is_overridden(cls, "_onActionReceived")
+        self.actions_received_internal = _is_overridden(cls, "__onActionsReceived__")
+        self.actions_received = _is_overridden(cls, "_onActionsReceived")
+
+
+# Hook names used when profiling objChanged broadcasts.
+_BROADCAST_HOOKS = {
+    PRE: "objChanged broadcast (PRE)",
+    POST: "objChanged broadcast (POST)",
+}
+
+
+# Compiled metadata for mixed classes.
+_mixin_plans = WeakKeyDictionary()
+
+
+def _get_plan(cls):
+    """
+    Get compiled metadata for a mixed class.
+
+    :param cls: Mixed class.
+    :type cls: type[OQObjectMixin]
+
+    :return: Compiled metadata.
+    :rtype: _MixinPlan
+    """
+    try:
+        return _mixin_plans[cls]
+    except KeyError:
+        plan = _mixin_plans[cls] = _MixinPlan(cls)
+        return plan
 
 
 # Trick IDEs for auto-completion.
@@ -73,10 +522,32 @@ class OQObjectMixin(_object):
     :raises TypeError: Not mixed in with a :class:`QtCore.QObject` class.
     """
 
-    __observer = None
     __obj = None
     __obj_token = None
     __is_destroyed = None
+    __plan = None
+    __subscriptions = None
+    __subscription_table = None
+    __observed_depth = None
+    __observed_paths = None
+    __observed_path_lengths = None
+    __pause_count = None
+    __paused_actions = None
+    __paused_updates = None
+    __paused_action_count = None
+    __pause_overflow = None
+    __replay_limit = None
+    __batch_actions = None
+    __queued_actions = None
+    __marshal_actions = None
+    __marshal_lock = None
+    __marshaled_actions = None
+    __marshal_overflow = None
+    __action_backlog_limit = None
+    __dropped_action_count = None
+
+    __actionsQueued = QtCore.Signal()
+    __actionsMarshaled = QtCore.Signal()
 
     objChanged = QtCore.Signal(object, object, object)
     """
@@ -92,6 +563,10 @@ class OQObjectMixin(_object):
 
     :param phase: Phase.
     :type phase: objetto.bases.Phase
+
+    .. note::
+        This is also emitted with the same object as `obj` and `old_obj` when
+        actions had to be dropped, meaning the state should be refreshed.
     """
 
     actionReceived = QtCore.Signal(object, object)
@@ -107,6 +582,17 @@ class OQObjectMixin(_object):
     :type phase: objetto.bases.Phase
     """
 
+    actionsReceived = QtCore.Signal(object)
+    """
+    **signal**
+
+    Emitted once per event loop iteration with the actions queued since the last
+    delivery (only when :meth:`objettoqt.mixins.OQObjectMixin.batchActions` is on).
+
+    :param actions: Actions and their phases, in the order they were received.
+    :type actions: tuple[tuple[objetto.objects.Action, objetto.bases.Phase]]
+    """
+
     QBase = QtCore.QObject
     """
     **read-only class attribute**
@@ -125,42 +611,316 @@ class OQObjectMixin(_object):
     :type: type[objetto.bases.BaseObject]
     """
 
+    Subscriptions = ()
+    """
+    **read-only class attribute**
+
+    Default action subscriptions (empty to receive every action).
+
+    :type: tuple[objettoqt.mixins.ActionSubscription]
+    """
+
     def __init__(self, *args, **kwargs):
 
         # Check for expected Qt base class.
-        cls = type(self)
-        if cls not in _mixin_check_cache:
-            visited_qbases = set()
-            for base in reversed(getmro(cls)):
-                if issubclass(base, OQObjectMixin):
-                    qbase = base.QBase
-                    if qbase in visited_qbases:
-                        continue
-                    visited_qbases.add(qbase)
-                    if not isinstance(self, qbase):
-                        error = "class '{}' is not a subclass of '{}'".format(
-                            cls.__name__, qbase.__name__
-                        )
-                        raise TypeError(error)
-            _mixin_check_cache[cls] = True
+        plan = _get_plan(type(self))
+        if plan.qbase_error is not None:
+            raise TypeError(plan.qbase_error)
 
         # Initialize Qt object by passing arguments through.
         super(OQObjectMixin, self).__init__(*args, **kwargs)
 
-        # Connect destroyed signal.
-        self.destroyed.connect(self.__onDestroyed)
+        # Relay destroyed signal.
+        _track_destroyed(self)
+
+        # Connect queued signal used to deliver batched actions.
+        # Slots are not name-mangled so that `PySide` can resolve them by name.
+        self.__actionsQueued.connect(
+            self.__actionsQueuedSlot__, QtCore.Qt.QueuedConnection
+        )
+
+        # Connect queued signal used to drain actions sent from other threads.
+        self.__actionsMarshaled.connect(
+            self.__actionsMarshaledSlot__, QtCore.Qt.QueuedConnection
+        )
 
         # Internal attributes.
-        self.__observer = _InternalObserver(self)
+        self.__plan = plan
         self.__obj = None
         self.__obj_token = None
         self.__is_destroyed = False
-
-    @QtCore.Slot()
-    def __onDestroyed(self):
+        self.__batch_actions = False
+        self.__queued_actions = []
+        self.__marshal_actions = False
+        self.__marshal_lock = Lock()
+        self.__marshaled_actions = []
+        self.__marshal_overflow = False
+        self.__action_backlog_limit = 10000
+        self.__dropped_action_count = 0
+        self.__subscriptions = ()
+        self.__subscription_table = None
+        self.__observed_depth = None
+        self.__observed_paths = None
+        self.__observed_path_lengths = None
+        self.__pause_count = 0
+        self.__paused_actions = []
+        self.__paused_updates = {}
+        self.__paused_action_count = 0
+        self.__pause_overflow = False
+        self.__replay_limit = 1000
+
+        # Default subscriptions.
+        self.setSubscriptions(type(self).Subscriptions)
+
+    def __receiveDestroyed__(self):
         self.__is_destroyed = True
+        if self.__obj is not None:
+            _detach(self, self.__obj)
         self._onDestroyed()
 
+    @QtCore.Slot()
+    def __actionsQueuedSlot__(self):
+        self.__flushActions()
+
+    @QtCore.Slot()
+    def __actionsMarshaledSlot__(self):
+        self.__drainActions()
+
+    def __receiveAction__(self, action, phase):
+
+        # Marshal actions sent from other threads to the thread this lives in.
+        if self.__marshal_actions:
+            if QtCore.QThread.currentThread() is not self.thread():
+                self.__marshalAction(action, phase)
+                return
+            if self.__marshaled_actions or self.__marshal_overflow:
+                self.__drainActions()
+
+        self.__dispatchAction(action, phase)
+
+    def __dispatchAction(self, action, phase):
+        if self.__pause_count:
+            self.__recordAction(action, phase)
+        else:
+            self.__deliverAction(action, phase)
+
+    def __deliverAction(self, action, phase):
+        plan = self.__plan
+        profiling = _profiling.enabled
+        if plan.action_received_internal:
+            if profiling:
+                _profiling.call(
+                    self,
+                    "__onActionReceived__",
+                    self.__onActionReceived__,
+                    action,
+                    phase,
+                )
+            else:
+                self.__onActionReceived__(action, phase)
+
+        # Skip actions sent from outside of the observed part of the hierarchy.
+        if self.__observed_path_lengths is not None:
+            if not self.__routeAction(action):
+                return
+
+        # Skip actions that don't match the subscriptions.
+        subscription_table = self.__subscription_table
+        if subscription_table is not None:
+            change = action.change
+            key = (type(change), phase, action.sender is self.__obj)
+            try:
+                names = subscription_table[key]
+            except KeyError:
+                names = subscription_table[key] = self.__matchSubscriptions(*key)
+            if names is False:
+                return
+            if names is not None and names.isdisjoint(change.new_values):
+                return
+
+        if self.__batch_actions:
+            if not self.__queued_actions:
+                self.__actionsQueued.emit()
+            self.__queued_actions.append((action, phase))
+        elif profiling:
+            if plan.action_received:
+                _profiling.call(
+                    self, "_onActionReceived", self._onActionReceived, action, phase
+                )
+            _profiling.call(
+                self, "actionReceived", self.actionReceived.emit, action, phase
+            )
+        else:
+            if plan.action_received:
+                self._onActionReceived(action, phase)
+            self.actionReceived.emit(action, phase)
+
+    def __routeAction(self, action):
+        locations = action.locations
+        depth = len(locations)
+        if self.__observed_depth is not None and depth > self.__observed_depth:
+            return False
+        paths = self.__observed_paths
+        if paths is None:
+            return True
+        path = tuple(locations)
+        for length in self.__observed_path_lengths:
+            if length > depth:
+                break
+            if path[:length] in paths:
+                return True
+        return False
+
+    def __updateRoutes(self):
+        if self.__observed_depth is None and self.__observed_paths is None:
+            self.__observed_path_lengths = None
+        elif self.__observed_paths is None:
+            self.__observed_path_lengths = ()
+        else:
+            self.__observed_path_lengths = tuple(
+                sorted(set(len(path) for path in self.__observed_paths))
+            )
+
+    def __marshalAction(self, action, phase):
+        with self.__marshal_lock:
+            marshaled_actions = self.__marshaled_actions
+            pending = bool(marshaled_actions) or self.__marshal_overflow
+            limit = self.__action_backlog_limit
+            if self.__marshal_overflow:
+                self.__dropped_action_count += 1
+            elif limit is not None and len(marshaled_actions) >= limit:
+                self.__dropped_action_count += len(marshaled_actions) + 1
+                self.__marshal_overflow = True
+                del marshaled_actions[:]
+            else:
+                marshaled_actions.append((action, phase))
+        if not pending:
+            self.__actionsMarshaled.emit()
+
+    def __drainActions(self):
+        with self.__marshal_lock:
+            actions = self.__marshaled_actions
+            overflow = self.__marshal_overflow
+            self.__marshaled_actions = []
+            self.__marshal_overflow = False
+        if self.__is_destroyed:
+            return
+
+        # Backlog overflowed and actions were dropped, refresh instead.
+        if overflow:
+            if self.__pause_count:
+                self.__overflowPausedActions()
+            else:
+                self.__refresh()
+            return
+
+        for action, phase in actions:
+            self.__dispatchAction(action, phase)
+
+    def __recordAction(self, action, phase):
+        if self.__pause_overflow:
+            self.__dropped_action_count += 1
+            return
+
+        # Updates to the same attributes of the same object supersede earlier ones.
+        paused_actions = self.__paused_actions
+        change = action.change
+        if type(change) is Update:
+            key = (id(action.sender), frozenset(change.new_values))
+            indexes = self.__paused_updates.get(key)
+            if phase is PRE:
+                if indexes is not None:
+                    for index in indexes:
+                        if paused_actions[index] is not None:
+                            paused_actions[index] = None
+                            self.__paused_action_count -= 1
+                            self.__dropped_action_count += 1
+                self.__paused_updates[key] = [len(paused_actions)]
+            elif indexes is not None:
+                indexes.append(len(paused_actions))
+
+        paused_actions.append((action, phase))
+        self.__paused_action_count += 1
+
+        # Too many actions to replay, will refresh instead.
+        limit = self.__replay_limit
+        if limit is not None and self.__paused_action_count > limit:
+            self.__overflowPausedActions()
+
+    def __overflowPausedActions(self):
+        self.__dropped_action_count += self.__paused_action_count
+        self.__pause_overflow = True
+        self.__clearPausedActions()
+
+    def __clearPausedActions(self):
+        del self.__paused_actions[:]
+        self.__paused_updates.clear()
+        self.__paused_action_count = 0
+
+    def __refresh(self):
+        obj = self.__obj
+        self.__broadcastObjChanged(obj, obj, PRE)
+        self.__broadcastObjChanged(obj, obj, POST)
+
+    def __matchSubscriptions(self, change_type, phase, from_self):
+        names = set()
+        matched = False
+        for subscription in self.__subscriptions:
+            if subscription.match(change_type, phase, from_self):
+                matched = True
+                if not subscription.names or not issubclass(change_type, Update):
+                    return None
+                names.update(subscription.names)
+        if not matched:
+            return False
+        return frozenset(names)
+
+    def __broadcastObjChanged(self, obj, old_obj, phase):
+        if _profiling.enabled:
+            _profiling.call(
+                self,
+                _BROADCAST_HOOKS[phase],
+                self.__emitObjChanged,
+                obj,
+                old_obj,
+                phase,
+            )
+        else:
+            self.__emitObjChanged(obj, old_obj, phase)
+
+    def __emitObjChanged(self, obj, old_obj, phase):
+        plan = self.__plan
+        if plan.obj_changed_internal:
+            self.__onObjChanged__(obj, old_obj, phase)
+        if plan.obj_changed:
+            self._onObjChanged(obj, old_obj, phase)
+        self.objChanged.emit(obj, old_obj, phase)
+
+    def __flushActions(self):
+        if not self.__queued_actions:
+            return
+        actions = tuple(self.__queued_actions)
+        del self.__queued_actions[:]
+        if self.__is_destroyed:
+            return
+        plan = self.__plan
+        if _profiling.enabled:
+            if plan.actions_received_internal:
+                _profiling.call(
+                    self, "__onActionsReceived__", self.__onActionsReceived__, actions
+                )
+            if plan.actions_received:
+                _profiling.call(
+                    self, "_onActionsReceived", self._onActionsReceived, actions
+                )
+            _profiling.call(self, "actionsReceived", self.actionsReceived.emit, actions)
+        else:
+            if plan.actions_received_internal:
+                self.__onActionsReceived__(actions)
+            if plan.actions_received:
+                self._onActionsReceived(actions)
+            self.actionsReceived.emit(actions)
+
     def _onDestroyed(self):
         """
         **virtual method**
@@ -209,6 +969,370 @@ class OQObjectMixin(_object):
         :type phase: objetto.bases.Phase
         """
 
+    def __onActionsReceived__(self, actions):
+        pass
+
+    def _onActionsReceived(self, actions):
+        """
+        **virtual method**
+
+        Called once per event loop iteration with the actions queued since the last
+        delivery (only when :meth:`objettoqt.mixins.OQObjectMixin.batchActions` is on).
+
+        This method is called *before* the
+        :attr:`objettoqt.mixins.OQObjectMixin.actionsReceived` signal gets emitted.
+
+        :param actions: Actions and their phases, in the order they were received.
+        :type actions: tuple[tuple[objetto.objects.Action, objetto.bases.Phase]]
+        """
+
+    def batchActions(self):
+        """
+        **final method**
+
+        Get whether actions are delivered in batches.
+
+        :return: True if batched.
+        :rtype: bool
+        """
+        return self.__batch_actions
+
+    def setBatchActions(self, batch_actions):
+        """
+        **final method**
+
+        Set whether actions are delivered in batches.
+
+        When on, actions are queued and delivered once per event loop iteration
+        through :meth:`objettoqt.mixins.OQObjectMixin._onActionsReceived` and
+        :attr:`objettoqt.mixins.OQObjectMixin.actionsReceived` instead of
+        :meth:`objettoqt.mixins.OQObjectMixin._onActionReceived` and
+        :attr:`objettoqt.mixins.OQObjectMixin.actionReceived`.
+        Turning it off delivers any pending actions immediately.
+
+        :param batch_actions: True to batch.
+        :type batch_actions: bool
+        """
+        self.__batch_actions = bool(batch_actions)
+        if not self.__batch_actions:
+            self.__flushActions()
+
+    def marshalActions(self):
+        """
+        **final method**
+
+        Get whether actions sent from other threads are marshaled to the thread this
+        object lives in.
+
+        :return: True if marshaled.
+        :rtype: bool
+        """
+        return self.__marshal_actions
+
+    def setMarshalActions(self, marshal_actions):
+        """
+        **final method**
+
+        Set whether actions sent from other threads are marshaled to the thread this
+        object lives in.
+
+        When on, actions sent from other threads are queued and then delivered
+        through a queued connection, so all the hooks and signals are called in the
+        thread this object lives in. Until then, models keep serving the rows last
+        notified to `Qt`, even if the object has already changed.
+        Turning it off delivers any pending actions immediately.
+
+        :param marshal_actions: True to marshal.
+        :type marshal_actions: bool
+        """
+        self.__marshal_actions = bool(marshal_actions)
+        if not self.__marshal_actions:
+            self.__drainActions()
+
+    def actionBacklogLimit(self):
+        """
+        **final method**
+
+        Get the maximum number of actions that can be waiting to be marshaled.
+
+        :return: Maximum number of actions (or None for no limit).
+        :rtype: int or None
+        """
+        return self.__action_backlog_limit
+
+    def setActionBacklogLimit(self, limit):
+        """
+        **final method**
+
+        Set the maximum number of actions that can be waiting to be marshaled.
+
+        When the limit is exceeded, the waiting actions are dropped and, instead of
+        delivering them, :attr:`objettoqt.mixins.OQObjectMixin.objChanged` is emitted
+        with the same object as `obj` and `old_obj` so the state can be refreshed.
+
+        :param limit: Maximum number of actions (or None for no limit).
+        :type limit: int or None
+
+        :raises ValueError: Limit is less than 1.
+        """
+        if limit is not None:
+            limit = int(limit)
+            if limit < 1:
+                error = "action backlog limit needs to be at least 1, got {}".format(
+                    limit
+                )
+                raise ValueError(error)
+        with self.__marshal_lock:
+            self.__action_backlog_limit = limit
+
+    def pauseObservation(self):
+        """
+        **final method**
+
+        Pause observation.
+
+        While paused, received actions are recorded instead of delivered. Updates to
+        the same attributes of the same object supersede earlier ones.
+        Calls can be nested, observation resumes when every pause is matched by a call
+        to :meth:`objettoqt.mixins.OQObjectMixin.resumeObservation`.
+        """
+        self.__pause_count += 1
+
+    def resumeObservation(self):
+        """
+        **final method**
+
+        Resume observation.
+
+        The recorded actions are delivered in order or, if more than
+        :meth:`objettoqt.mixins.OQObjectMixin.replayLimit` actions were recorded,
+        :attr:`objettoqt.mixins.OQObjectMixin.objChanged` is emitted with the same
+        object as `obj` and `old_obj` so the state can be refreshed instead.
+
+        :raises RuntimeError: Observation is not paused.
+        """
+        if not self.__pause_count:
+            error = "observation is not paused"
+            raise RuntimeError(error)
+        self.__pause_count -= 1
+        if self.__pause_count:
+            return
+
+        paused_actions = tuple(a for a in self.__paused_actions if a is not None)
+        overflow = self.__pause_overflow
+        self.__clearPausedActions()
+        self.__pause_overflow = False
+        if self.__is_destroyed:
+            return
+
+        if overflow:
+            self.__refresh()
+        else:
+            for action, phase in paused_actions:
+                self.__deliverAction(action, phase)
+
+    @contextmanager
+    def pauseObservationContext(self):
+        """
+        **final method**
+
+        Context manager that pauses observation while active.
+
+        .. code:: python
+
+            >>> from Qt import QtCore
+            >>> from objettoqt.mixins import OQObjectMixin
+
+            >>> class MixedQObject(OQObjectMixin, QtCore.QObject):
+            ...     pass
+            ...
+            >>> mixed = MixedQObject()
+            >>> with mixed.pauseObservationContext():
+            ...     mixed.isObservationPaused()
+            ...
+            True
+
+        :return: Context manager.
+        :rtype: contextlib.AbstractContextManager
+        """
+        self.pauseObservation()
+        try:
+            yield
+        finally:
+            self.resumeObservation()
+
+    def isObservationPaused(self):
+        """
+        **final method**
+
+        Get whether observation is paused.
+
+        :return: True if paused.
+        :rtype: bool
+        """
+        return bool(self.__pause_count)
+
+    def replayLimit(self):
+        """
+        **final method**
+
+        Get the maximum number of recorded actions to replay when resuming.
+
+        :return: Maximum number of actions (or None for no limit).
+        :rtype: int or None
+        """
+        return self.__replay_limit
+
+    def setReplayLimit(self, limit):
+        """
+        **final method**
+
+        Set the maximum number of recorded actions to replay when resuming.
+
+        If exceeded while paused, the recorded actions are dropped and
+        :attr:`objettoqt.mixins.OQObjectMixin.objChanged` is emitted with the same
+        object as `obj` and `old_obj` when resuming so the state can be refreshed.
+
+        :param limit: Maximum number of actions (or None for no limit).
+        :type limit: int or None
+
+        :raises ValueError: Limit is negative.
+        """
+        if limit is not None:
+            limit = int(limit)
+            if limit < 0:
+                error = "replay limit can't be negative, got {}".format(limit)
+                raise ValueError(error)
+        self.__replay_limit = limit
+        if (
+            limit is not None
+            and self.__pause_count
+            and self.__paused_action_count > limit
+        ):
+            self.__overflowPausedActions()
+
+    def droppedActionCount(self):
+        """
+        **final method**
+
+        Get how many actions were dropped or merged, either because the marshaling
+        backlog or the replay limit were exceeded (in which case they were replaced by
+        a refresh) or because they were superseded while observation was paused.
+
+        :return: Dropped action count.
+        :rtype: int
+        """
+        return self.__dropped_action_count
+
+    def subscriptions(self):
+        """
+        **final method**
+
+        Get action subscriptions.
+
+        :return: Action subscriptions (empty if receiving every action).
+        :rtype: tuple[objettoqt.mixins.ActionSubscription]
+        """
+        return self.__subscriptions
+
+    def setSubscriptions(self, subscriptions=None):
+        """
+        **final method**
+
+        Set action subscriptions.
+
+        Actions that don't match any of the subscriptions are not delivered to
+        :meth:`objettoqt.mixins.OQObjectMixin._onActionReceived`,
+        :attr:`objettoqt.mixins.OQObjectMixin.actionReceived` or the batched
+        deliveries. Matches are computed once per change type, phase and sender and
+        then looked up in a table.
+
+        :param subscriptions: Action subscriptions (None or empty to receive every \
+action).
+        :type subscriptions: collections.abc.Iterable[\
+objettoqt.mixins.ActionSubscription] or None
+
+        :raises TypeError: Invalid subscription type.
+        """
+        subscriptions = tuple(subscriptions or ())
+        for subscription in subscriptions:
+            with ReraiseContext(TypeError, "'subscriptions' parameter contents"):
+                assert_is_instance(subscription, ActionSubscription)
+        self.__subscriptions = subscriptions
+        self.__subscription_table = {} if subscriptions else None
+
+    def observedDepth(self):
+        """
+        **final method**
+
+        Get how deep into the hierarchy of the observed object actions are received.
+
+        :return: Maximum depth (None if unlimited).
+        :rtype: int or None
+        """
+        return self.__observed_depth
+
+    def setObservedDepth(self, depth=None):
+        """
+        **final method**
+
+        Set how deep into the hierarchy of the observed object actions are received.
+
+        Actions sent by the observed object itself have a depth of 0, actions sent by
+        its children have a depth of 1 and so on.
+        The relative path from the observed object to the sender is available as the
+        action's `locations`.
+
+        :param depth: Maximum depth (None for unlimited).
+        :type depth: int or None
+
+        :raises ValueError: Depth is negative.
+        """
+        if depth is not None:
+            depth = int(depth)
+            if depth < 0:
+                error = "depth must be 0 or higher, got {}".format(depth)
+                raise ValueError(error)
+        self.__observed_depth = depth
+        self.__updateRoutes()
+
+    def observedPaths(self):
+        """
+        **final method**
+
+        Get the paths in the hierarchy of the observed object to receive actions from.
+
+        :return: Observed paths (None if receiving from everywhere).
+        :rtype: frozenset[tuple] or None
+        """
+        return self.__observed_paths
+
+    def setObservedPaths(self, paths=None):
+        """
+        **final method**
+
+        Set the paths in the hierarchy of the observed object to receive actions from.
+
+        A path is a sequence of locations (attribute names, dictionary keys or list
+        indexes) relative to the observed object. An action is received if the path
+        to its sender starts with any of the observed paths. An empty path includes
+        the observed object itself and everything under it.
+        Routing is based on the action's `locations`, so the cost of checking an
+        action depends on the number of distinct path lengths only.
+
+        Like subscriptions, this only affects
+        :meth:`objettoqt.mixins.OQObjectMixin._onActionReceived`,
+        :attr:`objettoqt.mixins.OQObjectMixin.actionReceived` and the batched
+        deliveries.
+
+        :param paths: Observed paths (None to receive from everywhere).
+        :type paths: collections.abc.Iterable[collections.abc.Sequence] or None
+        """
+        if paths is not None:
+            paths = frozenset(tuple(path) for path in paths)
+        self.__observed_paths = paths
+        self.__updateRoutes()
+
     def isDestroyed(self):
         """
         **final method**
@@ -248,46 +1372,112 @@ class OQObjectMixin(_object):
 
         # Check 'obj' type against `OBase` from every mix-in base.
         if obj is not None:
-            with ReraiseContext(TypeError, "'obj' parameter"):
-                visited_obases = set()
-                for base in reversed(getmro(type(self))):
-                    if issubclass(base, OQObjectMixin):
-                        obase = base.OBase
-                        if obase in visited_obases:
-                            continue
-                        visited_obases.add(obase)
+            for obase in self.__plan.obases:
+                if not isinstance(obj, obase):
+                    with ReraiseContext(TypeError, "'obj' parameter"):
                         assert_is_instance(obj, (obase, None))
 
+        # Deliver actions still pending for the old object.
+        if self.__marshaled_actions or self.__marshal_overflow:
+            self.__drainActions()
+        self.__flushActions()
+
+        # Recorded actions for the old object are superseded by the change.
+        if self.__pause_count:
+            self.__dropped_action_count += self.__paused_action_count
+            self.__clearPausedActions()
+            self.__pause_overflow = False
+
         # Broadcast (PRE).
-        self.__onObjChanged__(obj, old_obj, PRE)
-        self._onObjChanged(obj, old_obj, PRE)
-        self.objChanged.emit(obj, old_obj, PRE)
+        self.__broadcastObjChanged(obj, old_obj, PRE)
 
-        # Update internal action observer.
+        # Update subscription to the shared action observer.
         if old_obj is not None:
-            self.__observer.stop_observing(old_obj)
+            _detach(self, old_obj)
             self.__obj_token = None
         if obj is not None:
-            self.__obj_token = self.__observer.start_observing(obj)
+            self.__obj_token = _attach(self, obj)
         self.__obj = obj
 
         # Broadcast (POST).
-        self.__onObjChanged__(obj, old_obj, POST)
-        self._onObjChanged(obj, old_obj, POST)
-        self.objChanged.emit(obj, old_obj, POST)
+        self.__broadcastObjChanged(obj, old_obj, POST)
+
+    def releaseObj(self):
+        """
+        **final method**
+
+        Stop observing the current object without broadcasting the change.
+
+        Meant for objects that are about to be destroyed: pending actions are
+        discarded and the PRE/POST :attr:`objettoqt.mixins.OQObjectMixin.objChanged`
+        broadcasts are skipped.
+
+        :return: True if an object was released.
+        :rtype: bool
+        """
+        obj = self.__obj
+        if obj is None:
+            return False
+
+        # Discard pending actions.
+        with self.__marshal_lock:
+            self.__marshaled_actions = []
+            self.__marshal_overflow = False
+        del self.__queued_actions[:]
+        self.__clearPausedActions()
+        self.__pause_overflow = False
+
+        # Unsubscribe from the shared action observer.
+        _detach(self, obj)
+        self.__obj_token = None
+        self.__obj = None
+        return True
 
     def objToken(self):
         """
         **final method**
 
-        Get the action observer token.
+        Get the subscriber token.
 
-        :return: Action observer token.
-        :rtype: objetto.observers.ActionObserverToken
+        Actions are observed by an observer shared by every mixed `Qt` object
+        observing the same object. The token's `wait` method makes sure this object
+        receives the current action before continuing.
+
+        .. note::
+            This used to be an :class:`objetto.observers.ActionObserverToken`. The
+            token still has its `wait` method and `observer` property (now the shared
+            observer), and also exposes the observed `obj`.
+
+        :return: Subscriber token (or None).
+        :rtype: objettoqt.mixins.SubscriberToken or None
         """
         return self.__obj_token
 
 
+def detach_all(root):
+    """
+    Silently stop observing objects in a `Qt` object and all of its descendants.
+
+    Meant for tearing down large amounts of mixed `Qt` objects that are about to be
+    destroyed (closing a window, for example). Every mixed object is released in a
+    single pass with :meth:`objettoqt.mixins.OQObjectMixin.releaseObj`, so no
+    :attr:`objettoqt.mixins.OQObjectMixin.objChanged` broadcasts happen.
+
+    :param root: Root `Qt` object.
+    :type root: QtCore.QObject
+
+    :return: Number of released observers.
+    :rtype: int
+    """
+    count = 0
+    if isinstance(root, OQObjectMixin) and root.releaseObj():
+        count += 1
+    for qobj in root.findChildren(QtCore.QObject):
+        if isinstance(qobj, OQObjectMixin) and qobj.releaseObj():
+            count += 1
+    return count
+
+
 # Trick IDEs for auto-completion.
 _object = QtCore.QAbstractItemModel
 globals()["_object"] = object
@@ -328,6 +1518,21 @@ class OQAbstractItemModelMixin(OQObjectMixin, _object):
     def __init__(self, *args, **kwargs):
         super(OQAbstractItemModelMixin, self).__init__(*args, **kwargs)
 
+    def renderPass(self):
+        """
+        **virtual method**
+
+        Get a context manager for a render pass (painting, size hints, etc).
+
+        A single read context is entered for the duration of the pass, so data
+        queries made in it don't have to enter their own.
+
+        :return: Render pass context manager.
+        :rtype: contextlib.AbstractContextManager
+        """
+        obj = self.obj()
+        return render_pass(obj.app if obj is not None else None)
+
 
 # Trick IDEs for auto-completion.
 _object = QtWidgets.QWidget
@@ -367,6 +1572,73 @@ class OQWidgetMixin(OQObjectMixin, _object):
     def __init__(self, *args, **kwargs):
         super(OQWidgetMixin, self).__init__(*args, **kwargs)
 
+        # Options.
+        self.__defer_while_hidden = False
+        self.__paused_while_hidden = False
+
+    def __pauseWhileHidden(self):
+        if not self.__paused_while_hidden:
+            self.__paused_while_hidden = True
+            self.pauseObservation()
+
+    def __resumeWhenShown(self):
+        if self.__paused_while_hidden:
+            self.__paused_while_hidden = False
+            self.resumeObservation()
+
+    def deferWhileHidden(self):
+        """
+        **final method**
+
+        Get whether actions are deferred while this widget is hidden.
+
+        :return: True if deferred.
+        :rtype: bool
+        """
+        return self.__defer_while_hidden
+
+    def setDeferWhileHidden(self, defer):
+        """
+        **final method**
+
+        Set whether actions are deferred while this widget is hidden.
+
+        When on, observation is paused while hidden and resumed when shown again, so
+        the actions recorded in the meantime are replayed (or, if more than
+        :meth:`objettoqt.mixins.OQObjectMixin.replayLimit` actions were recorded,
+        :attr:`objettoqt.mixins.OQObjectMixin.objChanged` is emitted with the same
+        object as `obj` and `old_obj` so the state can be refreshed instead).
+
+        :param defer: True to defer.
+        :type defer: bool
+        """
+        self.__defer_while_hidden = bool(defer)
+        if self.__defer_while_hidden and not self.isVisible():
+            self.__pauseWhileHidden()
+        elif not self.__defer_while_hidden:
+            self.__resumeWhenShown()
+
+    def showEvent(self, event):
+        """
+        Resume deferred actions when shown.
+
+        :param event: Show event.
+        :type event: QtGui.QShowEvent
+        """
+        super(OQWidgetMixin, self).showEvent(event)
+        self.__resumeWhenShown()
+
+    def hideEvent(self, event):
+        """
+        Start deferring actions when hidden (if enabled).
+
+        :param event: Hide event.
+        :type event: QtGui.QHideEvent
+        """
+        super(OQWidgetMixin, self).hideEvent(event)
+        if self.__defer_while_hidden:
+            self.__pauseWhileHidden()
+
 
 # Trick IDEs for auto-completion.
 _object = QtWidgets.QAbstractItemView
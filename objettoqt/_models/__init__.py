@@ -1,10 +1,32 @@
 # -*- coding: utf-8 -*-
 """Models."""
 
-from .list import AbstractListModelHeader, ListModelHeader, OQListModel
+from .codecs import (
+    AbstractMimeCodec,
+    BinaryJsonMimeCodec,
+    YamlMimeCodec,
+    find_mime_codec,
+    get_mime_codec,
+    register_mime_codec,
+)
+from .list import (
+    AbstractListModelHeader,
+    AsyncListModelHeader,
+    ListModelHeader,
+    OQListModel,
+)
+from .sort_filter_list import OQSortFilterListModel
 
 __all__ = [
     "OQListModel",
+    "OQSortFilterListModel",
     "AbstractListModelHeader",
     "ListModelHeader",
+    "AsyncListModelHeader",
+    "AbstractMimeCodec",
+    "BinaryJsonMimeCodec",
+    "YamlMimeCodec",
+    "register_mime_codec",
+    "get_mime_codec",
+    "find_mime_codec",
 ]
@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+"""Mime data codecs for list models."""
+
+from abc import ABCMeta, abstractmethod
+from json import dumps, loads
+from struct import Struct
+from threading import Lock
+
+from six import ensure_binary, with_metaclass
+from yaml import YAMLError, safe_dump, safe_load
+
+__all__ = [
+    "AbstractMimeCodec",
+    "BinaryJsonMimeCodec",
+    "YamlMimeCodec",
+    "register_mime_codec",
+    "get_mime_codec",
+    "find_mime_codec",
+]
+
+
+class AbstractMimeCodec(with_metaclass(ABCMeta, object)):
+    """
+    **(abstract class)**
+
+    Encodes/decodes the contents of mime data for dragged list items.
+    Contents are dictionaries made of basic types (serialized values).
+
+    Register instances with :func:`objettoqt.models.register_mime_codec`.
+    """
+
+    name = None
+    """
+    **read-only class attribute**
+
+    Unique name.
+
+    :type: str
+    """
+
+    @abstractmethod
+    def matches(self, data):
+        """
+        **abstract method**
+
+        Get whether data was encoded by this codec.
+
+        :param data: Encoded data.
+        :type data: bytes or memoryview
+
+        :return: True if matches.
+        :rtype: bool
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def encode(self, contents):
+        """
+        **abstract method**
+
+        Encode contents.
+
+        :param contents: Contents.
+        :type contents: dict
+
+        :return: Encoded data.
+        :rtype: bytes
+
+        :raises ValueError: Could not encode contents.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def decode(self, data):
+        """
+        **abstract method**
+
+        Decode contents.
+
+        :param data: Encoded data.
+        :type data: bytes or memoryview
+
+        :return: Contents.
+        :rtype: dict
+
+        :raises ValueError: Could not decode data.
+        """
+        raise NotImplementedError()
+
+
+class BinaryJsonMimeCodec(AbstractMimeCodec):
+    """
+    Compact, versioned binary codec (default).
+
+    Data starts with a magic string, a version byte and the length of the compact
+    `JSON` payload that follows.
+
+    Inherits from:
+      - :class:`objettoqt.models.AbstractMimeCodec`
+    """
+
+    name = "binary_json"
+    """
+    **read-only class attribute**
+
+    Unique name.
+
+    :type: str
+    """
+
+    MAGIC = b"OQMD"
+    """
+    **read-only class attribute**
+
+    Magic string.
+
+    :type: bytes
+    """
+
+    VERSION = 1
+    """
+    **read-only class attribute**
+
+    Format version.
+
+    :type: int
+    """
+
+    __header = Struct(">4sBI")
+
+    def matches(self, data):
+        """
+        Get whether data was encoded by this codec.
+
+        :param data: Encoded data.
+        :type data: bytes or memoryview
+
+        :return: True if matches.
+        :rtype: bool
+        """
+        return data[: len(self.MAGIC)] == self.MAGIC
+
+    def encode(self, contents):
+        """
+        Encode contents.
+
+        :param contents: Contents.
+        :type contents: dict
+
+        :return: Encoded data.
+        :rtype: bytes
+
+        :raises ValueError: Could not encode contents.
+        """
+        try:
+            payload = ensure_binary(
+                dumps(contents, separators=(",", ":"), ensure_ascii=False), "utf8"
+            )
+        except TypeError as e:
+            raise ValueError(str(e))
+        header = type(self).__header.pack(self.MAGIC, self.VERSION, len(payload))
+        return header + payload
+
+    def decode(self, data):
+        """
+        Decode contents.
+
+        :param data: Encoded data.
+        :type data: bytes or memoryview
+
+        :return: Contents.
+        :rtype: dict
+
+        :raises ValueError: Could not decode data.
+        """
+        header = type(self).__header
+        if len(data) < header.size:
+            raise ValueError("data is too short")
+        magic, version, length = header.unpack(data[: header.size])
+        if magic != self.MAGIC:
+            raise ValueError("invalid magic string {!r}".format(magic))
+        if version != self.VERSION:
+            raise ValueError("unsupported version {}".format(version))
+        payload = data[header.size :]
+        if len(payload) != length:
+            error = "expected {} bytes of payload, got {}".format(length, len(payload))
+            raise ValueError(error)
+        return loads(bytes(payload).decode("utf8"))
+
+
+class YamlMimeCodec(AbstractMimeCodec):
+    """
+    `YAML` codec, for compatibility with data encoded by previous versions.
+    Matches any data, so it's only used when other codecs don't match.
+
+    Inherits from:
+      - :class:`objettoqt.models.AbstractMimeCodec`
+    """
+
+    name = "yaml"
+    """
+    **read-only class attribute**
+
+    Unique name.
+
+    :type: str
+    """
+
+    def matches(self, data):
+        """
+        Get whether data was encoded by this codec (always True).
+
+        :param data: Encoded data.
+        :type data: bytes or memoryview
+
+        :return: True.
+        :rtype: bool
+        """
+        return True
+
+    def encode(self, contents):
+        """
+        Encode contents.
+
+        :param contents: Contents.
+        :type contents: dict
+
+        :return: Encoded data.
+        :rtype: bytes
+
+        :raises ValueError: Could not encode contents.
+        """
+        try:
+            return ensure_binary(safe_dump(contents), "utf8")
+        except YAMLError as e:
+            raise ValueError(str(e))
+
+    def decode(self, data):
+        """
+        Decode contents.
+
+        :param data: Encoded data.
+        :type data: bytes or memoryview
+
+        :return: Contents.
+        :rtype: dict
+
+        :raises ValueError: Could not decode data.
+        """
+        try:
+            return safe_load(bytes(data).decode("utf8"))
+        except (YAMLError, UnicodeDecodeError) as e:
+            raise ValueError(str(e))
+
+
+_lock = Lock()
+_codecs = [BinaryJsonMimeCodec(), YamlMimeCodec()]
+
+
+def register_mime_codec(codec):
+    """
+    Register a mime codec.
+
+    Codecs registered later are checked first when decoding, and replace registered
+    codecs with the same name.
+
+    :param codec: Codec.
+    :type codec: objettoqt.models.AbstractMimeCodec
+
+    :raises TypeError: Not a codec.
+    :raises ValueError: Codec has no name.
+    """
+    if not isinstance(codec, AbstractMimeCodec):
+        error = "expected an 'AbstractMimeCodec', got {}".format(type(codec).__name__)
+        raise TypeError(error)
+    if not codec.name:
+        error = "codec {} has no name".format(type(codec).__name__)
+        raise ValueError(error)
+    with _lock:
+        _codecs[:] = [codec] + [c for c in _codecs if c.name != codec.name]
+
+
+def get_mime_codec(name):
+    """
+    Get a registered mime codec by name.
+
+    :param name: Name.
+    :type name: str
+
+    :return: Codec.
+    :rtype: objettoqt.models.AbstractMimeCodec
+
+    :raises KeyError: No codec registered with that name.
+    """
+    for codec in _codecs:
+        if codec.name == name:
+            return codec
+    raise KeyError(name)
+
+
+def find_mime_codec(data):
+    """
+    Find the registered mime codec that encoded data.
+
+    :param data: Encoded data.
+    :type data: bytes
+
+    :return: Codec (or None if no codec matches).
+    :rtype: objettoqt.models.AbstractMimeCodec or None
+    """
+    for codec in _codecs:
+        if codec.matches(data):
+            return codec
+    return None
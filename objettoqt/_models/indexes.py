@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""Row indexes for list models."""
+
+from bisect import bisect_left, insort
+from numbers import Number
+
+from six import string_types
+from six.moves import xrange as x_range
+
+__all__ = ["ROW_INDEX_KINDS", "HashRowIndex", "SortedRowIndex"]
+
+
+_LABEL_SPACING = 1 << 32
+
+# Up to this many entries are inserted/removed one by one, more than that at once.
+_BULK_THRESHOLD = 16
+
+
+class _RowIndex(object):
+    """
+    Maps the values of the rows in a list model to the rows that have them.
+
+    Entries refer to rows through increasing labels, so rows can be inserted,
+    deleted and moved without renumbering the entries of other rows (rows are found
+    with a binary search on the labels).
+    """
+
+    def __init__(self, column, role, attribute, case_sensitive):
+        self.column = column
+        self.role = role
+        self.attribute = attribute
+        self.case_sensitive = case_sensitive
+        self.dirty = True
+        self._values = []
+        self._labels = []
+
+    def normalize(self, value):
+        """Normalize value (lower case strings if not case sensitive)."""
+        if not self.case_sensitive and isinstance(value, string_types):
+            return value.lower()
+        return value
+
+    def _row(self, label):
+        """Get the row for a label."""
+        return bisect_left(self._labels, label)
+
+    def _clear(self):
+        """Remove all entries."""
+        raise NotImplementedError()
+
+    def _add(self, pairs):
+        """Add entries for (label, value) pairs."""
+        raise NotImplementedError()
+
+    def _discard(self, pairs):
+        """Remove entries for (label, value) pairs."""
+        raise NotImplementedError()
+
+    def __new_labels(self, row, count):
+        labels = self._labels
+        if not labels:
+            return [i * _LABEL_SPACING for i in x_range(count)]
+        if row == len(labels):
+            return [labels[-1] + (i + 1) * _LABEL_SPACING for i in x_range(count)]
+        if row == 0:
+            return [labels[0] - (count - i) * _LABEL_SPACING for i in x_range(count)]
+
+        # Split the gap between the neighbors, relabel all rows if there's no room.
+        step = (labels[row] - labels[row - 1]) // (count + 1)
+        if step < 1:
+            labels[:] = [i * _LABEL_SPACING for i in x_range(len(labels))]
+            self._clear()
+            self._add(zip(labels, self._values))
+            step = (labels[row] - labels[row - 1]) // (count + 1)
+        return [labels[row - 1] + (i + 1) * step for i in x_range(count)]
+
+    def build(self, values):
+        """Build from the values of all rows."""
+        self._values = [self.normalize(v) for v in values]
+        self._labels = [i * _LABEL_SPACING for i in x_range(len(self._values))]
+        self._clear()
+        self._add(zip(self._labels, self._values))
+        self.dirty = False
+
+    def insert(self, row, values):
+        """Add values for rows inserted at a row."""
+        values = [self.normalize(v) for v in values]
+        labels = self.__new_labels(row, len(values))
+        self._labels[row:row] = labels
+        self._values[row:row] = values
+        self._add(zip(labels, values))
+
+    def delete(self, first_row, last_row):
+        """Remove a range of rows."""
+        stop = last_row + 1
+        self._discard(zip(self._labels[first_row:stop], self._values[first_row:stop]))
+        del self._labels[first_row:stop]
+        del self._values[first_row:stop]
+
+    def move(self, first_row, last_row, post_row):
+        """Move a range of rows so that the first one ends up at a post row."""
+        values = self._values[first_row : last_row + 1]
+        self.delete(first_row, last_row)
+        self.insert(post_row, values)
+
+    def update(self, row, value):
+        """Update the value of a row."""
+        label = self._labels[row]
+        self._discard(((label, self._values[row]),))
+        value = self._values[row] = self.normalize(value)
+        self._add(((label, value),))
+
+    def find(self, value):
+        """Find the rows that have a value (sorted)."""
+        raise NotImplementedError()
+
+
+class HashRowIndex(_RowIndex):
+    """Finds rows by value in constant time. Unhashable values are not indexed."""
+
+    def __init__(self, column, role, attribute, case_sensitive):
+        super(HashRowIndex, self).__init__(column, role, attribute, case_sensitive)
+        self.__labels = {}
+
+    def _clear(self):
+        """Remove all entries."""
+        self.__labels = {}
+
+    def _add(self, pairs):
+        """Add entries for (label, value) pairs."""
+        value_labels = self.__labels
+        for label, value in pairs:
+            try:
+                labels = value_labels.setdefault(value, [])
+            except TypeError:  # unhashable
+                continue
+            if not labels or labels[-1] < label:
+                labels.append(label)
+            else:
+                insort(labels, label)
+
+    def _discard(self, pairs):
+        """Remove entries for (label, value) pairs."""
+        value_labels = self.__labels
+        for label, value in pairs:
+            try:
+                labels = value_labels.get(value)
+            except TypeError:  # unhashable
+                continue
+            if labels is not None:
+                del labels[bisect_left(labels, label)]
+                if not labels:
+                    del value_labels[value]
+
+    def find(self, value):
+        """Find the rows that have a value (sorted)."""
+        try:
+            labels = self.__labels.get(self.normalize(value), ())
+        except TypeError:  # unhashable
+            return []
+        return [self._row(label) for label in labels]
+
+
+def _sort_tag(value):
+    """Tag that keeps numbers and strings apart in sorted indexes (or None)."""
+    if isinstance(value, string_types):
+        return 1
+    if isinstance(value, Number):
+        return 0
+    return None
+
+
+class SortedRowIndex(_RowIndex):
+    """
+    Finds rows by value or by string prefix in logarithmic time.
+    Only numbers and strings are indexed.
+    """
+
+    def __init__(self, column, role, attribute, case_sensitive):
+        super(SortedRowIndex, self).__init__(column, role, attribute, case_sensitive)
+        self.__entries = []
+
+    def _clear(self):
+        """Remove all entries."""
+        self.__entries = []
+
+    def _add(self, pairs):
+        """Add entries for (label, value) pairs."""
+        new_entries = []
+        for label, value in pairs:
+            tag = _sort_tag(value)
+            if tag is not None:
+                new_entries.append((tag, value, label))
+        entries = self.__entries
+        if len(new_entries) <= _BULK_THRESHOLD:
+            for entry in new_entries:
+                insort(entries, entry)
+        else:
+            entries.extend(new_entries)
+            entries.sort()
+
+    def _discard(self, pairs):
+        """Remove entries for (label, value) pairs."""
+        old_entries = []
+        for label, value in pairs:
+            tag = _sort_tag(value)
+            if tag is not None:
+                old_entries.append((tag, value, label))
+        entries = self.__entries
+        if len(old_entries) <= _BULK_THRESHOLD:
+            for entry in old_entries:
+                del entries[bisect_left(entries, entry)]
+        else:
+            old_labels = set(entry[2] for entry in old_entries)
+            self.__entries = [e for e in entries if e[2] not in old_labels]
+
+    def find(self, value):
+        """Find the rows that have a value (sorted)."""
+        value = self.normalize(value)
+        tag = _sort_tag(value)
+        if tag is None:
+            return []
+        entries = self.__entries
+        rows = []
+        for i in x_range(bisect_left(entries, (tag, value)), len(entries)):
+            entry_tag, entry_value, label = entries[i]
+            if entry_tag != tag or entry_value != value:
+                break
+            rows.append(self._row(label))
+        return rows
+
+    def find_prefix(self, prefix):
+        """Find the rows that have a string value starting with a prefix (sorted)."""
+        prefix = self.normalize(prefix)
+        entries = self.__entries
+        rows = []
+        for i in x_range(bisect_left(entries, (1, prefix)), len(entries)):
+            entry_tag, entry_value, label = entries[i]
+            if entry_tag != 1 or not entry_value.startswith(prefix):
+                break
+            rows.append(self._row(label))
+        return sorted(rows)
+
+
+ROW_INDEX_KINDS = {"hash": HashRowIndex, "sorted": SortedRowIndex}
@@ -2,29 +2,142 @@
 """List model."""
 
 from abc import abstractmethod
+from collections import OrderedDict, deque
+from inspect import getmro
+from operator import attrgetter
+from os import getpid
+from sys import exc_info, excepthook
+from threading import Event
+from uuid import uuid4
+from weakref import WeakKeyDictionary, WeakSet, WeakValueDictionary, ref
 
 from objetto import POST, PRE, Application, InteractiveData, data_attribute
 from objetto.bases import BaseObject
-from objetto.changes import ListDelete, ListInsert, ListMove, ListUpdate
+from objetto.changes import ListDelete, ListInsert, ListMove, ListUpdate, Update
 from objetto.exceptions import SerializationError
 from objetto.objects import ListObject, MutableListObject, list_cls
 from objetto.utils.reraise_context import ReraiseContext
 from objetto.utils.type_checking import assert_is_instance
 from Qt import QtCore
-from six import ensure_binary, string_types
+from six import ensure_binary, ensure_text, iteritems, string_types
 from six.moves import collections_abc
-from yaml import YAMLError, safe_dump, safe_load
+from six.moves import xrange as x_range
 
 from .._mixins import OQAbstractItemModelMixin
 from .._objects import OQObject
+from .._render import read_context, read_state, render_pass, snapshot_state
+from .codecs import find_mime_codec, get_mime_codec
+from .indexes import ROW_INDEX_KINDS
+from .transports import (
+    SHARED_MEMORY_AVAILABLE,
+    is_descriptor,
+    open_descriptor,
+    write_segment,
+)
 
 __all__ = [
     "OQListModel",
     "AbstractListModelHeader",
     "ListModelHeader",
+    "AsyncListModelHeader",
 ]
 
 
+# Number of rows to get data for at once when caching.
+_DATA_RANGE_SIZE = 32
+
+# Whether header classes implement methods in terms of their own `data` method.
+_implements_data_cache = WeakKeyDictionary()
+
+# Mime type carrying the token of mime data for rows dragged in this process.
+_TOKEN_MIME_TYPE = "application/x-objettoqt-list-token"
+
+# Mime data for rows dragged in this process, by token.
+_mime_data_registry = WeakValueDictionary()
+
+
+def _implements_data(cls, name):
+    """
+    Get whether the implementation of a method in a header class accounts for the
+    implementation of `data` (it's not overridden by a subclass).
+    """
+    try:
+        return _implements_data_cache[cls][name]
+    except KeyError:
+        pass
+    mro = getmro(cls)
+    method_cls = next(base for base in mro if name in base.__dict__)
+    data_cls = next(base for base in mro if "data" in base.__dict__)
+    implements_data = issubclass(method_cls, data_cls)
+    _implements_data_cache.setdefault(cls, {})[name] = implements_data
+    return implements_data
+
+
+# Roles reported by `itemData`.
+_ITEM_DATA_ROLES = (
+    QtCore.Qt.DisplayRole,
+    QtCore.Qt.DecorationRole,
+    QtCore.Qt.EditRole,
+    QtCore.Qt.ToolTipRole,
+    QtCore.Qt.StatusTipRole,
+    QtCore.Qt.WhatsThisRole,
+    QtCore.Qt.FontRole,
+    QtCore.Qt.TextAlignmentRole,
+    QtCore.Qt.BackgroundRole,
+    QtCore.Qt.ForegroundRole,
+    QtCore.Qt.CheckStateRole,
+    QtCore.Qt.SizeHintRole,
+)
+
+
+def _row_remap(change):
+    """
+    Get a function that maps rows from before to after a list change (returning None
+    for deleted rows), or None if rows can't be mapped for that kind of change.
+    """
+    index = change.index
+    last_index = change.last_index
+    count = last_index - index + 1
+    if isinstance(change, ListInsert):
+
+        def remap(row):
+            return row + count if row >= index else row
+
+    elif isinstance(change, ListDelete):
+
+        def remap(row):
+            if row < index:
+                return row
+            elif row > last_index:
+                return row - count
+            return None
+
+    elif isinstance(change, ListMove):
+        target_index = change.target_index
+        post_index = change.post_index
+
+        def remap(row):
+            if index <= row <= last_index:
+                return row - index + post_index
+            elif last_index < row < target_index:
+                return row - count
+            elif target_index <= row < index:
+                return row + count
+            return row
+
+    else:
+        return None
+    return remap
+
+
+def _flags_value(flags):
+    """Get the integer value of `Qt` flags (which might not convert to an int)."""
+    try:
+        return int(flags)
+    except TypeError:
+        return flags.value
+
+
 class AbstractListModelHeader(InteractiveData):
     """
     **(abstract class)**
@@ -89,6 +202,113 @@ class AbstractListModelHeader(InteractiveData):
         """
         raise NotImplementedError()
 
+    def roles_data(self, obj, row, roles):
+        """
+        **virtual method**
+
+        Retrieve data for multiple roles of an item at a specific row.
+        Override it to compute all roles for an item at once.
+
+        :param obj: List object.
+        :type obj: objetto.objects.ListObject
+
+        :param row: Row.
+        :type row: int
+
+        :param roles: Roles.
+        :type roles: collections.abc.Sequence[QtCore.Qt.ItemDataRole]
+
+        :return: Data per role.
+        :rtype: dict[QtCore.Qt.ItemDataRole, Any]
+        """
+        with read_context(obj.app):
+            return dict((role, self.data(obj, row, role)) for role in roles)
+
+    def affected_roles(self, obj, row, action):
+        """
+        **virtual method**
+
+        Retrieve the roles affected by an action sent by the value at a specific row
+        (or one of its children).
+
+        :param obj: List object.
+        :type obj: objetto.objects.ListObject
+
+        :param row: Row.
+        :type row: int
+
+        :param action: Action.
+        :type action: objetto.objects.Action
+
+        :return: Affected roles (empty if not affected) or None (all roles).
+        :rtype: tuple[QtCore.Qt.ItemDataRole] or None
+        """
+        if False and self and obj and row and action:  # for PyCharm
+            pass
+        return None
+
+    def sort_key(self, obj, row):
+        """
+        **virtual method**
+
+        Retrieve the key used to sort an item at a specific row.
+        Called once per row by :class:`objettoqt.models.OQSortFilterListModel`, and
+        again whenever the row changes. Keys of different types (such as None and
+        strings) can be mixed.
+
+        :param obj: List object.
+        :type obj: objetto.objects.ListObject
+
+        :param row: Row.
+        :type row: int
+
+        :return: Sort key.
+        """
+        return self.data(obj, row, QtCore.Qt.DisplayRole)
+
+    def indexes(self):
+        """
+        **virtual method**
+
+        Retrieve the roles to keep indexes of in this header's column, so that
+        :meth:`objettoqt.models.OQListModel.match` and
+        :meth:`objettoqt.models.OQListModel.findRows` don't need to go through every
+        row. Those indexes are keyed by `(column, role)`.
+
+        :return: Index kind (`'hash'` or `'sorted'`) per role.
+        :rtype: dict[QtCore.Qt.ItemDataRole, str]
+        """
+        if False and self:  # for PyCharm
+            pass
+        return {}
+
+    def data_range(self, obj, first_row, last_row, role=QtCore.Qt.DisplayRole):
+        """
+        **virtual method**
+
+        Retrieve data for the items in a range of rows.
+        Override it to do per-column work only once per range.
+
+        :param obj: List object.
+        :type obj: objetto.objects.ListObject
+
+        :param first_row: First row.
+        :type first_row: int
+
+        :param last_row: Last row (inclusive).
+        :type last_row: int
+
+        :param role: Role.
+        :type role: QtCore.Qt.ItemDataRole
+
+        :return: Data for each row.
+        :rtype: list
+        """
+        with read_context(obj.app):
+            return [
+                self.data(obj, row, role) for row in x_range(first_row, last_row + 1)
+            ]
+
 
 class ListModelHeader(AbstractListModelHeader):
     """
@@ -107,6 +327,9 @@ class ListModelHeader(AbstractListModelHeader):
 
     The source object at the row can be accesed through the :attr:`QtCore.Qt.UserRole`.
 
+    Subclasses that only override :meth:`objettoqt.models.ListModelHeader.data` get
+    their ranges, roles and sort keys computed from it.
+
     Inherits from:
       - :class:`objettoqt.models.AbstractListModelHeader`
     """
@@ -158,505 +381,2452 @@ class ListModelHeader(AbstractListModelHeader):
         :return: Data.
         :rtype: str or objetto.bases.BaseObject
         """
-        with obj.app.read_context():
+        with read_context(obj.app):
             if role == QtCore.Qt.DisplayRole:
-                sub_obj = obj[row]
+                sub_obj = read_state(obj)[row]
                 title = self.title
                 if title:
                     return str(getattr(sub_obj, title, self.fallback))
                 else:
                     return str(sub_obj)
             elif role == QtCore.Qt.UserRole:
-                return obj[row]
+                return read_state(obj)[row]
 
+    def data_range(self, obj, first_row, last_row, role=QtCore.Qt.DisplayRole):
+        """
+        Retrieve data for the items in a range of rows.
 
-class _InternalHeaders(OQObject):
-    """Internal headers object for keeping track of header changes."""
+        :param obj: List object.
+        :type obj: objetto.objects.ListObject
 
-    def _onObjChanged(self, obj, old_obj, phase):
-        list_model = self.parent()
-        if isinstance(list_model, OQListModel):
-            list_model.__onHeadersObjChanged__(obj, old_obj, phase)
-            list_model._onHeadersObjChanged(obj, old_obj, phase)
-            list_model.headersObjChanged.emit(obj, old_obj, phase)
+        :param first_row: First row.
+        :type first_row: int
 
-    def _onActionReceived(self, action, phase):
-        list_model = self.parent()
-        if isinstance(list_model, OQListModel):
-            list_model.__onHeadersActionReceived__(action, phase)
-            list_model._onHeadersActionReceived(action, phase)
-            list_model.headersActionReceived.emit(action, phase)
+        :param last_row: Last row (inclusive).
+        :type last_row: int
 
+        :param role: Role.
+        :type role: QtCore.Qt.ItemDataRole
 
-class OQListModel(OQAbstractItemModelMixin, QtCore.QAbstractItemModel):
-    """
-    Mixed :class:`QtCore.QAbstractItemModel` type (for lists).
+        :return: Data for each row.
+        :rtype: list[str or objetto.bases.BaseObject or None]
+        """
+        if not _implements_data(type(self), "data_range"):
+            return super(ListModelHeader, self).data_range(
+                obj, first_row, last_row, role=role
+            )
+        with read_context(obj.app):
+            sub_objs = read_state(obj)[first_row : last_row + 1]
+            if role == QtCore.Qt.DisplayRole:
+                title = self.title
+                if not title:
+                    return [str(sub_obj) for sub_obj in sub_objs]
+                if "." not in title:
+                    try:
+                        return [
+                            str(value) for value in map(attrgetter(title), sub_objs)
+                        ]
+                    except AttributeError:
+                        pass
+                fallback = self.fallback
+                return [str(getattr(sub_obj, title, fallback)) for sub_obj in sub_objs]
+            elif role == QtCore.Qt.UserRole:
+                return list(sub_objs)
+            else:
+                return [None] * len(sub_objs)
 
-    Observes actions sent from an instance of :class:`objetto.objects.ListObject`.
+    def roles_data(self, obj, row, roles):
+        """
+        Retrieve data for multiple roles of an item at a specific row.
 
-    Inherits from:
-      - :class:`objettoqt.mixins.OQAbstractItemModelMixin`
-      - :class:`QtCore.QAbstractItemModel`
+        :param obj: List object.
+        :type obj: objetto.objects.ListObject
 
-    :param parent: Parent.
-    :type parent: QtCore.QObject or None
+        :param row: Row.
+        :type row: int
 
-    :param headers: Headers (or None for default).
-    :type headers: tuple[objettoqt.models.AbstractListModelHeader] or None
+        :param roles: Roles.
+        :type roles: collections.abc.Sequence[QtCore.Qt.ItemDataRole]
 
-    :param mime_type: Mime type.
-    :type mime_type: str or None
-    """
+        :return: Data per role.
+        :rtype: dict[QtCore.Qt.ItemDataRole, str or objetto.bases.BaseObject or None]
+        """
+        if not _implements_data(type(self), "roles_data"):
+            return super(ListModelHeader, self).roles_data(obj, row, roles)
+        with read_context(obj.app):
+            sub_obj = read_state(obj)[row]
+            roles_data = {}
+            for role in roles:
+                if role == QtCore.Qt.DisplayRole:
+                    title = self.title
+                    if title:
+                        roles_data[role] = str(getattr(sub_obj, title, self.fallback))
+                    else:
+                        roles_data[role] = str(sub_obj)
+                elif role == QtCore.Qt.UserRole:
+                    roles_data[role] = sub_obj
+                else:
+                    roles_data[role] = None
+            return roles_data
 
-    headersObjChanged = QtCore.Signal(object, object, object)
-    """
-    **signal**
+    def affected_roles(self, obj, row, action):
+        """
+        Retrieve the roles affected by an action sent by the value at a specific row
+        (or one of its children).
 
-    Emitted when the headers object changes.
+        When a title is provided and the value at the row updates other attributes,
+        only the :attr:`QtCore.Qt.UserRole` is affected.
 
-    :param obj: New headers list object (or None).
-    :type obj: objetto.objects.ListObject or None
+        :param obj: List object.
+        :type obj: objetto.objects.ListObject
 
-    :param old_obj: Old headers list object (or None).
-    :type old_obj: objetto.objects.ListObject or None
+        :param row: Row.
+        :type row: int
 
-    :param phase: Phase.
-    :type phase: objetto.bases.Phase
-    """
+        :param action: Action.
+        :type action: objetto.objects.Action
 
-    headersActionReceived = QtCore.Signal(object, object)
-    """
-    **signal**
+        :return: Affected roles (empty if not affected) or None (all roles).
+        :rtype: tuple[QtCore.Qt.ItemDataRole] or None
+        """
+        if not _implements_data(type(self), "affected_roles"):
+            return super(ListModelHeader, self).affected_roles(obj, row, action)
+        title = self.title
+        change = action.change
+        if (
+            title
+            and len(action.locations) == 1
+            and isinstance(change, Update)
+            and title not in change.new_values
+        ):
+            return (QtCore.Qt.UserRole,)
+        return QtCore.Qt.DisplayRole, QtCore.Qt.UserRole
+
+    def sort_key(self, obj, row):
+        """
+        Retrieve the key used to sort an item at a specific row.
 
-    Emitted when an action is received from the headers object.
+        If a title is provided, the attribute with the same name as the title is used
+        without being converted to a string.
 
-    :param action: Action.
-    :type action: objetto.objects.Action
+        :param obj: List object.
+        :type obj: objetto.objects.ListObject
 
-    :param phase: Phase.
-    :type phase: objetto.bases.Phase
-    """
+        :param row: Row.
+        :type row: int
 
-    OBase = ListObject
+        :return: Sort key.
+        """
+        if not _implements_data(type(self), "sort_key"):
+            return super(ListModelHeader, self).sort_key(obj, row)
+        with read_context(obj.app):
+            sub_obj = read_state(obj)[row]
+            title = self.title
+            if title:
+                return getattr(sub_obj, title, self.fallback)
+            elif isinstance(sub_obj, BaseObject):
+                return str(sub_obj)
+            else:
+                return sub_obj
+
+
+class AsyncListModelHeader(AbstractListModelHeader):
     """
-    **read-only class attribute**
+    **(abstract class)**
 
-    Minimum `objetto` object base requirement.
+    To be used with :class:`objettoqt.models.OQListModel`.
+    Computes expensive data in worker threads.
 
-    :type: type[objetto.objects.ListObject]
+    When :class:`objettoqt.models.OQListModel` doesn't have data computed for an item
+    yet, it returns a placeholder, takes a snapshot of the item and computes the data
+    from it in the global thread pool. Once results arrive, `dataChanged` is emitted
+    (coalesced, and by attached :class:`objettoqt.models.OQSortFilterListModel`
+    proxies too). Results for rows that changed in the meantime are discarded, and
+    rows that changed keep their previous data until it's computed again.
+
+    Inherits from:
+      - :class:`objettoqt.models.AbstractListModelHeader`
     """
 
-    __default_headers_cls = list_cls(AbstractListModelHeader, subtypes=True)
+    placeholder = data_attribute(default="...")
+    """
+    Placeholder for the :attr:`QtCore.Qt.DisplayRole` while data is computed.
 
-    def __init__(self, parent=None, headers=None, mime_type=None, **kwargs):
-        super(OQListModel, self).__init__(parent=parent, **kwargs)
+    :type: str or None
+    """
 
-        # Internal headers.
-        self.__headers = _InternalHeaders(parent=self)
+    def async_roles(self):
+        """
+        **virtual method**
 
-        # Store mime type.
-        self.__mime_type = mime_type or None
+        Retrieve the roles for which data is computed in worker threads.
 
-        # Default headers object.
-        filtered_headers = []
-        for header in headers or ():
-            if isinstance(header, string_types):
-                header = ListModelHeader(title=header)
-            else:
-                with ReraiseContext(TypeError, "'header' parameter"):
-                    assert_is_instance(header, AbstractListModelHeader)
-            filtered_headers.append(header)
-        self.__default_headers_obj = type(self).__default_headers_cls(
-            Application(), filtered_headers or (ListModelHeader(),)
-        )
+        :return: Roles.
+        :rtype: tuple[QtCore.Qt.ItemDataRole]
+        """
+        if False and self:  # for PyCharm
+            pass
+        return (QtCore.Qt.DisplayRole,)
 
-        # Headers object (start with default).
-        self.__headers.setObj(self.__default_headers_obj)
+    def snapshot(self, obj, row):
+        """
+        **virtual method**
 
-    def __onObjChanged__(self, obj, old_obj, phase):
-        super(OQListModel, self).__onObjChanged__(obj, old_obj, phase)
+        Take an immutable snapshot of an item at a specific row, to compute data from
+        in a worker thread. Defaults to the state of objects, or to the value itself.
 
-        # Reset model.
-        if phase is PRE:
-            self.beginResetModel()
-        elif phase is POST:
-            self.endResetModel()
+        :param obj: List object.
+        :type obj: objetto.objects.ListObject
 
-    def __onActionReceived__(self, action, phase):
-        super(OQListModel, self).__onActionReceived__(action, phase)
+        :param row: Row.
+        :type row: int
 
-        # The list changed.
-        if action.sender is self.obj():
+        :return: Snapshot.
+        """
+        with read_context(obj.app):
+            value = read_state(obj)[row]
+            if isinstance(value, BaseObject):
+                return value._state
+            return value
 
-            # Insert rows.
-            if isinstance(action.change, ListInsert):
-                if phase is PRE:
-                    self.beginInsertRows(
-                        QtCore.QModelIndex(),
-                        action.change.index,
-                        action.change.last_index,
-                    )
-                elif phase is POST:
-                    self.endInsertRows()
+    @abstractmethod
+    def compute(self, snapshot, role):
+        """
+        **abstract method**
 
-            # Delete rows.
-            elif isinstance(action.change, ListDelete):
-                if phase is PRE:
-                    self.beginRemoveRows(
-                        QtCore.QModelIndex(),
-                        action.change.index,
-                        action.change.last_index,
-                    )
-                elif phase is POST:
-                    self.endRemoveRows()
+        Compute data from a snapshot of an item. Called from worker threads, so it
+        should only access the snapshot.
 
-            # Move rows.
-            elif isinstance(action.change, ListMove):
-                if phase is PRE:
-                    self.beginMoveRows(
-                        QtCore.QModelIndex(),
-                        action.change.index,
-                        action.change.last_index,
-                        QtCore.QModelIndex(),
-                        action.change.target_index,
-                    )
-                elif phase is POST:
-                    self.endMoveRows()
+        :param snapshot: Snapshot (see \
+:meth:`objettoqt.models.AsyncListModelHeader.snapshot`).
+
+        :param role: Role.
+        :type role: QtCore.Qt.ItemDataRole
+
+        :return: Data.
+        """
+        raise NotImplementedError()
+
+    def data(self, obj, row, role=QtCore.Qt.DisplayRole):
+        """
+        Compute data for an item at a specific row synchronously.
+        Used by anything other than the model's
+        :meth:`objettoqt.models.OQListModel.data` (such as sorting).
+
+        :param obj: List object.
+        :type obj: objetto.objects.ListObject
+
+        :param row: Row.
+        :type row: int
+
+        :param role: Role.
+        :type role: QtCore.Qt.ItemDataRole
+
+        :return: Data.
+        """
+        if role in self.async_roles():
+            return self.compute(self.snapshot(obj, row), role)
+        return None
+
+
+class _ComputeData(QtCore.QRunnable):
+    """Computes data for an asynchronous header in a worker thread."""
+
+    def __init__(self, signal, token, header, snapshot, role):
+        super(_ComputeData, self).__init__()
+        self.setAutoDelete(True)
+        self.__signal = signal
+        self.__token = token
+        self.__header = header
+        self.__snapshot = snapshot
+        self.__role = role
+
+    def run(self):
+        """Compute data."""
+        try:
+            value = self.__header.compute(self.__snapshot, self.__role)
+        except Exception:
+            excepthook(*exc_info())
+            value = None
+        try:
+            self.__signal.emit(self.__token, value)
+        except RuntimeError:  # model was deleted
+            pass
+
+
+class _InternalHeaders(OQObject):
+    """Internal headers object for keeping track of header changes."""
+
+    def _onObjChanged(self, obj, old_obj, phase):
+        list_model = self.parent()
+        if isinstance(list_model, OQListModel):
+            list_model.__onHeadersObjChanged__(obj, old_obj, phase)
+            list_model._onHeadersObjChanged(obj, old_obj, phase)
+            list_model.headersObjChanged.emit(obj, old_obj, phase)
+
+    def _onActionReceived(self, action, phase):
+        list_model = self.parent()
+        if isinstance(list_model, OQListModel):
+            list_model.__onHeadersActionReceived__(action, phase)
+            list_model._onHeadersActionReceived(action, phase)
+            list_model.headersActionReceived.emit(action, phase)
+
+
+def _decode(data_stream):
+    """Decode mime data contents with the registered codec that matches them."""
+    codec = find_mime_codec(data_stream)
+    if codec is None:
+        raise TypeError()
+    return codec.decode(data_stream)
+
+
+class _AsyncDrop(object):
+    """State of items being deserialized in chunks for a drop."""
+
+    def __init__(self, row, item_count, chunk_count):
+        self.row = row
+        self.item_count = item_count
+        self.results = [None] * chunk_count
+        self.pending_count = chunk_count
+        self.done_count = 0
+        self.skipped_count = 0
+        self.cancelled = Event()
+
+
+class _DeserializeChunk(QtCore.QRunnable):
+    """Deserializes and validates a chunk of dropped items in a worker thread."""
+
+    def __init__(self, signal, async_drop, index, obj_type, app, items):
+        super(_DeserializeChunk, self).__init__()
+        self.setAutoDelete(True)
+        self.__signal = signal
+        self.__async_drop = async_drop
+        self.__index = index
+        self.__obj_type = obj_type
+        self.__app = app
+        self.__items = items
+
+    def run(self):
+        """Deserialize and validate items, skipping the invalid ones."""
+        async_drop = self.__async_drop
+        obj_type = self.__obj_type
+        app = self.__app
+        relationship = obj_type._relationship
+        objs = []
+        skipped_count = 0
+        for serialized, item in self.__items:
+            if async_drop.cancelled.is_set():
+                return
+            try:
+                with app.write_context():
+                    if serialized:
+                        item = obj_type.deserialize_value(item, None, app=app)
+                    relationship.fabricate_value(item, factory=False)
+            except (SerializationError, TypeError, ValueError):
+                skipped_count += 1
+                continue
+            objs.append(item)
+        try:
+            self.__signal.emit(async_drop, self.__index, objs, skipped_count)
+        except RuntimeError:  # model was deleted
+            pass
+
+
+class _OQListMimeData(QtCore.QMimeData):
+    """
+    Mime data for dragged rows, only encoded when retrieved by a consumer.
+    Drops in the same process resolve the rows through a token instead.
+    """
+
+    def __init__(
+        self,
+        mime_type,
+        mime_codec,
+        shared_memory_threshold,
+        obj,
+        items,
+        first_row,
+        last_row,
+    ):
+        super(_OQListMimeData, self).__init__()
+        self.__token = "{}:{}".format(getpid(), uuid4().hex)
+        self.__mime_type = mime_type
+        self.__mime_codec = mime_codec
+        self.__shared_memory_threshold = shared_memory_threshold
+        self.__obj_ref = ref(obj)
+        self.__state = obj._state
+        self.__items = tuple(items)
+        self.__first_row = first_row
+        self.__last_row = last_row
+        self.__data_stream = None
+        _mime_data_registry[self.__token] = self
+
+    def __encode(self):
+        obj = self.__obj_ref()
+        if obj is None:
+            return b""
+        serialized_objs = []
+        contents = {
+            "token": self.__token,
+            "first_row": self.__first_row,
+            "last_row": self.__last_row,
+            "serialized_objs": serialized_objs,
+        }
+        with obj.app.read_context():
+            for item in self.__items:
+                if isinstance(item, BaseObject):
+                    try:
+                        serialized_obj = obj.serialize_value(item)
+                    except SerializationError:
+                        serialized_obj = item
+                else:
+                    serialized_obj = item
+                serialized_objs.append(serialized_obj)
+        try:
+            data_stream = get_mime_codec(self.__mime_codec).encode(contents)
+        except (KeyError, ValueError):
+            return b""
+
+        # Large payloads are written once into shared memory, and only a descriptor
+        # is carried by the mime data.
+        threshold = self.__shared_memory_threshold
+        if threshold is not None and len(data_stream) >= threshold:
+            try:
+                _, data_stream = write_segment(data_stream, self)
+            except (RuntimeError, OSError):
+                pass
+        return data_stream
+
+    @staticmethod
+    def resolve(data):
+        """
+        Get the mime data for rows dragged in this process from any mime data.
+
+        :param data: Mime data.
+        :type data: QtCore.QMimeData
+
+        :return: Mime data for rows dragged in this process (or None).
+        :rtype: _OQListMimeData or None
+        """
+        if isinstance(data, _OQListMimeData):
+            return data
+        if not data.hasFormat(_TOKEN_MIME_TYPE):
+            return None
+        token = ensure_text(bytes(data.data(_TOKEN_MIME_TYPE).data()), "utf8")
+        return _mime_data_registry.get(token)
+
+    def source(self):
+        """
+        Get source list object (or None if it no longer exists), its state when
+        dragged, the dragged items (as shown by the model) and the first and last
+        dragged rows.
+
+        :return: Source list object, state, items, first row, last row.
+        :rtype: tuple[objetto.objects.ListObject or None, objetto.states.ListState, \
+tuple, int, int]
+        """
+        return (
+            self.__obj_ref(),
+            self.__state,
+            self.__items,
+            self.__first_row,
+            self.__last_row,
+        )
+
+    def formats(self):
+        """
+        Get formats.
+
+        :return: Formats.
+        :rtype: list[str]
+        """
+        return [self.__mime_type, _TOKEN_MIME_TYPE]
+
+    def hasFormat(self, mime_type):
+        """
+        Get whether has a format.
+
+        :param mime_type: Mime type.
+        :type mime_type: str
+
+        :return: True if has format.
+        :rtype: bool
+        """
+        return mime_type in (self.__mime_type, _TOKEN_MIME_TYPE)
+
+    def retrieveData(self, mime_type, preferred_type):
+        """
+        Retrieve data for a format, encoding the dragged rows on the first request.
+
+        :param mime_type: Mime type.
+        :type mime_type: str
+
+        :param preferred_type: Preferred type.
+
+        :return: Data.
+        :rtype: QtCore.QByteArray
+        """
+        if mime_type == _TOKEN_MIME_TYPE:
+            return QtCore.QByteArray(ensure_binary(self.__token, "utf8"))
+        if mime_type == self.__mime_type:
+            if self.__data_stream is None:
+                self.__data_stream = self.__encode()
+            return QtCore.QByteArray(self.__data_stream)
+        return super(_OQListMimeData, self).retrieveData(mime_type, preferred_type)
+
+
+class OQListModel(OQAbstractItemModelMixin, QtCore.QAbstractItemModel):
+    """
+    Mixed :class:`QtCore.QAbstractItemModel` type (for lists).
+
+    Observes actions sent from an instance of :class:`objetto.objects.ListObject`.
+
+    Inherits from:
+      - :class:`objettoqt.mixins.OQAbstractItemModelMixin`
+      - :class:`QtCore.QAbstractItemModel`
+
+    :param parent: Parent.
+    :type parent: QtCore.QObject or None
+
+    :param headers: Headers (or None for default).
+    :type headers: tuple[objettoqt.models.AbstractListModelHeader] or None
+
+    :param mime_type: Mime type.
+    :type mime_type: str or None
+
+    :param mime_codec: Name of the registered mime codec used to encode dragged items.
+    :type mime_codec: str
+    """
+
+    headersObjChanged = QtCore.Signal(object, object, object)
+    """
+    **signal**
+
+    Emitted when the headers object changes.
+
+    :param obj: New headers list object (or None).
+    :type obj: objetto.objects.ListObject or None
+
+    :param old_obj: Old headers list object (or None).
+    :type old_obj: objetto.objects.ListObject or None
+
+    :param phase: Phase.
+    :type phase: objetto.bases.Phase
+    """
+
+    headersActionReceived = QtCore.Signal(object, object)
+    """
+    **signal**
+
+    Emitted when an action is received from the headers object.
+
+    :param action: Action.
+    :type action: objetto.objects.Action
+
+    :param phase: Phase.
+    :type phase: objetto.bases.Phase
+    """
+
+    asyncDropProgressed = QtCore.Signal(int, int)
+    """
+    **signal**
+
+    Emitted when a chunk of dropped items was deserialized in a worker thread.
+
+    :param done: Number of items processed.
+    :type done: int
+
+    :param total: Number of dropped items.
+    :type total: int
+    """
+
+    asyncDropFinished = QtCore.Signal(bool, int, int)
+    """
+    **signal**
+
+    Emitted when dropped items deserialized in worker threads were inserted, or when
+    the drop was cancelled.
+
+    :param completed: False if cancelled.
+    :type completed: bool
+
+    :param inserted: Number of items inserted.
+    :type inserted: int
+
+    :param skipped: Number of invalid items that were skipped.
+    :type skipped: int
+    """
+
+    OBase = ListObject
+    """
+    **read-only class attribute**
+
+    Minimum `objetto` object base requirement.
+
+    :type: type[objetto.objects.ListObject]
+    """
+
+    __default_headers_cls = list_cls(AbstractListModelHeader, subtypes=True)
+    __dataChangesQueued = QtCore.Signal()
+    __rowChangesQueued = QtCore.Signal()
+    __chunkDeserialized = QtCore.Signal(object, object, object, object)
+    __asyncDataComputed = QtCore.Signal(object, object)
+
+    def __init__(
+        self,
+        parent=None,
+        headers=None,
+        mime_type=None,
+        mime_codec="binary_json",
+        **kwargs
+    ):
+        super(OQListModel, self).__init__(parent=parent, **kwargs)
+
+        # Snapshots of the rows and the headers, as last notified to `Qt`.
+        self.__row_snapshot = []
+        self.__header_snapshot = ()
+        self.__debug_checks = False
+
+        # Paging (disabled by default), only the first rows are loaded.
+        self.__page_size = None
+        self.__loaded_row_count = None
+
+        # Data changes to emit, coalesced per roles and flushed once per event loop
+        # iteration through a queued connection.
+        self.__data_changes = {}
+        self.__proxy_data_changes = []
+        self.__data_changed_request_count = 0
+        self.__data_changed_emit_count = 0
+        self.__dataChangesQueued.connect(
+            self.__dataChangesQueuedSlot__, QtCore.Qt.QueuedConnection
+        )
+
+        # Row changes over the threshold (disabled by default) fall back to a reset or
+        # a layout change, which stays open until the next event loop iteration.
+        self.__reset_threshold = None
+        self.__reset_policy = "reset"
+        self.__row_changes_queued = False
+        self.__queued_row_count = 0
+        self.__bulk_change = None
+        self.__bulk_indexes = None
+        self.__bulk_rows = None
+        self.__fallback_count = 0
+        self.__row_signal_count = 0
+        self.__rowChangesQueued.connect(
+            self.__rowChangesQueuedSlot__, QtCore.Qt.QueuedConnection
+        )
+
+        # Sort/filter proxies, notified after this model.
+        self.__proxies = WeakSet()
+
+        # Data computed in worker threads for asynchronous headers, per row and
+        # (column, role), and the requests for it by token.
+        self.__async_data = {}
+        self.__async_requests = {}
+        self.__async_request_keys = {}
+        self.__async_queue = deque()
+        self.__async_limit = max(1, QtCore.QThread.idealThreadCount())
+        self.__async_in_flight_count = 0
+        self.__async_discard_count = 0
+        self.__asyncDataComputed.connect(
+            self.__asyncDataComputedSlot__, QtCore.Qt.QueuedConnection
+        )
+
+        # Indexes of row values by key, and the keys of those declared by headers.
+        self.__indexes = OrderedDict()
+        self.__header_index_keys = ()
+
+        # Internal headers.
+        self.__headers = _InternalHeaders(parent=self)
+
+        # Store mime type, codec and shared memory threshold (disabled by default).
+        self.__mime_type = mime_type or None
+        self.__mime_codec = get_mime_codec(mime_codec).name
+        self.__shared_memory_threshold = None
+
+        # Copies of many items (disabled by default) are deserialized in chunks in
+        # worker threads, and inserted once all chunks are done.
+        self.__async_drop_threshold = None
+        self.__drop_chunk_size = 1000
+        self.__async_drop = None
+        self.__chunkDeserialized.connect(
+            self.__chunkDeserializedSlot__, QtCore.Qt.QueuedConnection
+        )
+
+        # Default headers object.
+        filtered_headers = []
+        for header in headers or ():
+            if isinstance(header, string_types):
+                header = ListModelHeader(title=header)
+            else:
+                with ReraiseContext(TypeError, "'header' parameter"):
+                    assert_is_instance(header, AbstractListModelHeader)
+            filtered_headers.append(header)
+        self.__default_headers_obj = type(self).__default_headers_cls(
+            Application(), filtered_headers or (ListModelHeader(),)
+        )
+
+        # Data cache (disabled by default).
+        self.__data_cache = None
+        self.__data_cache_size = None
+        self.__data_cache_hit_count = 0
+        self.__data_cache_miss_count = 0
+
+        # Headers object (start with default).
+        self.__headers.setObj(self.__default_headers_obj)
+
+    def __onObjChanged__(self, obj, old_obj, phase):
+        super(OQListModel, self).__onObjChanged__(obj, old_obj, phase)
+
+        # Cached data is no longer valid.
+        self.clearDataCache()
+        self.__clearAsyncData()
+
+        # Reset model (no need to emit data changes).
+        if phase is PRE:
+            self.cancelAsyncDrop()
+            self.__endBulkChange()
+            self.__data_changes.clear()
+            del self.__proxy_data_changes[:]
+            self.beginResetModel()
+        elif phase is POST:
+            for row_index in self.__indexes.values():
+                row_index.dirty = True
+            self.__row_snapshot = list(obj._state) if obj is not None else []
+            if self.__page_size is not None:
+                self.__loaded_row_count = min(
+                    len(self.__row_snapshot), self.__page_size
+                )
+            self.endResetModel()
+
+        # Notify proxies.
+        for proxy in list(self.__proxies):
+            proxy.__onSourceObjChanged__(phase)
+
+    def __onActionReceived__(self, action, phase):
+        super(OQListModel, self).__onActionReceived__(action, phase)
+
+        # Update row snapshot.
+        if phase is POST and action.sender is self.obj():
+            self.__updateRowSnapshot(action.change)
+
+        # Invalidate cached data.
+        if phase is POST and self.__data_cache:
+            self.__invalidateDataCache(action)
+        if phase is POST and (self.__async_data or self.__async_requests):
+            self.__invalidateAsyncData(action)
+
+        # Update indexes.
+        if phase is POST and self.__indexes:
+            self.__updateIndexes(action)
+
+        # Emit pending data changes before rows are inserted, deleted or moved.
+        if (
+            phase is PRE
+            and action.sender is self.obj()
+            and not isinstance(action.change, ListUpdate)
+        ):
+            self.flushDataChanges()
+
+        # A value in the list changed.
+        if phase is POST and action.sender is not self.obj() and action.locations:
+            self.__queueValueDataChanged(action)
+
+        # The list changed while paging.
+        if action.sender is self.obj() and self.__page_size is not None:
+            self.__pagedActionReceived(action.change, phase)
+
+        # Too many rows changed, in bulk.
+        elif action.sender is self.obj() and self.__bulkActionReceived(
+            action.change, phase
+        ):
+            pass
+
+        # The list changed.
+        elif action.sender is self.obj():
+
+            # Insert rows.
+            if isinstance(action.change, ListInsert):
+                if phase is PRE:
+                    self.beginInsertRows(
+                        QtCore.QModelIndex(),
+                        action.change.index,
+                        action.change.last_index,
+                    )
+                elif phase is POST:
+                    self.__row_signal_count += 1
+                    self.endInsertRows()
+
+            # Delete rows.
+            elif isinstance(action.change, ListDelete):
+                if phase is PRE:
+                    self.beginRemoveRows(
+                        QtCore.QModelIndex(),
+                        action.change.index,
+                        action.change.last_index,
+                    )
+                elif phase is POST:
+                    self.__row_signal_count += 1
+                    self.endRemoveRows()
+
+            # Move rows.
+            elif isinstance(action.change, ListMove):
+                if phase is PRE:
+                    self.beginMoveRows(
+                        QtCore.QModelIndex(),
+                        action.change.index,
+                        action.change.last_index,
+                        QtCore.QModelIndex(),
+                        action.change.target_index,
+                    )
+                elif phase is POST:
+                    self.__row_signal_count += 1
+                    self.endMoveRows()
 
             # Change rows.
             elif isinstance(action.change, ListUpdate):
                 if phase is POST:
-                    self.dataChanged.emit(
-                        self.index(action.change.index, 0, QtCore.QModelIndex()),
-                        self.index(
+                    self.__queueDataChanged(
+                        action.change.index, action.change.last_index
+                    )
+
+        # Notify proxies.
+        for proxy in list(self.__proxies):
+            proxy.__onSourceActionReceived__(action, phase)
+
+    def __onHeadersObjChanged__(self, obj, old_obj, phase):
+        if False and obj:  # for PyCharm
+            pass
+
+        # Cached data is no longer valid.
+        self.clearDataCache()
+        self.__clearAsyncData()
+
+        # Update header snapshot and indexes.
+        if phase is POST:
+            self.__header_snapshot = tuple(obj._state)
+            self.__updateHeaderIndexes()
+
+        # Reset model (no need to emit data changes).
+        if old_obj is not None:
+            if phase is PRE:
+                self.__endBulkChange()
+                self.__data_changes.clear()
+                del self.__proxy_data_changes[:]
+                self.beginResetModel()
+            elif phase is POST:
+                self.endResetModel()
+
+        # Notify proxies.
+        for proxy in list(self.__proxies):
+            proxy.__onSourceHeadersChanged__(phase)
+
+    def __onHeadersActionReceived__(self, action, phase):
+
+        # Cached data is no longer valid, update header snapshot.
+        if phase is POST:
+            self.clearDataCache()
+            self.__clearAsyncData()
+            if action.sender is self.__headers.obj():
+                self.__header_snapshot = tuple(action.change.new_state)
+                self.__updateHeaderIndexes()
+
+        # Emit pending changes before columns are inserted, deleted or moved.
+        if (
+            phase is PRE
+            and action.sender is self.__headers.obj()
+            and not isinstance(action.change, ListUpdate)
+        ):
+            self.__endBulkChange()
+            self.flushDataChanges()
+
+        # The headers changed.
+        if action.sender is self.__headers.obj():
+
+            # Insert columns.
+            if isinstance(action.change, ListInsert):
+                if phase is PRE:
+                    self.beginInsertColumns(
+                        QtCore.QModelIndex(),
+                        action.change.index,
+                        action.change.last_index,
+                    )
+                elif phase is POST:
+                    self.endInsertColumns()
+
+            # Delete columns.
+            elif isinstance(action.change, ListDelete):
+                if phase is PRE:
+                    self.beginRemoveColumns(
+                        QtCore.QModelIndex(),
+                        action.change.index,
+                        action.change.last_index,
+                    )
+                if phase is POST:
+                    self.endRemoveColumns()
+
+            # Move columns.
+            elif isinstance(action.change, ListMove):
+                if phase is PRE:
+                    self.beginMoveColumns(
+                        QtCore.QModelIndex(),
+                        action.change.index,
+                        action.change.last_index,
+                        QtCore.QModelIndex(),
+                        action.change.target_index,
+                    )
+                if phase is POST:
+                    self.endMoveColumns()
+
+            # Change columns.
+            elif isinstance(action.change, ListUpdate):
+                if phase is POST:
+                    self.headerDataChanged.emit(
+                        QtCore.Qt.Horizontal,
+                        action.change.index,
+                        action.change.last_index,
+                    )
+                    obj_count = self.rowCount()
+                    if obj_count:
+                        self.__queueDataChanged(
+                            0,
+                            obj_count - 1,
+                            action.change.index,
                             action.change.last_index,
-                            self.columnCount() - 1,
-                            QtCore.QModelIndex(),
-                        ),
+                        )
+
+        # Notify proxies.
+        if action.sender is self.__headers.obj():
+            for proxy in list(self.__proxies):
+                proxy.__onSourceHeadersChanged__(phase)
+
+    def __pagedActionReceived(self, change, phase):
+        loaded_row_count = self.__loaded_row_count
+
+        # Insert rows, only signal rows inserted in the loaded rows (or right after
+        # them, if all rows were loaded).
+        if isinstance(change, ListInsert):
+            count = change.last_index - change.index + 1
+            if phase is PRE:
+                total_row_count = len(self.__row_snapshot)
+            else:
+                total_row_count = len(self.__row_snapshot) - count
+            if change.index < loaded_row_count or loaded_row_count == total_row_count:
+                if phase is PRE:
+                    self.beginInsertRows(
+                        QtCore.QModelIndex(), change.index, change.last_index
+                    )
+                elif phase is POST:
+                    self.__loaded_row_count += count
+                    self.endInsertRows()
+
+        # Delete rows, only signal loaded rows.
+        elif isinstance(change, ListDelete):
+            last_index = min(change.last_index, loaded_row_count - 1)
+            if change.index <= last_index:
+                if phase is PRE:
+                    self.beginRemoveRows(QtCore.QModelIndex(), change.index, last_index)
+                elif phase is POST:
+                    self.__loaded_row_count -= last_index - change.index + 1
+                    self.endRemoveRows()
+
+        # Move rows, reset if rows are moved in or out of the loaded rows.
+        elif isinstance(change, ListMove):
+            if (
+                change.last_index < loaded_row_count
+                and change.target_index <= loaded_row_count
+            ):
+                if phase is PRE:
+                    self.beginMoveRows(
+                        QtCore.QModelIndex(),
+                        change.index,
+                        change.last_index,
+                        QtCore.QModelIndex(),
+                        change.target_index,
                     )
+                elif phase is POST:
+                    self.endMoveRows()
+            elif (
+                change.index < loaded_row_count
+                or change.target_index < loaded_row_count
+            ):
+                if phase is PRE:
+                    self.beginResetModel()
+                elif phase is POST:
+                    self.endResetModel()
+
+        # Change rows, only signal loaded rows.
+        elif isinstance(change, ListUpdate):
+            last_index = min(change.last_index, loaded_row_count - 1)
+            if phase is POST and change.index <= last_index:
+                self.__queueDataChanged(change.index, last_index)
+
+    def __bulkActionReceived(self, change, phase):
+        if isinstance(change, ListUpdate):
+            return False
+
+        # Already in bulk, keep track of persistent rows.
+        bulk_change = self.__bulk_change
+        if bulk_change is not None:
+            if bulk_change != "layout" or isinstance(change, ListMove):
+                if phase is POST and self.__bulk_rows is not None:
+                    self.__remapBulkRows(change)
+                return True
+
+            # Row count is about to change, which a layout change can't signal.
+            # End it now and reset instead.
+            self.__endBulkChange()
+            self.__fallback_count += 1
+            self.__bulk_change = "reset"
+            self.beginResetModel()
+            return True
+
+        # Check threshold for the change and the changes in this event loop
+        # iteration.
+        threshold = self.__reset_threshold
+        if threshold is None or phase is not PRE:
+            return False
+        row_count = change.last_index - change.index + 1
+        self.__queued_row_count += row_count
+        if not self.__row_changes_queued:
+            self.__row_changes_queued = True
+            self.__rowChangesQueued.emit()
+        if row_count <= threshold and self.__queued_row_count <= threshold:
+            return False
+
+        # Start bulk change, will end on the next event loop iteration. Only moves
+        # keep the row count, so only they can be signaled as a layout change.
+        self.__fallback_count += 1
+        if self.__reset_policy == "layout" and isinstance(change, ListMove):
+            self.__bulk_change = "layout"
+            self.layoutAboutToBeChanged.emit()
+            self.__bulk_indexes = self.persistentIndexList()
+            self.__bulk_rows = [index.row() for index in self.__bulk_indexes]
+        else:
+            self.__bulk_change = "reset"
+            self.beginResetModel()
+        return True
+
+    def __remapBulkRows(self, change):
+        index = change.index
+        count = change.last_index - index + 1
+        post_index = change.post_index
+        rows = self.__bulk_rows
+        for i, row in enumerate(rows):
+            if index <= row <= change.last_index:
+                rows[i] = post_index + row - index
+            else:
+                if row > change.last_index:
+                    row -= count
+                if row >= post_index:
+                    row += count
+                rows[i] = row
+
+    def __endBulkChange(self):
+        bulk_change = self.__bulk_change
+        if bulk_change is None:
+            return
+        self.__bulk_change = None
+        self.__data_changes.clear()
+        del self.__proxy_data_changes[:]
+        if bulk_change == "layout":
+            old_indexes = self.__bulk_indexes
+            rows = self.__bulk_rows
+            self.__bulk_indexes = self.__bulk_rows = None
+            new_indexes = [
+                self.index(row, index.column(), QtCore.QModelIndex())
+                for index, row in zip(old_indexes, rows)
+            ]
+            self.changePersistentIndexList(old_indexes, new_indexes)
+            self.layoutChanged.emit()
+        else:
+            self.endResetModel()
+
+    @QtCore.Slot()
+    def __rowChangesQueuedSlot__(self):
+        self.__row_changes_queued = False
+        self.__queued_row_count = 0
+        self.__endBulkChange()
+
+    @QtCore.Slot()
+    def __dataChangesQueuedSlot__(self):
+        self.flushDataChanges()
+
+    @QtCore.Slot(object, object, object, object)
+    def __chunkDeserializedSlot__(self, async_drop, index, objs, skipped_count):
+        if async_drop is not self.__async_drop:
+            return
+        async_drop.results[index] = objs
+        async_drop.pending_count -= 1
+        async_drop.done_count += len(objs) + skipped_count
+        async_drop.skipped_count += skipped_count
+        self.asyncDropProgressed.emit(async_drop.done_count, async_drop.item_count)
+        if async_drop.pending_count:
+            return
+
+        # All chunks are done, insert them at once.
+        self.__async_drop = None
+        objs = [obj for chunk_objs in async_drop.results for obj in chunk_objs]
+        obj = self.obj()
+        if objs and obj is not None:
+            with obj.app.write_context():
+                obj.insert(min(async_drop.row, len(obj)), *objs)
+        self.asyncDropFinished.emit(True, len(objs), async_drop.skipped_count)
+
+    def __queueDataChanged(
+        self,
+        first_row,
+        last_row,
+        first_column=0,
+        last_column=None,
+        roles=None,
+        notify_proxies=False,
+    ):
+        if last_column is None:
+            last_column = len(self.__header_snapshot) - 1
+        if first_row > last_row or first_column > last_column:
+            return
+        roles_key = tuple(sorted(set(int(role) for role in roles))) if roles else ()
+
+        # Proxies see all of the rows, even the ones not loaded yet (when paging).
+        if notify_proxies and self.__proxies:
+            if not self.__data_changes and not self.__proxy_data_changes:
+                self.__dataChangesQueued.emit()
+            self.__proxy_data_changes.append(
+                (first_row, last_row, first_column, last_column, roles_key)
+            )
+        last_row = min(last_row, self.rowCount() - 1)
+        if first_row > last_row:
+            return
+        if not self.__data_changes and not self.__proxy_data_changes:
+            self.__dataChangesQueued.emit()
+        self.__data_changes.setdefault(roles_key, []).append(
+            (first_row, last_row, first_column, last_column)
+        )
+        self.__data_changed_request_count += 1
+
+    def __queueValueDataChanged(self, action):
+        row = action.locations[0]
+        if row >= self.rowCount():
+            return
+        obj = self.obj()
+        for column, header in enumerate(self.__header_snapshot):
+            roles = header.affected_roles(obj, row, action)
+            if roles is None or roles:
+                self.__queueDataChanged(row, row, column, column, roles=roles)
+
+    def __indexValues(self, row_index, first_row, last_row):
+        obj = self.obj()
+        if obj is None or first_row > last_row:
+            return []
+        if row_index.attribute is not None:
+            getter = attrgetter(row_index.attribute)
+            values = []
+            with read_context(obj.app):
+                for item in self.__row_snapshot[first_row : last_row + 1]:
+                    try:
+                        values.append(getter(item))
+                    except AttributeError:
+                        values.append(None)
+            return values
+        if row_index.column >= len(self.__header_snapshot):
+            return [None] * (last_row - first_row + 1)
+        header = self.__header_snapshot[row_index.column]
+        with self.__readRowSnapshot__():
+            return list(header.data_range(obj, first_row, last_row, row_index.role))
+
+    def __builtIndex(self, row_index):
+        if row_index.dirty:
+            row_index.build(
+                self.__indexValues(row_index, 0, len(self.__row_snapshot) - 1)
+            )
+        return row_index
+
+    def __updateIndexes(self, action):
+        obj = self.obj()
+        change = action.change
+
+        # A value in the list changed, update its row.
+        if action.sender is not obj:
+            if not action.locations:
+                return
+            row = action.locations[0]
+            for row_index in self.__indexes.values():
+                if row_index.dirty:
+                    continue
+                if row_index.attribute is not None:
+                    if (
+                        len(action.locations) == 1
+                        and isinstance(change, Update)
+                        and row_index.attribute not in change.new_values
+                    ):
+                        continue
+                elif row_index.column < len(self.__header_snapshot):
+                    header = self.__header_snapshot[row_index.column]
+                    roles = header.affected_roles(obj, row, action)
+                    if roles is not None and row_index.role not in roles:
+                        continue
+                row_index.update(row, self.__indexValues(row_index, row, row)[0])
+            return
+
+        # Rows changed, update them. Rows inserted, deleted or moved only need values
+        # for the inserted ones. Anything else rebuilds the next time it's used.
+        for row_index in self.__indexes.values():
+            if row_index.dirty:
+                continue
+            if isinstance(change, ListUpdate):
+                values = self.__indexValues(row_index, change.index, change.last_index)
+                for row, value in zip(x_range(change.index, change.stop), values):
+                    row_index.update(row, value)
+            elif isinstance(change, ListInsert):
+                row_index.insert(
+                    change.index,
+                    self.__indexValues(row_index, change.index, change.last_index),
+                )
+            elif isinstance(change, ListDelete):
+                row_index.delete(change.index, change.last_index)
+            elif isinstance(change, ListMove):
+                row_index.move(change.index, change.last_index, change.post_index)
+            else:
+                row_index.dirty = True
+
+    def __updateHeaderIndexes(self):
+        for key in self.__header_index_keys:
+            self.__indexes.pop(key, None)
+        header_index_keys = []
+        for column, header in enumerate(self.__header_snapshot):
+            for role, kind in iteritems(header.indexes()):
+                key = (column, role)
+                self.__indexes[key] = ROW_INDEX_KINDS[kind](column, role, None, True)
+                header_index_keys.append(key)
+        self.__header_index_keys = tuple(header_index_keys)
+
+        # Columns might have changed.
+        for row_index in self.__indexes.values():
+            if row_index.attribute is None:
+                row_index.dirty = True
+
+    def __readRowSnapshot__(self):
+        return snapshot_state(self.obj(), self.__row_snapshot)
+
+    def __sourceIndex__(self, row, column=0):
+        rows = self.__row_snapshot
+        if 0 <= row < len(rows):
+            return self.createIndex(row, column, rows[row])
+        return QtCore.QModelIndex()
+
+    def __addProxy__(self, proxy):
+        self.__proxies.add(proxy)
+
+    def __removeProxy__(self, proxy):
+        self.__proxies.discard(proxy)
+
+    def __updateRowSnapshot(self, change):
+        rows = self.__row_snapshot
+        if isinstance(change, ListInsert):
+            rows[change.index : change.index] = change.new_values
+        elif isinstance(change, ListDelete):
+            del rows[change.index : change.stop]
+        elif isinstance(change, ListUpdate):
+            rows[change.index : change.stop] = change.new_values
+        elif isinstance(change, ListMove):
+            values = rows[change.index : change.stop]
+            del rows[change.index : change.stop]
+            rows[change.post_index : change.post_index] = values
+        else:
+            rows[:] = change.new_state
+
+        # Make sure the snapshot matches the state after the change.
+        if self.__debug_checks and rows != list(change.new_state):
+            error = "row snapshot is out of sync after {}".format(type(change).__name__)
+            raise RuntimeError(error)
+
+    def __invalidateDataCache(self, action):
+        change = action.change
+
+        # A value in the list changed, invalidate its row.
+        if action.sender is not self.obj():
+            if action.locations:
+                self.__data_cache.pop(action.locations[0], None)
+            return
+
+        # Rows changed, invalidate them and shift the ones after.
+        if isinstance(change, ListUpdate):
+            for row in range(change.index, change.last_index + 1):
+                self.__data_cache.pop(row, None)
+            return
+        remap = _row_remap(change)
+        if remap is None:
+            self.clearDataCache()
+            return
+
+        data_cache = OrderedDict()
+        for row, row_cache in iteritems(self.__data_cache):
+            row = remap(row)
+            if row is not None:
+                data_cache[row] = row_cache
+        self.__data_cache = data_cache
+
+    def __clearAsyncData(self):
+        self.__async_data.clear()
+        self.__async_discard_count += len(self.__async_requests)
+        self.__async_requests.clear()
+        self.__async_request_keys.clear()
+        self.__async_queue.clear()
+
+    def __invalidateAsyncData(self, action):
+        obj = self.obj()
+        change = action.change
+        async_data = self.__async_data
+
+        # A value in the list changed, mark its data as stale (unless not affected).
+        if action.sender is not obj:
+            if action.locations:
+                self.__staleAsyncRows((action.locations[0],), action=action)
+            return
+
+        # Rows changed, mark their data as stale.
+        if isinstance(change, ListUpdate):
+            self.__staleAsyncRows(set(x_range(change.index, change.stop)))
+            return
+
+        # Rows shifted, remap data and requests.
+        remap = _row_remap(change)
+        if remap is None:
+            self.__clearAsyncData()
+            return
+        remapped_data = {}
+        for row, row_data in iteritems(async_data):
+            row = remap(row)
+            if row is not None:
+                remapped_data[row] = row_data
+        self.__async_data = remapped_data
+        remapped_requests = {}
+        for token, (row, column, role) in iteritems(self.__async_requests):
+            row = remap(row)
+            if row is None:
+                self.__async_discard_count += 1
+            else:
+                remapped_requests[token] = (row, column, role)
+        self.__async_requests = remapped_requests
+        self.__async_request_keys = dict(
+            (key, token) for token, key in iteritems(remapped_requests)
+        )
+
+    def __staleAsyncRows(self, rows, action=None):
+        obj = self.obj()
+        header_snapshot = self.__header_snapshot
+        affected_roles = {}
+
+        def is_affected(row, column, role):
+            if action is None:
+                return True
+            if column not in affected_roles:
+                header = header_snapshot[column]
+                affected_roles[column] = header.affected_roles(obj, row, action)
+            roles = affected_roles[column]
+            return roles is None or role in roles
+
+        # Keep stale data until it's computed again.
+        async_data = self.__async_data
+        for row in rows:
+            for (column, role), entry in iteritems(async_data.get(row, {})):
+                if is_affected(row, column, role):
+                    entry[1] = False
+
+        # Results of pending requests will be discarded.
+        for key in [k for k in self.__async_request_keys if k[0] in rows]:
+            if is_affected(*key):
+                del self.__async_requests[self.__async_request_keys.pop(key)]
+                self.__async_discard_count += 1
+
+    def __asyncData(self, header, row, column, role):
+        row_data = self.__async_data.get(row)
+        entry = row_data.get((column, role)) if row_data else None
+        if entry is not None and entry[1]:
+            return entry[0]
+
+        # Request it, unless already requested.
+        key = (row, column, role)
+        if key not in self.__async_request_keys:
+            token = object()
+            self.__async_requests[token] = key
+            self.__async_request_keys[key] = token
+            with self.__readRowSnapshot__():
+                snapshot = header.snapshot(self.obj(), row)
+            self.__async_queue.append((token, header, snapshot, role))
+            self.__startAsyncData()
+
+        # Keep previous data until it's computed again.
+        if entry is not None:
+            return entry[0]
+        if role == QtCore.Qt.DisplayRole:
+            return header.placeholder
+        return None
+
+    def __startAsyncData(self):
+        queue = self.__async_queue
+        thread_pool = None
+        while queue and self.__async_in_flight_count < self.__async_limit:
+
+            # Most recent requests first, skipping discarded ones.
+            token, header, snapshot, role = queue.pop()
+            if token not in self.__async_requests:
+                continue
+            if thread_pool is None:
+                thread_pool = QtCore.QThreadPool.globalInstance()
+            runnable = _ComputeData(
+                self.__asyncDataComputed, token, header, snapshot, role
+            )
+            self.__async_in_flight_count += 1
+            thread_pool.start(runnable)
+
+    @QtCore.Slot(object, object)
+    def __asyncDataComputedSlot__(self, token, value):
+        self.__async_in_flight_count -= 1
+        key = self.__async_requests.pop(token, None)
+        if key is not None:
+            row, column, role = key
+            del self.__async_request_keys[key]
+            self.__async_data.setdefault(row, {})[(column, role)] = [value, True]
+            self.__queueDataChanged(
+                row, row, column, column, roles=(role,), notify_proxies=True
+            )
+        self.__startAsyncData()
+
+    def _onHeadersObjChanged(self, obj, old_obj, phase):
+        """
+        **virtual method**
+
+        Called when the headers object changes.
+
+        This method is called *before* the
+        :attr:`objettoqt.models.OQListModel.headersObjChanged` signal gets emitted.
+
+        :param obj: New headers list object (or None).
+        :type obj: objetto.objects.ListObject or None
+
+        :param old_obj: Old headers list object (or None).
+        :type old_obj: objetto.objects.ListObject or None
+
+        :param phase: Phase.
+        :type phase: objetto.bases.Phase
+        """
+
+    def _onHeadersActionReceived(self, action, phase):
+        """
+        **virtual method**
+
+        Called when an action is received from the headers object.
+
+        This method is called *before* the
+        :attr:`objettoqt.models.OQListModel.headersActionReceived` signal gets emitted.
+
+        :param action: Action.
+        :type action: objetto.objects.Action
+
+        :param phase: Phase.
+        :type phase: objetto.bases.Phase
+        """
+
+    def headersObj(self):
+        """
+        **final method**
+
+        Get the headers object being observed.
+
+        :return: Headers object being observed.
+        :rtype: objetto.objects.ListObject
+        """
+        return self.__headers.obj()
+
+    def setHeadersObj(self, obj):
+        """
+        **final method**
+
+        Set the headers object to observe.
+
+        :param obj: Headers object to observe (or None for default).
+        :type obj: objetto.objects.ListObject or None
+        """
+        if obj is None:
+            self.__headers.setObj(self.__default_headers_obj)
+        else:
+            with ReraiseContext(TypeError, "'obj' parameter"):
+                assert_is_instance(obj, ListObject)
+            for header in obj:
+                with ReraiseContext(TypeError, "'obj' parameter contents"):
+                    assert_is_instance(header, AbstractListModelHeader)
+            self.__headers.setObj(obj)
+
+    def headersObjToken(self):
+        """
+        **final method**
+
+        Get the subscriber token for the headers object.
+
+        :return: Subscriber token for the headers object (or None).
+        :rtype: objettoqt.mixins.SubscriberToken or None
+        """
+        return self.__headers.objToken()
+
+    def headers(self):
+        """
+        **final method**
+
+        Get headers.
+
+        :return: Headers.
+        :rtype: tuple[objettoqt.models.AbstractListModelHeader]
+        """
+        return tuple(self.__headers.obj())
+
+    def setHeaders(self, headers=None):
+        """
+        **final method**
+
+        Set headers.
+
+        :param headers: Headers (or None for default).
+        :type headers: collections.abc.Iterable[\
+objettoqt.models.AbstractListModelHeader or str] or None
+        """
+        filtered_headers = []
+        for header in headers or ():
+            if isinstance(header, string_types):
+                header = ListModelHeader(title=header)
+            else:
+                with ReraiseContext(TypeError, "'headers' parameter contents"):
+                    assert_is_instance(header, (AbstractListModelHeader, string_types))
+            filtered_headers.append(header)
+        if filtered_headers:
+            headers_obj = type(self).__default_headers_cls(
+                Application(), filtered_headers or (ListModelHeader(),)
+            )
+        else:
+            headers_obj = self.__default_headers_obj
+        self.__headers.setObj(headers_obj)
+
+    def renderPass(self):
+        """
+        Get a context manager for a render pass (painting, size hints, etc).
+
+        A single read context is entered for the list and the headers objects for
+        the duration of the pass, and their states are only read once.
+
+        :return: Render pass context manager.
+        :rtype: contextlib.AbstractContextManager
+        """
+        obj = self.obj()
+        return render_pass(obj.app if obj is not None else None, self.headersObj().app)
+
+    def index(self, row, column=0, parent=QtCore.QModelIndex(), *args, **kwargs):
+        """
+        Get index.
+
+        :param row: Row.
+        :type row: int
+
+        :param column: Column.
+        :type column: int
+
+        :param parent: Parent index.
+        :type parent: QtCore.QModelIndex
+
+        :return: Index.
+        :rtype: QtCore.QModelIndex
+        """
+        if not parent.isValid() and row < self.rowCount():
+            return self.__sourceIndex__(row, column)
+        return QtCore.QModelIndex()
+
+    def parent(self, index=QtCore.QModelIndex(), *args, **kwargs):
+        """
+        Get invalid parent index (no valid parent indexes in a list model).
+
+        :return: Invalid parent index.
+        :rtype: QtCore.QModelIndex
+        """
+        return QtCore.QModelIndex()
+
+    def headerData(
+        self,
+        column=None,
+        orientation=QtCore.Qt.Horizontal,
+        role=QtCore.Qt.DisplayRole,
+        *args,
+        **kwargs
+    ):
+        """
+        Get header data.
+
+        :param column: Column.
+        :type column: int or None
+
+        :param orientation: Orientation.
+        :type orientation: QtCore.Qt.Orientation
+
+        :param role: Role.
+        :type role: QtCore.Qt.ItemDataRole
+
+        :return: Header data.
+        """
+        if orientation == QtCore.Qt.Horizontal:
+            headers = self.__header_snapshot
+            if column is None:
+                if headers:
+                    column = 0
+                else:
+                    return None
+            if role == QtCore.Qt.DisplayRole:
+                return headers[column].title.capitalize()
+            elif role == QtCore.Qt.UserRole:
+                return headers[column]
+
+    def columnCount(self, *args, **kwargs):
+        """
+        Get column count.
+
+        :return: Column count.
+        :rtype: int
+        """
+        return len(self.__header_snapshot)
+
+    def rowCount(self, parent=QtCore.QModelIndex(), *args, **kwargs):
+        """
+        Get value count (row count).
+
+        :return: Value count (row count).
+        :rtype: int
+        """
+        if self.__loaded_row_count is not None:
+            return self.__loaded_row_count
+        return len(self.__row_snapshot)
 
-    def __onHeadersObjChanged__(self, obj, old_obj, phase):
-        if False and obj:  # for PyCharm
+    def canFetchMore(self, parent=QtCore.QModelIndex()):
+        """
+        Get whether there are more rows to load (when paging).
+
+        :param parent: Parent index.
+        :type parent: QtCore.QModelIndex
+
+        :return: True if can fetch more.
+        :rtype: bool
+        """
+        if parent.isValid() or self.__loaded_row_count is None:
+            return False
+        return self.__loaded_row_count < len(self.__row_snapshot)
+
+    def fetchMore(self, parent=QtCore.QModelIndex()):
+        """
+        Load the next page of rows (when paging).
+
+        :param parent: Parent index.
+        :type parent: QtCore.QModelIndex
+        """
+        if not self.canFetchMore(parent):
+            return
+        first_row = self.__loaded_row_count
+        last_row = min(len(self.__row_snapshot), first_row + self.__page_size) - 1
+        self.beginInsertRows(QtCore.QModelIndex(), first_row, last_row)
+        self.__loaded_row_count = last_row + 1
+        self.endInsertRows()
+
+    def pageSize(self):
+        """
+        **final method**
+
+        Get page size.
+
+        :return: Page size (or None if paging is disabled).
+        :rtype: int or None
+        """
+        return self.__page_size
+
+    def setPageSize(self, size=None):
+        """
+        **final method**
+
+        Set page size.
+
+        When paging, only the first rows are reported to views, which load more
+        pages by calling :meth:`objettoqt.models.OQListModel.fetchMore` while
+        scrolling. Changes to rows that were not loaded yet don't emit any signals.
+
+        :param size: Page size (or None to disable paging).
+        :type size: int or None
+
+        :raises ValueError: Size is lower than 1.
+        """
+        if size is not None:
+            size = int(size)
+            if size < 1:
+                error = "page size must be 1 or higher, got {}".format(size)
+                raise ValueError(error)
+        if size == self.__page_size:
+            return
+        self.__endBulkChange()
+        self.beginResetModel()
+        self.__page_size = size
+        if size is None:
+            self.__loaded_row_count = None
+        else:
+            self.__loaded_row_count = min(len(self.__row_snapshot), size)
+        self.endResetModel()
+
+    def flags(self, index=QtCore.QModelIndex(), *args, **kwargs):
+        """
+        Get flags.
+
+        :param index: Index.
+        :type index: QtCore.QModelIndex
+
+        :return: Flags.
+        :rtype: QtCore.Qt.ItemFlag
+        """
+        obj = self.obj()
+        if obj is None:
+            return QtCore.Qt.NoItemFlags
+
+        row = index.row()
+        column = index.column()
+
+        header = self.__header_snapshot[column]
+        with self.__readRowSnapshot__():
+            flags = header.flags(obj, row)
+
+        if hasattr(QtCore.Qt, "ItemNeverHasChildren"):
+            flags |= QtCore.Qt.ItemNeverHasChildren
+
+        mime_type = self.mimeType()
+        if mime_type:
+            flags |= QtCore.Qt.ItemIsDragEnabled | QtCore.Qt.ItemIsDropEnabled
+
+        return flags
+
+    def data(self, index=QtCore.QModelIndex(), role=QtCore.Qt.DisplayRole):
+        """
+        Get data.
+
+        :param index: Index.
+        :type index: QtCore.QModelIndex
+
+        :param role: Role.
+        :type role: QtCore.Qt.ItemDataRole
+
+        :return: Data.
+        """
+        obj = self.obj()
+        if obj is None:
+            return
+        row = index.row()
+        column = index.column()
+
+        # Data computed in worker threads.
+        header = self.__header_snapshot[column]
+        if isinstance(header, AsyncListModelHeader) and role in header.async_roles():
+            return self.__asyncData(header, row, column, role)
+
+        # Not caching, or paused and actions that would invalidate it are pending.
+        data_cache = self.__data_cache
+        if data_cache is None or self.isObservationPaused():
+            with self.__readRowSnapshot__():
+                return header.data(obj, row, role)
+
+        # Get row cache, marking it as the most recently used.
+        key = (column, role)
+        row_cache = data_cache.pop(row, None)
+        if row_cache is None:
+            row_cache = {}
+        data_cache[row] = row_cache
+
+        # Hit.
+        try:
+            value = row_cache[key]
+        except KeyError:
             pass
+        else:
+            self.__data_cache_hit_count += 1
+            return value
+
+        # Miss, get data for the range of rows around it in one call.
+        self.__data_cache_miss_count += 1
+        header = self.__header_snapshot[column]
+        range_size = min(_DATA_RANGE_SIZE, self.__data_cache_size)
+        first_row = row - row % range_size
+        last_row = min(first_row + range_size, len(self.__row_snapshot)) - 1
+        if not first_row <= row <= last_row:
+            with self.__readRowSnapshot__():
+                value = row_cache[key] = header.data(obj, row, role)
+        else:
+            with self.__readRowSnapshot__():
+                values = header.data_range(obj, first_row, last_row, role)
+            for range_row, range_value in zip(x_range(first_row, last_row + 1), values):
+                range_row_cache = data_cache.get(range_row)
+                if range_row_cache is None:
+                    range_row_cache = data_cache[range_row] = {}
+                range_row_cache.setdefault(key, range_value)
+            value = row_cache[key] = values[row - first_row]
+
+            # Keep the row that was asked for as the most recently used.
+            data_cache[row] = data_cache.pop(row)
+
+        # Evict least recently used rows.
+        while len(data_cache) > self.__data_cache_size:
+            data_cache.popitem(last=False)
+        return value
+
+    def itemData(self, index=QtCore.QModelIndex()):
+        """
+        Get data for all standard roles at once.
 
-        # Reset model.
-        if old_obj is not None:
-            if phase is PRE:
-                self.beginResetModel()
-            elif phase is POST:
-                self.endResetModel()
+        :param index: Index.
+        :type index: QtCore.QModelIndex
 
-    def __onHeadersActionReceived__(self, action, phase):
+        :return: Data per role (roles without data are omitted).
+        :rtype: dict[int, Any]
+        """
+        roles_data = self.__rolesData(index, _ITEM_DATA_ROLES)
+        return dict(
+            (int(role), value)
+            for role, value in iteritems(roles_data)
+            if value is not None
+        )
 
-        # The headers changed.
-        if action.sender is self.__headers.obj():
+    def multiData(self, index, role_data_span):
+        """
+        Fill data for multiple roles at once.
+        Only called by bindings that expose it (`Qt` 6).
 
-            # Insert columns.
-            if isinstance(action.change, ListInsert):
-                if phase is PRE:
-                    self.beginInsertColumns(
-                        QtCore.QModelIndex(),
-                        action.change.index,
-                        action.change.last_index,
-                    )
-                elif phase is POST:
-                    self.endInsertColumns()
+        :param index: Index.
+        :type index: QtCore.QModelIndex
 
-            # Delete columns.
-            elif isinstance(action.change, ListDelete):
-                if phase is PRE:
-                    self.beginRemoveColumns(
-                        QtCore.QModelIndex(),
-                        action.change.index,
-                        action.change.last_index,
-                    )
-                if phase is POST:
-                    self.endRemoveColumns()
+        :param role_data_span: Role data span.
+        :type role_data_span: QtCore.QModelRoleDataSpan
+        """
+        roles_data = self.__rolesData(
+            index, [role_data.role() for role_data in role_data_span]
+        )
+        for role_data in role_data_span:
+            role_data.setData(roles_data.get(role_data.role()))
 
-            # Move columns.
-            elif isinstance(action.change, ListMove):
-                if phase is PRE:
-                    self.beginMoveColumns(
-                        QtCore.QModelIndex(),
-                        action.change.index,
-                        action.change.last_index,
-                        QtCore.QModelIndex(),
-                        action.change.target_index,
-                    )
-                if phase is POST:
-                    self.endMoveColumns()
+    def __rolesData(self, index, roles):
+        obj = self.obj()
+        if obj is None or not index.isValid():
+            return {}
+        row = index.row()
+        column = index.column()
+        header = self.__header_snapshot[column]
+
+        # Data computed in worker threads.
+        if isinstance(header, AsyncListModelHeader):
+            return dict((role, self.data(index, role)) for role in roles)
+
+        # Not caching, or paused and actions that would invalidate it are pending.
+        data_cache = self.__data_cache
+        if data_cache is None or self.isObservationPaused():
+            with self.__readRowSnapshot__():
+                return header.roles_data(obj, row, roles)
+
+        # Get row cache, marking it as the most recently used.
+        row_cache = data_cache.pop(row, None)
+        if row_cache is None:
+            row_cache = {}
+        data_cache[row] = row_cache
+
+        # Hits.
+        roles_data = {}
+        missing_roles = []
+        for role in roles:
+            try:
+                roles_data[role] = row_cache[(column, role)]
+            except KeyError:
+                missing_roles.append(role)
+        self.__data_cache_hit_count += len(roles_data)
+
+        # Misses, get data for all of them in one call.
+        if missing_roles:
+            self.__data_cache_miss_count += len(missing_roles)
+            with self.__readRowSnapshot__():
+                missing_roles_data = header.roles_data(obj, row, missing_roles)
+            for role in missing_roles:
+                value = roles_data[role] = missing_roles_data.get(role)
+                row_cache[(column, role)] = value
+
+            # Evict least recently used rows.
+            while len(data_cache) > self.__data_cache_size:
+                data_cache.popitem(last=False)
+
+        return roles_data
+
+    def match(
+        self,
+        start,
+        role,
+        value,
+        hits=1,
+        flags=QtCore.Qt.MatchStartsWith | QtCore.Qt.MatchWrap,
+    ):
+        """
+        Find indexes in the start's column which data for a role matches a value.
 
-            # Change columns.
-            elif isinstance(action.change, ListUpdate):
-                if phase is POST:
-                    self.headerDataChanged.emit(
-                        QtCore.Qt.Horizontal,
-                        action.change.index,
-                        action.change.last_index,
-                    )
-                    obj_count = len(self.obj() or ())
-                    if obj_count:
-                        self.dataChanged.emit(
-                            self.index(
-                                0,
-                                action.change.index,
-                                QtCore.QModelIndex(),
-                            ),
-                            self.index(
-                                obj_count - 1,
-                                action.change.last_index,
-                                QtCore.QModelIndex(),
-                            ),
-                        )
+        Uses an index kept for the column and role (see
+        :meth:`objettoqt.models.OQListModel.addIndex`), if there's one that supports
+        the flags: a hash or sorted index for :attr:`QtCore.Qt.MatchExactly` and
+        :attr:`QtCore.Qt.MatchFixedString`, and a sorted index for
+        :attr:`QtCore.Qt.MatchStartsWith`. Case insensitive matches require a case
+        insensitive index. Otherwise, goes through every row.
 
-    def _onHeadersObjChanged(self, obj, old_obj, phase):
+        :param start: Start index.
+        :type start: QtCore.QModelIndex
+
+        :param role: Role.
+        :type role: QtCore.Qt.ItemDataRole
+
+        :param value: Value.
+
+        :param hits: Maximum number of matches (or -1 for all).
+        :type hits: int
+
+        :param flags: Match flags.
+        :type flags: QtCore.Qt.MatchFlag
+
+        :return: Matching indexes.
+        :rtype: list[QtCore.QModelIndex]
         """
-        **virtual method**
+        flags_value = _flags_value(flags)
+        rows = self.__matchRows(start.column(), role, value, flags_value)
+        if rows is None:
+            return super(OQListModel, self).match(start, role, value, hits, flags)
+
+        # Start from the start row, wrapping around if needed.
+        row_count = self.rowCount()
+        start_row = start.row()
+        ordered_rows = [r for r in rows if start_row <= r < row_count]
+        if flags_value & _flags_value(QtCore.Qt.MatchWrap):
+            ordered_rows.extend(r for r in rows if r < start_row)
+        if hits != -1:
+            ordered_rows = ordered_rows[:hits]
+        return [self.index(r, start.column()) for r in ordered_rows]
+
+    def __matchRows(self, column, role, value, flags):
+        match_type = flags & 0x0F
+        case_sensitive = bool(flags & _flags_value(QtCore.Qt.MatchCaseSensitive))
+        if match_type == _flags_value(QtCore.Qt.MatchExactly):
+            case_sensitive = True
+        elif match_type not in (
+            _flags_value(QtCore.Qt.MatchFixedString),
+            _flags_value(QtCore.Qt.MatchStartsWith),
+        ) or not isinstance(value, string_types):
+            return None
+        prefix = match_type == _flags_value(QtCore.Qt.MatchStartsWith)
+        if flags & _flags_value(QtCore.Qt.MatchRecursive):
+            return None
 
-        Called when the headers object changes.
+        # Find an index that supports it.
+        for row_index in self.__indexes.values():
+            if (
+                row_index.attribute is None
+                and row_index.column == column
+                and row_index.role == role
+                and (case_sensitive or not row_index.case_sensitive)
+                and (not prefix or hasattr(row_index, "find_prefix"))
+            ):
+                break
+        else:
+            return None
+        row_index = self.__builtIndex(row_index)
+        if prefix:
+            rows = row_index.find_prefix(value)
+        else:
+            rows = row_index.find(value)
 
-        This method is called *before* the
-        :attr:`objettoqt.models.OQListModel.headersObjChanged` signal gets emitted.
+        # Filter out case insensitive candidates.
+        if case_sensitive and not row_index.case_sensitive:
+            values = self.__indexValues
+            if prefix:
+                rows = [r for r in rows if values(row_index, r, r)[0].startswith(value)]
+            else:
+                rows = [r for r in rows if values(row_index, r, r)[0] == value]
+        return rows
 
-        :param obj: New headers list object (or None).
-        :type obj: objetto.objects.ListObject or None
+    def addIndex(
+        self,
+        key,
+        column=0,
+        role=QtCore.Qt.DisplayRole,
+        attribute=None,
+        kind="hash",
+        case_sensitive=True,
+    ):
+        """
+        **final method**
 
-        :param old_obj: Old headers list object (or None).
-        :type old_obj: objetto.objects.ListObject or None
+        Add (or replace) an index of row values, used by
+        :meth:`objettoqt.models.OQListModel.findRows` and
+        :meth:`objettoqt.models.OQListModel.match`.
 
-        :param phase: Phase.
-        :type phase: objetto.bases.Phase
+        Values are either the data for a column and role, or an attribute of the
+        items. A hash index finds values in constant time, a sorted index finds
+        values and string prefixes in logarithmic time (only numbers and strings are
+        indexed). Indexes are patched as rows are inserted, deleted, moved or updated
+        (only getting values for new and updated rows), and rebuilt the next time
+        they are used after the list is reset.
+
+        :param key: Key.
+        :type key: collections.abc.Hashable
+
+        :param column: Column.
+        :type column: int
+
+        :param role: Role.
+        :type role: QtCore.Qt.ItemDataRole
+
+        :param attribute: Name of the items' attribute (instead of column and role).
+        :type attribute: str or None
+
+        :param kind: Index kind, `'hash'` or `'sorted'`.
+        :type kind: str
+
+        :param case_sensitive: Whether strings are case sensitive.
+        :type case_sensitive: bool
+
+        :raises ValueError: Invalid kind.
+        """
+        try:
+            row_index_cls = ROW_INDEX_KINDS[kind]
+        except KeyError:
+            error = "invalid index kind {!r}, expected one of {}".format(
+                kind, ", ".join(repr(k) for k in sorted(ROW_INDEX_KINDS))
+            )
+            raise ValueError(error)
+        self.__indexes[key] = row_index_cls(
+            column, role, attribute, bool(case_sensitive)
+        )
+
+    def removeIndex(self, key):
         """
+        **final method**
 
-    def _onHeadersActionReceived(self, action, phase):
+        Remove an index of row values.
+
+        :param key: Key.
+        :type key: collections.abc.Hashable
+
+        :raises KeyError: No index with that key.
         """
-        **virtual method**
+        del self.__indexes[key]
 
-        Called when an action is received from the headers object.
+    def indexKeys(self):
+        """
+        **final method**
 
-        This method is called *before* the
-        :attr:`objettoqt.models.OQListModel.headersActionReceived` signal gets emitted.
+        Get the keys of the indexes of row values (including the ones declared by
+        headers).
 
-        :param action: Action.
-        :type action: objetto.objects.Action
+        :return: Keys.
+        :rtype: list[collections.abc.Hashable]
+        """
+        return list(self.__indexes)
+
+    def findRows(self, key, value):
+        """
+        **final method**
+
+        Find the rows of the list object with a value, using an index.
+
+        :param key: Index key.
+        :type key: collections.abc.Hashable
+
+        :param value: Value.
+
+        :return: Rows (sorted).
+        :rtype: list[int]
+
+        :raises KeyError: No index with that key.
+        """
+        return self.__builtIndex(self.__indexes[key]).find(value)
+
+    def asyncDataLimit(self):
+        """
+        **final method**
+
+        Get the maximum number of computations for asynchronous headers running in
+        worker threads at once.
+
+        :return: Async data limit.
+        :rtype: int
+        """
+        return self.__async_limit
+
+    def setAsyncDataLimit(self, limit):
+        """
+        **final method**
+
+        Set the maximum number of computations for asynchronous headers (see
+        :class:`objettoqt.models.AsyncListModelHeader`) running in worker threads at
+        once. Other requests wait, most recent first.
+
+        :param limit: Async data limit.
+        :type limit: int
+
+        :raises ValueError: Limit is lower than 1.
+        """
+        limit = int(limit)
+        if limit < 1:
+            error = "async data limit must be 1 or higher, got {}".format(limit)
+            raise ValueError(error)
+        self.__async_limit = limit
+        self.__startAsyncData()
+
+    def asyncDataInFlightCount(self):
+        """
+        **final method**
+
+        Get the number of computations for asynchronous headers running in worker
+        threads.
+
+        :return: Async data in flight count.
+        :rtype: int
+        """
+        return self.__async_in_flight_count
+
+    def asyncDataDiscardCount(self):
+        """
+        **final method**
+
+        Get how many requests for data of asynchronous headers were discarded because
+        their rows changed (or the model was reset) before results arrived.
+
+        :return: Async data discard count.
+        :rtype: int
+        """
+        return self.__async_discard_count
+
+    def debugChecks(self):
+        """
+        **final method**
+
+        Get whether debug checks are enabled.
+
+        :return: True if enabled.
+        :rtype: bool
+        """
+        return self.__debug_checks
+
+    def setDebugChecks(self, debug_checks):
+        """
+        **final method**
+
+        Set whether debug checks are enabled.
 
-        :param phase: Phase.
-        :type phase: objetto.bases.Phase
+        The model keeps a snapshot of the rows that is updated from the list changes
+        it receives, which is used by :meth:`objettoqt.models.OQListModel.index`
+        and :meth:`objettoqt.models.OQListModel.rowCount`. When enabled, the
+        snapshot is compared against the state after every change, raising a
+        :class:`RuntimeError` if they are out of sync.
+
+        :param debug_checks: True to enable.
+        :type debug_checks: bool
         """
+        self.__debug_checks = bool(debug_checks)
 
-    def headersObj(self):
+    def dataCacheSize(self):
         """
         **final method**
 
-        Get the headers object being observed.
+        Get the maximum number of rows to cache data for.
 
-        :return: Headers object being observed.
-        :rtype: objetto.objects.ListObject
+        :return: Maximum number of rows (or None if not caching).
+        :rtype: int or None
         """
-        return self.__headers.obj()
+        return self.__data_cache_size
 
-    def setHeadersObj(self, obj):
+    def setDataCacheSize(self, size=None):
         """
         **final method**
 
-        Set the headers object to observe.
+        Set the maximum number of rows to cache data for.
 
-        :param obj: Headers object to observe (or None for default).
-        :type obj: objetto.objects.ListObject or None
+        When caching, values returned by the headers' `data` method are kept per
+        row, column and role, and the least recently used rows are evicted when
+        over the limit. On a miss, data for the surrounding rows is retrieved in a
+        single call to the header's `data_range` method. Rows are invalidated as
+        list changes are received (rows after inserted, deleted or moved ones are
+        shifted instead) and when any of the values in the list sends an action.
+        Any change to the headers clears the cache.
+
+        Only use it with headers whose data solely depends on the values in the
+        list, or call :meth:`objettoqt.models.OQListModel.clearDataCache` when
+        anything else they depend on changes.
+
+        :param size: Maximum number of rows (or None to not cache).
+        :type size: int or None
+
+        :raises ValueError: Size is lower than 1.
         """
-        if obj is None:
-            self.__headers.setObj(self.__default_headers_obj)
+        if size is not None:
+            size = int(size)
+            if size < 1:
+                error = "data cache size must be 1 or higher, got {}".format(size)
+                raise ValueError(error)
+        self.__data_cache_size = size
+        if size is None:
+            self.__data_cache = None
+        elif self.__data_cache is None:
+            self.__data_cache = OrderedDict()
         else:
-            with ReraiseContext(TypeError, "'obj' parameter"):
-                assert_is_instance(obj, ListObject)
-            for header in obj:
-                with ReraiseContext(TypeError, "'obj' parameter contents"):
-                    assert_is_instance(header, AbstractListModelHeader)
-            self.__headers.setObj(obj)
+            while len(self.__data_cache) > size:
+                self.__data_cache.popitem(last=False)
 
-    def headersObjToken(self):
+    def clearDataCache(self):
         """
         **final method**
 
-        Get the action observer token for the headers object.
-
-        :return: Action observer token for the headers object.
-        :rtype: objetto.observers.ActionObserverToken
+        Clear cached data.
         """
-        return self.__headers.objToken()
+        if self.__data_cache:
+            self.__data_cache = OrderedDict()
 
-    def headers(self):
+    def dataCacheHitCount(self):
         """
         **final method**
 
-        Get headers.
+        Get how many times data was retrieved from the cache.
 
-        :return: Headers.
-        :rtype: tuple[objettoqt.models.AbstractListModelHeader]
+        :return: Hit count.
+        :rtype: int
         """
-        return tuple(self.__headers.obj())
+        return self.__data_cache_hit_count
 
-    def setHeaders(self, headers=None):
+    def dataCacheMissCount(self):
         """
         **final method**
 
-        Set headers.
+        Get how many times data had to be retrieved from the headers while caching.
 
-        :param headers: Headers (or None for default).
-        :type headers: collections.abc.Iterable[\
-objettoqt.models.AbstractListModelHeader or str] or None
+        :return: Miss count.
+        :rtype: int
         """
-        filtered_headers = []
-        for header in headers or ():
-            if isinstance(header, string_types):
-                header = ListModelHeader(title=header)
-            else:
-                with ReraiseContext(TypeError, "'headers' parameter contents"):
-                    assert_is_instance(header, (AbstractListModelHeader, string_types))
-            filtered_headers.append(header)
-        if filtered_headers:
-            headers_obj = type(self).__default_headers_cls(
-                Application(), filtered_headers or (ListModelHeader(),)
-            )
-        else:
-            headers_obj = self.__default_headers_obj
-        self.__headers.setObj(headers_obj)
+        return self.__data_cache_miss_count
 
-    def index(self, row, column=0, parent=QtCore.QModelIndex(), *args, **kwargs):
+    def queueDataChanged(
+        self, first_row, last_row, first_column=0, last_column=None, roles=None
+    ):
         """
-        Get index.
+        **final method**
 
-        :param row: Row.
-        :type row: int
+        Queue a data change for a range of items, to be emitted along with other
+        pending data changes. Cached data for the rows is discarded, and attached
+        :class:`objettoqt.models.OQSortFilterListModel` proxies signal it too (after
+        sorting and filtering the rows again).
 
-        :param column: Column.
-        :type column: int
+        :param first_row: First row.
+        :type first_row: int
 
-        :param parent: Parent index.
-        :type parent: QtCore.QModelIndex
+        :param last_row: Last row (inclusive).
+        :type last_row: int
 
-        :return: Index.
-        :rtype: QtCore.QModelIndex
+        :param first_column: First column.
+        :type first_column: int
+
+        :param last_column: Last column (inclusive, or None for the last one).
+        :type last_column: int or None
+
+        :param roles: Affected roles (or None for all roles).
+        :type roles: collections.abc.Iterable[QtCore.Qt.ItemDataRole] or None
         """
-        if not parent.isValid():
-            obj = self.obj()
-            if obj is not None and 0 <= row < len(obj):
-                return self.createIndex(row, column, self.obj()[row])
-        return QtCore.QModelIndex()
+        data_cache = self.__data_cache
+        if data_cache:
+            for row in x_range(first_row, last_row + 1):
+                data_cache.pop(row, None)
+        self.__queueDataChanged(
+            first_row,
+            last_row,
+            first_column,
+            last_column,
+            roles,
+            notify_proxies=True,
+        )
 
-    def parent(self, index=QtCore.QModelIndex(), *args, **kwargs):
+    def flushDataChanges(self):
         """
-        Get invalid parent index (no valid parent indexes in a list model).
+        **final method**
 
-        :return: Invalid parent index.
-        :rtype: QtCore.QModelIndex
+        Emit pending data changes now, instead of on the next event loop iteration.
+
+        Ranges queued for the same roles are merged when their rows overlap or are
+        adjacent, and a single `dataChanged` signal is emitted for each merged range.
+        Attached :class:`objettoqt.models.OQSortFilterListModel` proxies are notified
+        of ranges queued with :meth:`objettoqt.models.OQListModel.queueDataChanged`
+        or for data computed by asynchronous headers, so they can signal them (and
+        sort/filter the rows again).
         """
-        return QtCore.QModelIndex()
+        data_changes = self.__data_changes
+        if self.__bulk_change is not None:
+            return
+        if not data_changes and not self.__proxy_data_changes:
+            return
+        pending = sorted(iteritems(data_changes))
+        data_changes.clear()
+        proxy_data_changes = self.__proxy_data_changes
+        self.__proxy_data_changes = []
+        for roles, ranges in pending:
+            ranges.sort()
+            merged = []
+            for first_row, last_row, first_column, last_column in ranges:
+                if merged and first_row <= merged[-1][1] + 1:
+                    previous = merged[-1]
+                    merged[-1] = (
+                        previous[0],
+                        max(previous[1], last_row),
+                        min(previous[2], first_column),
+                        max(previous[3], last_column),
+                    )
+                else:
+                    merged.append((first_row, last_row, first_column, last_column))
+            for first_row, last_row, first_column, last_column in merged:
+                self.__data_changed_emit_count += 1
+                self.dataChanged.emit(
+                    self.index(first_row, first_column, QtCore.QModelIndex()),
+                    self.index(last_row, last_column, QtCore.QModelIndex()),
+                    list(roles),
+                )
+
+        # Notify proxies of changes that didn't come from actions (they handle those).
+        for proxy in list(self.__proxies):
+            for data_change in proxy_data_changes:
+                proxy.__onSourceDataChanged__(*data_change)
+
+    def resetThreshold(self):
+        """
+        **final method**
 
-    def headerData(
-        self,
-        column=None,
-        orientation=QtCore.Qt.Horizontal,
-        role=QtCore.Qt.DisplayRole,
-        *args,
-        **kwargs
-    ):
+        Get the row count over which row changes fall back to a reset or a layout
+        change.
+
+        :return: Reset threshold (or None if disabled).
+        :rtype: int or None
         """
-        Get header data.
+        return self.__reset_threshold
 
-        :param column: Column.
-        :type column: int or None
+    def setResetThreshold(self, threshold=None):
+        """
+        **final method**
 
-        :param orientation: Orientation.
-        :type orientation: QtCore.Qt.Orientation
+        Set the row count over which row changes fall back to a reset or a layout
+        change.
 
-        :param role: Role.
-        :type role: QtCore.Qt.ItemDataRole
+        When a single insertion, deletion or move, or all of them since the last
+        event loop iteration, affect more rows than the threshold, a reset or a
+        layout change (see :meth:`objettoqt.models.OQListModel.setResetPolicy`) is
+        started instead of signaling rows. It ends on the next event loop iteration,
+        so any further row changes until then are covered by it.
+        Doesn't apply when paging.
 
-        :return: Header data.
+        :param threshold: Row count (or None to disable).
+        :type threshold: int or None
+
+        :raises ValueError: Threshold is lower than 1.
         """
-        if orientation == QtCore.Qt.Horizontal:
-            headers_obj = self.headersObj()
-            with headers_obj.app.read_context():
-                if column is None:
-                    if len(headers_obj):
-                        column = 0
-                    else:
-                        return None
-                if role == QtCore.Qt.DisplayRole:
-                    return self.headersObj()[column].title.capitalize()
-                elif role == QtCore.Qt.UserRole:
-                    return self.headersObj()[column]
+        if threshold is not None:
+            threshold = int(threshold)
+            if threshold < 1:
+                error = "reset threshold must be 1 or higher, got {}".format(threshold)
+                raise ValueError(error)
+        self.__reset_threshold = threshold
+
+    def resetPolicy(self):
+        """
+        **final method**
 
-    def columnCount(self, *args, **kwargs):
+        Get what row changes over the threshold fall back to.
+
+        :return: 'reset' or 'layout'.
+        :rtype: str
         """
-        Get column count.
+        return self.__reset_policy
 
-        :return: Column count.
-        :rtype: int
+    def setResetPolicy(self, policy):
         """
-        return len(self.headersObj())
+        **final method**
 
-    def rowCount(self, parent=QtCore.QModelIndex(), *args, **kwargs):
+        Set what row changes over the threshold fall back to.
+
+        A 'reset' is the fastest, but views lose their selection and current index.
+        A 'layout' change keeps persistent indexes (and with them, selections) by
+        remapping them all at once.
+
+        A layout change can't change the row count, so only moves fall back to it.
+        Insertions and deletions over the threshold fall back to a reset with either
+        policy (ending a layout change that is in progress first).
+
+        :param policy: 'reset' or 'layout'.
+        :type policy: str
+
+        :raises ValueError: Invalid policy.
         """
-        Get value count (row count).
+        if policy not in ("reset", "layout"):
+            error = "reset policy must be 'reset' or 'layout', got {!r}".format(policy)
+            raise ValueError(error)
+        self.__reset_policy = policy
 
-        :return: Value count (row count).
+    def fallbackCount(self):
+        """
+        **final method**
+
+        Get how many times row changes over the threshold fell back to a reset or a
+        layout change.
+
+        :return: Fallback count.
         :rtype: int
         """
-        obj = self.obj()
-        if obj is None:
-            return 0
-        return len(obj)
+        return self.__fallback_count
 
-    def flags(self, index=QtCore.QModelIndex(), *args, **kwargs):
+    def rowSignalCount(self):
         """
-        Get flags.
+        **final method**
 
-        :param index: Index.
-        :type index: QtCore.QModelIndex
+        Get how many row insertions, deletions and moves were signaled.
 
-        :return: Flags.
-        :rtype: QtCore.Qt.ItemFlag
+        :return: Row signal count.
+        :rtype: int
         """
-        obj = self.obj()
-        if obj is None:
-            return QtCore.Qt.NoItemFlags
+        return self.__row_signal_count
 
-        row = index.row()
-        column = index.column()
+    def dataChangedRequestCount(self):
+        """
+        **final method**
 
-        header = self.headersObj()[column]
-        flags = header.flags(obj, row)
+        Get how many data changes were queued.
 
-        if hasattr(QtCore.Qt, "ItemNeverHasChildren"):
-            flags |= QtCore.Qt.ItemNeverHasChildren
+        :return: Data change request count.
+        :rtype: int
+        """
+        return self.__data_changed_request_count
 
-        mime_type = self.mimeType()
-        if mime_type:
-            flags |= QtCore.Qt.ItemIsDragEnabled | QtCore.Qt.ItemIsDropEnabled
+    def dataChangedEmitCount(self):
+        """
+        **final method**
 
-        return flags
+        Get how many `dataChanged` signals were emitted for queued data changes.
 
-    def data(self, index=QtCore.QModelIndex(), role=QtCore.Qt.DisplayRole):
+        :return: Data changed emit count.
+        :rtype: int
         """
-        Get data.
+        return self.__data_changed_emit_count
 
-        :param index: Index.
-        :type index: QtCore.QModelIndex
+    def dataChangedMergeCount(self):
+        """
+        **final method**
 
-        :param role: Role.
-        :type role: QtCore.Qt.ItemDataRole
+        Get how many queued data changes were merged into others (or discarded by a
+        reset) instead of being emitted separately.
 
-        :return: Data.
+        :return: Data changed merge count.
+        :rtype: int
         """
-        obj = self.obj()
-        if obj is None:
-            return
-        row = index.row()
-        column = index.column()
-        header = self.headersObj()[column]
-        return header.data(obj, row, role)
+        return self.__data_changed_request_count - self.__data_changed_emit_count
 
     def mimeType(self):
         """
@@ -676,6 +2846,153 @@ objettoqt.models.AbstractListModelHeader or str] or None
         """
         self.__mime_type = mime_type or None
 
+    def mimeCodec(self):
+        """
+        Get the name of the mime codec used to encode dragged items.
+
+        :return: Mime codec name.
+        :rtype: str
+        """
+        return self.__mime_codec
+
+    def setMimeCodec(self, mime_codec):
+        """
+        Set the mime codec used to encode dragged items.
+        Dropped data is decoded with whichever registered codec matches it.
+
+        :param mime_codec: Name of a registered mime codec.
+        :type mime_codec: str
+
+        :raises KeyError: No codec registered with that name.
+        """
+        self.__mime_codec = get_mime_codec(mime_codec).name
+
+    def sharedMemoryThreshold(self):
+        """
+        Get the encoded size in bytes from which dragged items are transported
+        through shared memory.
+
+        :return: Shared memory threshold (or None if disabled).
+        :rtype: int or None
+        """
+        return self.__shared_memory_threshold
+
+    def setSharedMemoryThreshold(self, threshold=None):
+        """
+        Set the encoded size in bytes from which dragged items are transported
+        through shared memory.
+
+        When consumers in other processes retrieve mime data that is at least this
+        large, it's written once into a named shared memory segment and only a small
+        descriptor is carried by the mime data. The segment is released when the mime
+        data is deleted. Requires Python 3.8 or higher.
+
+        :param threshold: Size in bytes (or None to disable).
+        :type threshold: int or None
+
+        :raises ValueError: Threshold is lower than 0.
+        :raises RuntimeError: Shared memory is not available.
+        """
+        if threshold is not None:
+            threshold = int(threshold)
+            if threshold < 0:
+                error = "shared memory threshold must be 0 or higher, got {}".format(
+                    threshold
+                )
+                raise ValueError(error)
+            if not SHARED_MEMORY_AVAILABLE:
+                error = "shared memory is not available in this version of python"
+                raise RuntimeError(error)
+        self.__shared_memory_threshold = threshold
+
+    def asyncDropThreshold(self):
+        """
+        Get the number of copied items from which drops are deserialized in worker
+        threads.
+
+        :return: Async drop threshold (or None if disabled).
+        :rtype: int or None
+        """
+        return self.__async_drop_threshold
+
+    def setAsyncDropThreshold(self, threshold=None):
+        """
+        Set the number of copied items from which drops are deserialized in worker
+        threads.
+
+        Dropped items are deserialized and validated in chunks (see
+        :meth:`objettoqt.models.OQListModel.setDropChunkSize`) in the global thread
+        pool, and invalid items are skipped. Once all chunks are done, the items are
+        inserted at once in this model's thread. Progress is reported by
+        :attr:`objettoqt.models.OQListModel.asyncDropProgressed` and completion by
+        :attr:`objettoqt.models.OQListModel.asyncDropFinished`.
+        Moves are always done synchronously, so the source only deletes rows after
+        they were inserted.
+
+        :param threshold: Item count (or None to disable).
+        :type threshold: int or None
+
+        :raises ValueError: Threshold is lower than 1.
+        """
+        if threshold is not None:
+            threshold = int(threshold)
+            if threshold < 1:
+                error = "async drop threshold must be 1 or higher, got {}".format(
+                    threshold
+                )
+                raise ValueError(error)
+        self.__async_drop_threshold = threshold
+
+    def dropChunkSize(self):
+        """
+        Get the number of items deserialized per worker thread task.
+
+        :return: Drop chunk size.
+        :rtype: int
+        """
+        return self.__drop_chunk_size
+
+    def setDropChunkSize(self, chunk_size):
+        """
+        Set the number of items deserialized per worker thread task.
+
+        :param chunk_size: Drop chunk size.
+        :type chunk_size: int
+
+        :raises ValueError: Chunk size is lower than 1.
+        """
+        chunk_size = int(chunk_size)
+        if chunk_size < 1:
+            error = "drop chunk size must be 1 or higher, got {}".format(chunk_size)
+            raise ValueError(error)
+        self.__drop_chunk_size = chunk_size
+
+    def isAsyncDropRunning(self):
+        """
+        Get whether dropped items are being deserialized in worker threads.
+        Other drops of many copied items are rejected until it finishes.
+
+        :return: True if running.
+        :rtype: bool
+        """
+        return self.__async_drop is not None
+
+    def cancelAsyncDrop(self):
+        """
+        Cancel the deserialization of dropped items in worker threads (if running).
+        Nothing gets inserted.
+
+        :return: True if cancelled.
+        :rtype: bool
+        """
+        async_drop = self.__async_drop
+        if async_drop is None:
+            return False
+        self.__async_drop = None
+        async_drop.cancelled.set()
+        self.asyncDropFinished.emit(False, 0, 0)
+        return True
+
     def mimeTypes(self):
         """
         Get mime types.
@@ -690,6 +3007,8 @@ objettoqt.models.AbstractListModelHeader or str] or None
     def mimeData(self, indexes):
         """
         Get mime data stream.
+        Rows are only encoded if the data is retrieved by a consumer, drops in the
+        same process resolve them directly.
 
         :param indexes: Indexes.
         :type indexes: collections.abc.Iterable[QtCore.QModelIndex]
@@ -733,34 +3052,16 @@ objettoqt.models.AbstractListModelHeader or str] or None
         first_row = rows[0]
         last_row = rows[-1]
 
-        serialized_objs = []
-        contents = {
-            "obj_id": id(obj),
-            "first_row": first_row,
-            "last_row": last_row,
-            "serialized_objs": serialized_objs,
-        }
-        with obj.app.read_context():
-            for row in rows:
-                item = obj[row]
-                if isinstance(item, BaseObject):
-                    try:
-                        serialized_obj = obj.serialize_value(item)
-                    except SerializationError:
-                        serialized_obj = item
-                else:
-                    serialized_obj = item
-                serialized_objs.append(serialized_obj)
-
-        # Prepare data stream.
-        try:
-            data_stream = safe_dump(contents)
-        except YAMLError:
-            return None
-        mime_data = QtCore.QMimeData()
-        # noinspection PyTypeChecker
-        mime_data.setData(mime_type, ensure_binary(data_stream))
-        return mime_data
+        # Rows are only encoded when the data is retrieved.
+        return _OQListMimeData(
+            mime_type,
+            self.__mime_codec,
+            self.__shared_memory_threshold,
+            obj,
+            self.__row_snapshot[first_row : last_row + 1],
+            first_row,
+            last_row,
+        )
 
     def supportedDropActions(self):
         """
@@ -804,6 +3105,16 @@ objettoqt.models.AbstractListModelHeader or str] or None
         """
         Handle dropped mime data stream.
 
+        Rows dragged from a model in this process are resolved without decoding:
+
+          - Moving rows within the same list moves them in place.
+          - Moving rows from another mutable list in the same application moves the
+            actual objects, taking them out of the source list in the same write
+            context (so the source view doesn't need to delete them).
+          - Moving rows whose source list changed since the drag started is
+            rejected, since the dragged rows can't be told apart anymore.
+          - Anything else is a copy (the source view deletes the rows after a move).
+
         :param data: Mime data stream.
         :type data: QtCore.QMimeData
 
@@ -841,53 +3152,137 @@ objettoqt.models.AbstractListModelHeader or str] or None
         try:
             if action in (QtCore.Qt.CopyAction, QtCore.Qt.MoveAction):
 
-                # Deserialize yaml data.
-                data = data.data(mime_type).data()
-                data_stream = data.decode("utf8")
-                contents = safe_load(data_stream)
+                # Rows dragged in this process are resolved without decoding.
+                list_mime_data = _OQListMimeData.resolve(data)
+                if list_mime_data is not None and list_mime_data.hasFormat(mime_type):
+                    source_obj, state, items, first_row, last_row = (
+                        list_mime_data.source()
+                    )
+                    if source_obj is not None:
+                        return self.__dropRows(
+                            source_obj, state, items, first_row, last_row, action, row
+                        )
+
+                # Decode data with the codec that matches it (from shared memory if
+                # the data is a descriptor).
+                data_stream = bytes(data.data(mime_type).data())
+                if is_descriptor(data_stream):
+                    with open_descriptor(data_stream) as payload:
+                        contents = _decode(payload)
+                else:
+                    contents = _decode(data_stream)
                 if isinstance(contents, collections_abc.Mapping):
                     try:
-                        obj_id = contents["obj_id"]
-                        first_row = contents["first_row"]
-                        last_row = contents["last_row"]
                         serialized_objs = contents["serialized_objs"]
                     except KeyError:
                         raise TypeError()
                 else:
                     raise TypeError()
 
-                # We have results
+                # We have results (from another process, so always a copy).
                 if serialized_objs:
+                    return self.__insertItems(
+                        row, [(True, s) for s in serialized_objs], action
+                    )
 
-                    # Internal move.
-                    if action == QtCore.Qt.MoveAction and obj_id == id(obj):
-                        if row == last_row + 1:
-                            row += 1
-                        if not (first_row <= row <= last_row + 1):
-                            self.obj().move(slice(first_row, last_row + 1), row)
-                            return True
-
-                    # External or copy.
-                    else:
-                        objs = []
-                        subject_obj = self.obj()
-                        if subject_obj is not None:
-                            with subject_obj.app.write_context():
-                                for serialized_obj in serialized_objs:
-                                    try:
-                                        deserialized_obj = type(
-                                            subject_obj
-                                        ).deserialize_value(
-                                            serialized_obj, None, app=subject_obj.app
-                                        )
-                                    except SerializationError:
-                                        objs = []
-                                        break
-                                    objs.append(deserialized_obj)
-                            if objs:
-                                self.obj().insert(row, *objs)
-                                return True
-
-        except (YAMLError, TypeError):
+        except (ValueError, TypeError, OSError):
             pass
         return False
+
+    def __dropRows(self, source_obj, state, items, first_row, last_row, action, row):
+        obj = self.obj()
+        if not items:
+            return False
+
+        # Rows were shown by the source model as they still are in the list.
+        dragged = state[first_row : last_row + 1]
+        unchanged = (
+            source_obj._state is state
+            and len(dragged) == len(items)
+            and all(a is b for a, b in zip(dragged, items))
+        )
+
+        # Source changed since the drag started, don't degrade a move to a copy.
+        if action == QtCore.Qt.MoveAction and not unchanged:
+            return False
+
+        # Internal move.
+        if action == QtCore.Qt.MoveAction and source_obj is obj:
+            if row == last_row + 1:
+                row += 1
+            if not (first_row <= row <= last_row + 1):
+                obj.move(slice(first_row, last_row + 1), row)
+                return True
+            return False
+
+        # Move the actual objects from another list.
+        if (
+            action == QtCore.Qt.MoveAction
+            and source_obj.app is obj.app
+            and isinstance(source_obj, MutableListObject)
+        ):
+            with obj.app.write_context():
+                source_obj.delete(slice(first_row, last_row + 1))
+                obj.insert(row, *items)
+            return True
+
+        # Copy, only objects need to be serialized/deserialized.
+        serialized_items = []
+        with source_obj.app.read_context():
+            for item in items:
+                if isinstance(item, BaseObject):
+                    try:
+                        item = source_obj.serialize_value(item)
+                    except SerializationError:
+                        return False
+                    serialized_items.append((True, item))
+                else:
+                    serialized_items.append((False, item))
+        return self.__insertItems(row, serialized_items, action)
+
+    def __insertItems(self, row, serialized_items, action):
+        obj = self.obj()
+
+        # Deserialize many copied items in worker threads.
+        threshold = self.__async_drop_threshold
+        if (
+            action == QtCore.Qt.CopyAction
+            and threshold is not None
+            and len(serialized_items) >= threshold
+        ):
+            if self.__async_drop is not None:
+                return False
+            chunk_size = self.__drop_chunk_size
+            chunks = [
+                serialized_items[i : i + chunk_size]
+                for i in x_range(0, len(serialized_items), chunk_size)
+            ]
+            async_drop = _AsyncDrop(row, len(serialized_items), len(chunks))
+            self.__async_drop = async_drop
+            thread_pool = QtCore.QThreadPool.globalInstance()
+            for index, chunk in enumerate(chunks):
+                runnable = _DeserializeChunk(
+                    self.__chunkDeserialized,
+                    async_drop,
+                    index,
+                    type(obj),
+                    obj.app,
+                    chunk,
+                )
+                thread_pool.start(runnable)
+            return True
+
+        # Deserialize each item in its own write context (a single context gets
+        # slower with each object created in it), then insert all of them at once.
+        objs = []
+        for serialized, item in serialized_items:
+            if serialized:
+                try:
+                    with obj.app.write_context():
+                        item = type(obj).deserialize_value(item, None, app=obj.app)
+                except SerializationError:
+                    return False
+            objs.append(item)
+        with obj.app.write_context():
+            obj.insert(row, *objs)
+        return True
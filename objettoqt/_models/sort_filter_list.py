@@ -0,0 +1,600 @@
+# -*- coding: utf-8 -*-
+"""Sort/filter list proxy model."""
+
+from bisect import bisect_left
+from numbers import Number
+
+from objetto import POST, PRE
+from objetto.changes import ListDelete, ListInsert, ListMove, ListUpdate
+from objetto.utils.reraise_context import ReraiseContext
+from objetto.utils.type_checking import assert_is_instance
+from Qt import QtCore
+from six import string_types
+from six.moves import xrange as x_range
+
+from .._render import read_state
+from .list import OQListModel, _row_remap
+
+__all__ = ["OQSortFilterListModel"]
+
+
+_LABEL_SPACING = 1 << 32
+
+
+def _total_key(key):
+    """
+    Wrap a sort key so that keys of different types can be compared: None first,
+    then numbers, then strings, then anything else grouped by type name.
+    """
+    if key is None:
+        return 0, "", 0
+    if isinstance(key, Number):
+        return 1, "", key
+    if isinstance(key, string_types):
+        return 2, "", key
+    return 3, type(key).__name__, key
+
+
+class OQSortFilterListModel(QtCore.QAbstractProxyModel):
+    """
+    Sorts and filters the rows of a :class:`objettoqt.models.OQListModel`.
+
+    Unlike :class:`QtCore.QSortFilterProxyModel`, list changes are applied
+    incrementally: sort keys (see
+    :meth:`objettoqt.models.AbstractListModelHeader.sort_key`) and filter results
+    are computed once per row and cached, inserted and updated rows are placed with
+    a binary search and only the affected rows are signaled.
+    Moving rows in the source list changes the layout instead (keeping the cached
+    sort keys and filter results).
+
+    Rows with equal sort keys keep their order from the source list. Keys of
+    different types can be mixed: None sorts first, then numbers, then strings.
+
+    Inherits from:
+      - :class:`QtCore.QAbstractProxyModel`
+
+    :param parent: Parent.
+    :type parent: QtCore.QObject or None
+    """
+
+    def __init__(self, parent=None, **kwargs):
+        super(OQSortFilterListModel, self).__init__(parent=parent, **kwargs)
+        self.__sort_column = -1
+        self.__sort_order = QtCore.Qt.AscendingOrder
+        self.__filter_function = None
+        self.__keys = []
+        self.__accepted = bytearray()
+        self.__order = []
+
+        # Increasing labels for the source rows, used to break ties between equal
+        # keys, so source rows don't need to be renumbered when rows are inserted
+        # or deleted.
+        self.__labels = []
+
+    def __onSourceObjChanged__(self, phase):
+        if phase is PRE:
+            self.beginResetModel()
+        elif phase is POST:
+            self.__build()
+            self.endResetModel()
+
+    def __onSourceActionReceived__(self, action, phase):
+        source = self.sourceModel()
+        obj = source.obj()
+        change = action.change
+
+        # A value in the list changed, update its row.
+        if action.sender is not obj:
+            if phase is POST and action.locations:
+                row = action.locations[0]
+                self.__updateRows(obj, row, row)
+            return
+
+        # Remove deleted rows before the source does, while rows still match.
+        if isinstance(change, ListDelete):
+            if phase is PRE:
+                for row in x_range(change.last_index, change.index - 1, -1):
+                    self.__removeRow(row)
+            elif phase is POST:
+                del self.__keys[change.index : change.stop]
+                del self.__accepted[change.index : change.stop]
+                del self.__labels[change.index : change.stop]
+
+        # Label new rows, then insert them.
+        elif isinstance(change, ListInsert):
+            if phase is POST:
+                count = change.last_index - change.index + 1
+                self.__insertLabels(change.index, count)
+                self.__keys[change.index : change.index] = [None] * count
+                self.__accepted[change.index : change.index] = bytearray(count)
+                self.__updateRows(obj, change.index, change.last_index)
+
+        # Re-sort and re-filter updated rows.
+        elif isinstance(change, ListUpdate):
+            if phase is POST:
+                self.__updateRows(obj, change.index, change.last_index)
+
+        # Move cached keys and filter results along with the rows.
+        elif isinstance(change, ListMove):
+            if phase is POST:
+                self.__moveRows(change)
+
+        # Anything else changes the layout.
+        elif phase is POST:
+            self.__relayout()
+
+    def __onSourceDataChanged__(
+        self, first_row, last_row, first_column, last_column, roles
+    ):
+        source = self.sourceModel()
+        obj = source.obj() if source is not None else None
+        if obj is None:
+            return
+        last_row = min(last_row, len(self.__accepted) - 1)
+
+        # Sort keys and filter results might depend on the data, check them again.
+        if (
+            self.__filter_function is not None
+            or first_column <= self.__sort_column <= last_column
+        ):
+            self.__updateRows(
+                obj, first_row, last_row, first_column, last_column, roles
+            )
+            return
+
+        # Signal accepted rows, in runs of consecutive proxy rows.
+        order = self.__order
+        keys = self.__keys
+        accepted = self.__accepted
+        proxy_rows = sorted(
+            self.__proxyRow(
+                bisect_left(order, self.__entry(keys[row], row)), len(order)
+            )
+            for row in x_range(first_row, last_row + 1)
+            if accepted[row]
+        )
+        runs = []
+        for proxy_row in proxy_rows:
+            if runs and runs[-1][1] + 1 == proxy_row:
+                runs[-1][1] = proxy_row
+            else:
+                runs.append([proxy_row, proxy_row])
+        for first_proxy_row, last_proxy_row in runs:
+            self.dataChanged.emit(
+                self.index(first_proxy_row, first_column),
+                self.index(last_proxy_row, last_column),
+                list(roles),
+            )
+
+    def __onSourceHeadersChanged__(self, phase):
+        if phase is PRE:
+            self.beginResetModel()
+        elif phase is POST:
+            self.__build()
+            self.endResetModel()
+
+    def __sortHeader(self):
+        headers = self.sourceModel().headers()
+        if 0 <= self.__sort_column < len(headers):
+            return headers[self.__sort_column]
+        return None
+
+    def __accepts(self, obj, row):
+        if self.__filter_function is None:
+            return True
+        return bool(self.__filter_function(read_state(obj)[row]))
+
+    def __entry(self, key, row):
+        # Keep rows with equal keys in source order when sorting in descending order.
+        if self.__sort_order == QtCore.Qt.DescendingOrder:
+            return key, -self.__labels[row]
+        return key, self.__labels[row]
+
+    def __sourceRow(self, entry):
+        if self.__sort_order == QtCore.Qt.DescendingOrder:
+            return bisect_left(self.__labels, -entry[1])
+        return bisect_left(self.__labels, entry[1])
+
+    def __proxyRow(self, position, count):
+        if self.__sort_order == QtCore.Qt.DescendingOrder:
+            return count - 1 - position
+        return position
+
+    def __position(self, proxy_row):
+        if self.__sort_order == QtCore.Qt.DescendingOrder:
+            return len(self.__order) - 1 - proxy_row
+        return proxy_row
+
+    def __insertLabels(self, row, count):
+        labels = self.__labels
+        if not labels:
+            labels[:] = [i * _LABEL_SPACING for i in x_range(count)]
+            return
+
+        # Append/prepend with regular spacing.
+        if row == len(labels):
+            low = labels[-1]
+            labels.extend(low + (i + 1) * _LABEL_SPACING for i in x_range(count))
+            return
+        if row == 0:
+            high = labels[0]
+            labels[0:0] = [high - (count - i) * _LABEL_SPACING for i in x_range(count)]
+            return
+
+        # Split the gap between the neighbors, relabel all rows if there's no room.
+        low, high = labels[row - 1], labels[row]
+        step = (high - low) // (count + 1)
+        if step < 1:
+            self.__relabel()
+            low, high = labels[row - 1], labels[row]
+            step = (high - low) // (count + 1)
+        labels[row:row] = [low + (i + 1) * step for i in x_range(count)]
+
+    def __relabel(self):
+        old_labels = list(self.__labels)
+        labels = self.__labels
+        labels[:] = [i * _LABEL_SPACING for i in x_range(len(old_labels))]
+
+        # Relabeling keeps the order, so just replace the labels.
+        sign = -1 if self.__sort_order == QtCore.Qt.DescendingOrder else 1
+        self.__order = [
+            (key, sign * labels[bisect_left(old_labels, sign * label)])
+            for key, label in self.__order
+        ]
+
+    def __removeRow(self, row):
+        if not self.__accepted[row]:
+            return
+        order = self.__order
+        position = bisect_left(order, self.__entry(self.__keys[row], row))
+        proxy_row = self.__proxyRow(position, len(order))
+        self.beginRemoveRows(QtCore.QModelIndex(), proxy_row, proxy_row)
+        del order[position]
+        self.endRemoveRows()
+
+    def __insertRow(self, row):
+        order = self.__order
+        entry = self.__entry(self.__keys[row], row)
+        position = bisect_left(order, entry)
+        proxy_row = self.__proxyRow(position, len(order) + 1)
+        self.beginInsertRows(QtCore.QModelIndex(), proxy_row, proxy_row)
+        order.insert(position, entry)
+        self.endInsertRows()
+
+    def __updateRows(
+        self, obj, first_row, last_row, first_column=0, last_column=None, roles=()
+    ):
+        if last_column is None:
+            last_column = self.columnCount() - 1
+        source = self.sourceModel()
+        header = self.__sortHeader()
+        keys = self.__keys
+        accepted = self.__accepted
+        with source.renderPass(), source.__readRowSnapshot__():
+            for row in x_range(first_row, last_row + 1):
+                key = _total_key(
+                    header.sort_key(obj, row) if header is not None else None
+                )
+                accepts = self.__accepts(obj, row)
+
+                # Same position, just signal data change.
+                if accepted[row] and accepts:
+                    order = self.__order
+                    position = bisect_left(order, self.__entry(keys[row], row))
+                    entry = self.__entry(key, row)
+                    if (position == 0 or order[position - 1] < entry) and (
+                        position == len(order) - 1 or entry < order[position + 1]
+                    ):
+                        order[position] = entry
+                        keys[row] = key
+                        proxy_row = self.__proxyRow(position, len(order))
+                        self.dataChanged.emit(
+                            self.index(proxy_row, first_column),
+                            self.index(proxy_row, last_column),
+                            list(roles),
+                        )
+                        continue
+
+                self.__removeRow(row)
+                keys[row] = key
+                accepted[row] = accepts
+                if accepts:
+                    self.__insertRow(row)
+
+    def __moveRows(self, change):
+        self.layoutAboutToBeChanged.emit()
+
+        # Remember source rows of persistent indexes, from before the move.
+        order = self.__order
+        old_indexes = self.persistentIndexList()
+        old_rows = [
+            self.__sourceRow(order[self.__position(index.row())])
+            for index in old_indexes
+        ]
+
+        # Take the entries of the moved rows out of the order.
+        count = change.stop - change.index
+        labels = self.__labels
+        sign = -1 if self.__sort_order == QtCore.Qt.DescendingOrder else 1
+        moved_labels = set(labels[change.index : change.stop])
+        self.__order = [e for e in order if sign * e[1] not in moved_labels]
+
+        # Move their keys and filter results, then label them at their new rows.
+        for values in (self.__keys, self.__accepted):
+            moved_values = values[change.index : change.stop]
+            del values[change.index : change.stop]
+            values[change.post_index : change.post_index] = moved_values
+        del labels[change.index : change.stop]
+        self.__insertLabels(change.post_index, count)
+        self.__order.extend(
+            self.__entry(self.__keys[row], row)
+            for row in x_range(change.post_index, change.post_index + count)
+            if self.__accepted[row]
+        )
+        self.__order.sort()
+
+        source = self.sourceModel()
+        remap = _row_remap(change)
+        new_indexes = [
+            self.mapFromSource(source.__sourceIndex__(remap(row), index.column()))
+            for row, index in zip(old_rows, old_indexes)
+        ]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+
+    def __build(self):
+        source = self.sourceModel()
+        obj = source.obj() if source is not None else None
+        if obj is None:
+            self.__keys = []
+            self.__accepted = bytearray()
+            self.__order = []
+            self.__labels = []
+            return
+        header = self.__sortHeader()
+        with source.renderPass(), source.__readRowSnapshot__():
+            count = len(read_state(obj))
+            self.__labels = [i * _LABEL_SPACING for i in x_range(count)]
+            if header is not None:
+                keys = [_total_key(header.sort_key(obj, row)) for row in x_range(count)]
+            else:
+                keys = [_total_key(None)] * count
+            self.__keys = keys
+            accepted = self.__accepted = bytearray(
+                self.__accepts(obj, row) for row in x_range(count)
+            )
+        self.__order = sorted(
+            self.__entry(keys[row], row) for row in x_range(count) if accepted[row]
+        )
+
+    def __relayout(self, sort_column=None, sort_order=None, filter_function=None):
+        self.layoutAboutToBeChanged.emit()
+
+        # Remember source rows of persistent indexes.
+        old_indexes = self.persistentIndexList()
+        source_indexes = [self.mapToSource(index) for index in old_indexes]
+
+        # Rebuild with the new settings.
+        if sort_column is not None:
+            self.__sort_column = sort_column
+        if sort_order is not None:
+            self.__sort_order = sort_order
+        if filter_function is not None:
+            self.__filter_function = filter_function or None
+        self.__build()
+
+        new_indexes = [
+            self.mapFromSource(source_index) for source_index in source_indexes
+        ]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+
+    def setSourceModel(self, source_model):
+        """
+        Set source model.
+
+        :param source_model: Source list model (or None).
+        :type source_model: objettoqt.models.OQListModel or None
+
+        :raises TypeError: Source model is not a list model.
+        """
+        with ReraiseContext(TypeError, "'source_model' parameter"):
+            assert_is_instance(source_model, (OQListModel, None))
+        old_source_model = self.sourceModel()
+        if old_source_model is source_model:
+            return
+        self.beginResetModel()
+        if old_source_model is not None:
+            old_source_model.__removeProxy__(self)
+        super(OQSortFilterListModel, self).setSourceModel(source_model)
+        if source_model is not None:
+            source_model.__addProxy__(self)
+        self.__build()
+        self.endResetModel()
+
+    def renderPass(self):
+        """
+        Get a context manager for a render pass of the source model.
+
+        :return: Render pass context manager.
+        :rtype: contextlib.AbstractContextManager
+        """
+        return self.sourceModel().renderPass()
+
+    def obj(self):
+        """
+        Get the list object being observed by the source model.
+
+        :return: List object (or None).
+        :rtype: objetto.objects.ListObject or None
+        """
+        source = self.sourceModel()
+        if source is None:
+            return None
+        return source.obj()
+
+    def sort(self, column, order=QtCore.Qt.AscendingOrder):
+        """
+        Sort by a column.
+
+        :param column: Column (or -1 to keep the source order).
+        :type column: int
+
+        :param order: Sort order.
+        :type order: QtCore.Qt.SortOrder
+        """
+        self.__relayout(sort_column=column, sort_order=order)
+
+    def sortColumn(self):
+        """
+        Get sort column.
+
+        :return: Sort column (or -1 if keeping the source order).
+        :rtype: int
+        """
+        return self.__sort_column
+
+    def sortOrder(self):
+        """
+        Get sort order.
+
+        :return: Sort order.
+        :rtype: QtCore.Qt.SortOrder
+        """
+        return self.__sort_order
+
+    def filterFunction(self):
+        """
+        Get filter function.
+
+        :return: Filter function (or None if accepting all rows).
+        :rtype: collections.abc.Callable or None
+        """
+        return self.__filter_function
+
+    def setFilterFunction(self, filter_function=None):
+        """
+        Set filter function.
+
+        The function gets called once per row with the value at that row and should
+        return True to accept it. It is called again for rows that change.
+
+        :param filter_function: Filter function (or None to accept all rows).
+        :type filter_function: collections.abc.Callable or None
+        """
+        self.__relayout(filter_function=filter_function or False)
+
+    def invalidate(self):
+        """Re-compute sort keys and filter results for all rows."""
+        self.__relayout()
+
+    def mapToSource(self, proxy_index):
+        """
+        Map a proxy index to the source model.
+
+        :param proxy_index: Proxy index.
+        :type proxy_index: QtCore.QModelIndex
+
+        :return: Source index.
+        :rtype: QtCore.QModelIndex
+        """
+        source = self.sourceModel()
+        if source is None or not proxy_index.isValid():
+            return QtCore.QModelIndex()
+        row = proxy_index.row()
+        if not 0 <= row < len(self.__order):
+            return QtCore.QModelIndex()
+        source_row = self.__sourceRow(self.__order[self.__position(row)])
+        return source.__sourceIndex__(source_row, proxy_index.column())
+
+    def mapFromSource(self, source_index):
+        """
+        Map a source index to the proxy model.
+
+        :param source_index: Source index.
+        :type source_index: QtCore.QModelIndex
+
+        :return: Proxy index (invalid if filtered out).
+        :rtype: QtCore.QModelIndex
+        """
+        if not source_index.isValid():
+            return QtCore.QModelIndex()
+        row = source_index.row()
+        if not 0 <= row < len(self.__accepted) or not self.__accepted[row]:
+            return QtCore.QModelIndex()
+        order = self.__order
+        position = bisect_left(order, self.__entry(self.__keys[row], row))
+        return self.index(self.__proxyRow(position, len(order)), source_index.column())
+
+    def index(self, row, column=0, parent=QtCore.QModelIndex(), *args, **kwargs):
+        """
+        Get index.
+
+        :param row: Row.
+        :type row: int
+
+        :param column: Column.
+        :type column: int
+
+        :param parent: Parent index.
+        :type parent: QtCore.QModelIndex
+
+        :return: Index.
+        :rtype: QtCore.QModelIndex
+        """
+        if not parent.isValid() and 0 <= row < len(self.__order):
+            return self.createIndex(row, column)
+        return QtCore.QModelIndex()
+
+    def parent(self, index=QtCore.QModelIndex(), *args, **kwargs):
+        """
+        Get invalid parent index (no valid parent indexes in a list model).
+
+        :return: Invalid parent index.
+        :rtype: QtCore.QModelIndex
+        """
+        return QtCore.QModelIndex()
+
+    def rowCount(self, parent=QtCore.QModelIndex(), *args, **kwargs):
+        """
+        Get accepted row count.
+
+        :return: Row count.
+        :rtype: int
+        """
+        if parent.isValid():
+            return 0
+        return len(self.__order)
+
+    def columnCount(self, parent=QtCore.QModelIndex(), *args, **kwargs):
+        """
+        Get column count.
+
+        :return: Column count.
+        :rtype: int
+        """
+        source = self.sourceModel()
+        if source is None:
+            return 0
+        return source.columnCount()
+
+    def supportedDropActions(self):
+        """
+        Get supported drop actions (dropping into a sorted model is not supported).
+
+        :return: Supported drop actions.
+        :rtype: QtCore.Qt.DropAction
+        """
+        return QtCore.Qt.IgnoreAction
+
+    def supportedDragActions(self):
+        """
+        Get supported drag actions (only copying out of a sorted model).
+
+        :return: Supported drag actions.
+        :rtype: QtCore.Qt.DropAction
+        """
+        source = self.sourceModel()
+        if source is None:
+            return QtCore.Qt.IgnoreAction
+        return source.supportedDragActions() & QtCore.Qt.CopyAction
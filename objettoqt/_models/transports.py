@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""Shared memory transport for large mime data payloads."""
+
+import os
+from contextlib import contextmanager
+from struct import Struct
+from uuid import uuid4
+
+from six import ensure_binary, ensure_text
+
+try:
+    from multiprocessing import shared_memory
+    from weakref import finalize
+except ImportError:
+    shared_memory = finalize = None
+
+__all__ = [
+    "SHARED_MEMORY_AVAILABLE",
+    "is_descriptor",
+    "write_segment",
+    "open_descriptor",
+]
+
+SHARED_MEMORY_AVAILABLE = shared_memory is not None
+
+_MAGIC = b"OQSM"
+_VERSION = 1
+_HEADER = Struct(">4sBQH")
+
+# Names of the segments created by this process.
+_created_names = set()
+
+
+def is_descriptor(data):
+    """
+    Get whether data is a shared memory descriptor.
+
+    :param data: Data.
+    :type data: bytes
+
+    :return: True if descriptor.
+    :rtype: bool
+    """
+    return data[: len(_MAGIC)] == _MAGIC
+
+
+def write_segment(payload, owner):
+    """
+    Write a payload into a new shared memory segment, which is released when the
+    owner gets garbage collected (or when the process exits).
+
+    :param payload: Payload.
+    :type payload: bytes
+
+    :param owner: Owner.
+    :type owner: object
+
+    :return: Release function (to release it earlier) and descriptor.
+    :rtype: tuple[collections.abc.Callable, bytes]
+
+    :raises RuntimeError: Shared memory is not available.
+    :raises OSError: Could not create segment.
+    """
+    if not SHARED_MEMORY_AVAILABLE:
+        error = "shared memory is not available in this version of python"
+        raise RuntimeError(error)
+    name = "oq_{}".format(uuid4().hex[:24])
+    segment = shared_memory.SharedMemory(
+        name=name, create=True, size=max(1, len(payload))
+    )
+    try:
+        segment.buf[: len(payload)] = payload
+    except Exception:
+        _release_segment(segment)
+        raise
+    _created_names.add(name)
+    release = finalize(owner, _release_segment, segment)
+    encoded_name = ensure_binary(name, "utf8")
+    header = _HEADER.pack(_MAGIC, _VERSION, len(payload), len(encoded_name))
+    return release, header + encoded_name
+
+
+def _release_segment(segment):
+    """Close and unlink a segment."""
+    _created_names.discard(segment.name)
+    try:
+        segment.close()
+    finally:
+        try:
+            segment.unlink()
+        except OSError:
+            pass
+
+
+def _attach_segment(name):
+    """Attach to an existing segment, without tracking it for cleanup."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        segment = shared_memory.SharedMemory(name=name)
+        if os.name == "posix" and name not in _created_names:
+            from multiprocessing import resource_tracker
+
+            resource_tracker.unregister(segment._name, "shared_memory")
+        return segment
+
+
+@contextmanager
+def open_descriptor(data):
+    """
+    Map the segment described by a descriptor.
+
+    :param data: Descriptor.
+    :type data: bytes
+
+    :return: Context manager yielding a view of the payload.
+    :rtype: contextlib.AbstractContextManager[memoryview]
+
+    :raises ValueError: Invalid descriptor.
+    :raises OSError: Could not map segment.
+    """
+    if not SHARED_MEMORY_AVAILABLE:
+        error = "shared memory is not available in this version of python"
+        raise ValueError(error)
+    if len(data) < _HEADER.size:
+        raise ValueError("descriptor is too short")
+    magic, version, size, name_size = _HEADER.unpack(data[: _HEADER.size])
+    if magic != _MAGIC:
+        raise ValueError("invalid magic string {!r}".format(magic))
+    if version != _VERSION:
+        raise ValueError("unsupported version {}".format(version))
+    encoded_name = data[_HEADER.size : _HEADER.size + name_size]
+    if len(encoded_name) != name_size:
+        raise ValueError("descriptor is too short")
+    name = ensure_text(encoded_name, "utf8")
+
+    segment = _attach_segment(name)
+    try:
+        if segment.size < size:
+            error = "expected {} bytes in segment, got {}".format(size, segment.size)
+            raise ValueError(error)
+        payload = segment.buf[:size]
+        try:
+            yield payload
+        finally:
+            payload.release()
+    finally:
+        segment.close()
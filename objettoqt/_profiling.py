@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""Dispatch timing and counters for mixed `Qt` objects."""
+
+import time
+from collections import namedtuple
+from weakref import WeakKeyDictionary
+
+__all__ = [
+    "HookStats",
+    "enable",
+    "disable",
+    "is_enabled",
+    "reset",
+    "stats",
+    "format_stats",
+]
+
+
+_perf_counter = getattr(time, "perf_counter", time.time)
+
+_SORT_KEYS = ("count", "total_time", "max_time", "average_time")
+
+# Checked by the mix-ins before timing anything, keep it a plain module global.
+enabled = False
+
+_per_instance = False
+_class_stats = {}
+_instance_stats = WeakKeyDictionary()
+
+
+class HookStats(
+    namedtuple("HookStats", "owner hook count total_time max_time average_time")
+):
+    """
+    Timing and call count of a hook.
+
+    :param owner: Mixed class or instance.
+    :type owner: type[objettoqt.mixins.OQObjectMixin] or \
+objettoqt.mixins.OQObjectMixin
+
+    :param hook: Hook name.
+    :type hook: str
+
+    :param count: Number of calls.
+    :type count: int
+
+    :param total_time: Cumulative wall time (in seconds).
+    :type total_time: float
+
+    :param max_time: Maximum wall time of a single call (in seconds).
+    :type max_time: float
+
+    :param average_time: Average wall time of a call (in seconds).
+    :type average_time: float
+    """
+
+    __slots__ = ()
+
+
+def enable(per_instance=False):
+    """
+    Start recording dispatch timing and counters.
+
+    :param per_instance: Whether to also record per instance.
+    :type per_instance: bool
+    """
+    global enabled, _per_instance
+    _per_instance = bool(per_instance)
+    enabled = True
+
+
+def disable():
+    """Stop recording dispatch timing and counters (recorded data is kept)."""
+    global enabled
+    enabled = False
+
+
+def is_enabled():
+    """
+    Get whether dispatch timing and counters are being recorded.
+
+    :return: True if enabled.
+    :rtype: bool
+    """
+    return enabled
+
+
+def reset():
+    """Clear recorded data."""
+    _class_stats.clear()
+    _instance_stats.clear()
+
+
+def _record(entries, key, elapsed):
+    entry = entries.get(key)
+    if entry is None:
+        entries[key] = [1, elapsed, elapsed]
+    else:
+        entry[0] += 1
+        entry[1] += elapsed
+        if elapsed > entry[2]:
+            entry[2] = elapsed
+
+
+def call(qobj, hook, func, *args):
+    """
+    Call a hook and record how long it took.
+
+    :param qobj: Mixed object.
+    :type qobj: objettoqt.mixins.OQObjectMixin
+
+    :param hook: Hook name.
+    :type hook: str
+
+    :param func: Function to call.
+    :type func: collections.abc.Callable
+
+    :param args: Arguments.
+
+    :return: Result.
+    """
+    start = _perf_counter()
+    try:
+        return func(*args)
+    finally:
+        elapsed = _perf_counter() - start
+        _record(_class_stats, (type(qobj), hook), elapsed)
+        if _per_instance:
+            try:
+                entries = _instance_stats[qobj]
+            except KeyError:
+                entries = _instance_stats[qobj] = {}
+            _record(entries, hook, elapsed)
+
+
+def stats(sort_by="total_time", per_instance=False):
+    """
+    Get recorded data, sorted in descending order.
+
+    :param sort_by: 'count', 'total_time', 'max_time' or 'average_time'.
+    :type sort_by: str
+
+    :param per_instance: Whether to get data per instance instead of per class.
+    :type per_instance: bool
+
+    :return: Hook stats.
+    :rtype: tuple[objettoqt.profiling.HookStats]
+
+    :raises ValueError: Invalid 'sort_by' value.
+    """
+    if sort_by not in _SORT_KEYS:
+        error = "invalid 'sort_by' value {!r}, expected one of {}".format(
+            sort_by, ", ".join(repr(k) for k in _SORT_KEYS)
+        )
+        raise ValueError(error)
+
+    if per_instance:
+        items = [
+            ((owner, hook), entry)
+            for owner, entries in list(_instance_stats.items())
+            for hook, entry in entries.items()
+        ]
+    else:
+        items = list(_class_stats.items())
+
+    rows = [
+        HookStats(owner, hook, count, total_time, max_time, total_time / count)
+        for (owner, hook), (count, total_time, max_time) in items
+    ]
+    rows.sort(key=lambda r: getattr(r, sort_by), reverse=True)
+    return tuple(rows)
+
+
+def format_stats(sort_by="total_time", per_instance=False, limit=None):
+    """
+    Get recorded data formatted as a text table, sorted in descending order.
+
+    :param sort_by: 'count', 'total_time', 'max_time' or 'average_time'.
+    :type sort_by: str
+
+    :param per_instance: Whether to get data per instance instead of per class.
+    :type per_instance: bool
+
+    :param limit: Maximum number of rows (or None for no limit).
+    :type limit: int or None
+
+    :return: Text table.
+    :rtype: str
+
+    :raises ValueError: Invalid 'sort_by' value.
+    """
+    rows = stats(sort_by=sort_by, per_instance=per_instance)[:limit]
+    table = [("owner", "hook", "count", "total (ms)", "max (ms)", "average (ms)")]
+    for row in rows:
+        if isinstance(row.owner, type):
+            owner = row.owner.__name__
+        else:
+            owner = "{}@{:x}".format(type(row.owner).__name__, id(row.owner))
+        table.append(
+            (
+                owner,
+                row.hook,
+                str(row.count),
+                "{:.3f}".format(row.total_time * 1000),
+                "{:.3f}".format(row.max_time * 1000),
+                "{:.3f}".format(row.average_time * 1000),
+            )
+        )
+    widths = [max(len(r[i]) for r in table) for i in range(len(table[0]))]
+    return "\n".join(
+        "  ".join(
+            cell.ljust(width) if i < 2 else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(r, widths))
+        )
+        for r in table
+    )
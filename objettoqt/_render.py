@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""Render passes."""
+
+from contextlib import contextmanager
+from threading import local
+
+__all__ = ["render_pass", "read_context", "read_state", "snapshot_state"]
+
+
+class _RenderPasses(local):
+    """States read during the render passes of the current thread, per application."""
+
+    def __init__(self):
+        super(_RenderPasses, self).__init__()
+        self.states = {}
+        self.snapshots = {}
+
+
+class _NullContext(object):
+    """Context manager that does nothing (already inside of a render pass)."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        return False
+
+
+class _SnapshotContext(object):
+    """Context manager that overrides the state read for an object."""
+
+    __slots__ = ("__key", "__state", "__previous")
+
+    def __init__(self, obj, state):
+        self.__key = id(obj)
+        self.__state = state
+        self.__previous = None
+
+    def __enter__(self):
+        snapshots = _render_passes.snapshots
+        self.__previous = snapshots.get(self.__key)
+        snapshots[self.__key] = self.__state
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        snapshots = _render_passes.snapshots
+        if self.__previous is None:
+            del snapshots[self.__key]
+        else:
+            snapshots[self.__key] = self.__previous
+        return False
+
+
+_render_passes = _RenderPasses()
+_null_context = _NullContext()
+
+
+@contextmanager
+def render_pass(*apps):
+    """
+    Enter a single read context per application for the duration of a render pass.
+
+    While in a render pass, :func:`read_context` doesn't enter nested read contexts
+    and :func:`read_state` only reads the state of each object once.
+    Objects can't be changed during the pass.
+
+    :param apps: Applications (None values are ignored).
+    :type apps: objetto.applications.Application or None
+    """
+    states = _render_passes.states
+    app = None
+    for app in apps:
+        if app is not None and app not in states:
+            break
+    else:
+        yield
+        return
+
+    with app.read_context():
+        states[app] = {}
+        try:
+            with render_pass(*apps):
+                yield
+        finally:
+            del states[app]
+
+
+def read_context(app):
+    """
+    Get a read context, unless already inside of a render pass for the application.
+
+    :param app: Application.
+    :type app: objetto.applications.Application
+
+    :return: Context manager.
+    :rtype: contextlib.AbstractContextManager
+    """
+    if app in _render_passes.states:
+        return _null_context
+    return app.read_context()
+
+
+def read_state(obj):
+    """
+    Get the state of an object, read only once per render pass.
+
+    :param obj: Object.
+    :type obj: objetto.bases.BaseObject
+
+    :return: State.
+    :rtype: objetto.bases.BaseState
+    """
+    render_passes = _render_passes
+    if render_passes.snapshots:
+        state = render_passes.snapshots.get(id(obj))
+        if state is not None:
+            return state
+    states = render_passes.states.get(obj.app)
+    if states is None:
+        return obj._state
+    try:
+        return states[id(obj)][1]
+    except KeyError:
+        state = obj._state
+        states[id(obj)] = (obj, state)
+        return state
+
+
+def snapshot_state(obj, state):
+    """
+    Get a context manager that makes :func:`read_state` return a snapshot of the
+    state of an object in the current thread, such as the rows last notified to
+    `Qt` by a model that hasn't received the latest changes yet.
+
+    :param obj: Object.
+    :type obj: objetto.bases.BaseObject
+
+    :param state: Snapshot of the state (a sequence for list objects).
+    :type state: objetto.bases.BaseState or collections.abc.Sequence
+
+    :return: Context manager.
+    :rtype: contextlib.AbstractContextManager
+    """
+    return _SnapshotContext(obj, state)
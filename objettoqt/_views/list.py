@@ -7,6 +7,7 @@ from objetto.objects import MutableListObject
 from Qt import QtCore, QtGui, QtWidgets
 
 from .._mixins import OQObjectMixin, OQAbstractItemViewMixin, OQAbstractItemModelMixin
+from .._render import render_pass
 
 __all__ = ["OQListViewMixin", "OQListView", "OQTreeListView"]
 
@@ -100,6 +101,63 @@ class OQListViewMixin(OQAbstractItemViewMixin, _object):
         self.installEventFilter(self.__event_filter)
         self.viewport().installEventFilter(self.__event_filter)
 
+    def __renderPass(self):
+        model = self.model()
+        while isinstance(model, QtCore.QAbstractProxyModel):
+            model = model.sourceModel()
+        if isinstance(model, OQAbstractItemModelMixin):
+            return model.renderPass()
+        return render_pass()
+
+    def paintEvent(self, event):
+        """
+        Paint in a single render pass of the model.
+
+        :param event: Paint event.
+        :type event: QtGui.QPaintEvent
+        """
+        with self.__renderPass():
+            super(OQListViewMixin, self).paintEvent(event)
+
+    def sizeHintForRow(self, row):
+        """
+        Get size hint for a row in a single render pass of the model.
+
+        :param row: Row.
+        :type row: int
+
+        :return: Size hint.
+        :rtype: int
+        """
+        with self.__renderPass():
+            return super(OQListViewMixin, self).sizeHintForRow(row)
+
+    def sizeHintForColumn(self, column):
+        """
+        Get size hint for a column in a single render pass of the model.
+
+        :param column: Column.
+        :type column: int
+
+        :return: Size hint.
+        :rtype: int
+        """
+        with self.__renderPass():
+            return super(OQListViewMixin, self).sizeHintForColumn(column)
+
+    def resizeColumnToContents(self, column):
+        """
+        Resize a column to its contents in a single render pass of the model.
+
+        Only available when mixed in with a view type that supports it (such as
+        :class:`QtWidgets.QTreeView`).
+
+        :param column: Column.
+        :type column: int
+        """
+        with self.__renderPass():
+            super(OQListViewMixin, self).resizeColumnToContents(column)
+
     def deleteEnabled(self):
         """
         Get whether deletion is enabled when pressing the `Del` key.
@@ -415,7 +473,20 @@ class OQListViewMixin(OQAbstractItemViewMixin, _object):
             return
 
         obj = model.obj()
-        if isinstance(obj, MutableListObject):
+        if not isinstance(obj, MutableListObject):
+            return
+
+        # Sorted/filtered rows might not be contiguous in the source list.
+        if isinstance(model, QtCore.QAbstractProxyModel):
+            source_rows = sorted(
+                set(model.mapToSource(i).row() for i in self.selectedIndexes()),
+                reverse=True,
+            )
+            if source_rows:
+                with obj.app.write_context():
+                    for source_row in source_rows:
+                        obj.delete(source_row)
+        else:
             selected_rows = sorted(
                 (i.row() for i in self.selectedIndexes()), reverse=True
             )
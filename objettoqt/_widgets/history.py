@@ -13,6 +13,15 @@ from .._views import OQTreeListView
 __all__ = ["OQHistoryWidgetDefaultHeader", "OQHistoryWidget"]
 
 
+def _foreground(history, row):
+    """Get foreground brush for a row in the history's changes (or None)."""
+    if row > history.index:  # TODO: use system colors
+        return QtGui.QBrush(QtGui.QColor(128, 128, 138, 100))
+    elif history.index == row:
+        return QtGui.QBrush(QtGui.QColor(255, 255, 255, 255))
+    return None
+
+
 class OQHistoryWidgetDefaultHeader(ListModelHeader):
     """
     Default header for :class:`objettoqt.widgets.OQHistoryWidget`.
@@ -56,13 +65,62 @@ class OQHistoryWidgetDefaultHeader(ListModelHeader):
         history = obj._parent
         if isinstance(history, HistoryObject):
             if role == QtCore.Qt.ForegroundRole:
-                if row > history.index:  # TODO: use system colors
-                    return QtGui.QBrush(QtGui.QColor(128, 128, 138, 100))
-                elif history.index == row:
-                    return QtGui.QBrush(QtGui.QColor(255, 255, 255, 255))
+                foreground = _foreground(history, row)
+                if foreground is not None:
+                    return foreground
 
         return super(OQHistoryWidgetDefaultHeader, self).data(obj, row, role=role)
 
+    def data_range(self, obj, first_row, last_row, role=QtCore.Qt.DisplayRole):
+        """
+        Dim/brighten text depending on the history's index, for a range of rows.
+
+        :param obj: History changes list.
+        :type obj: objetto.objects.ListObject
+
+        :param first_row: First row.
+        :type first_row: int
+
+        :param last_row: Last row (inclusive).
+        :type last_row: int
+
+        :param role: Role.
+        :type role: QtCore.Qt.ItemDataRole
+
+        :return: Data for each row.
+        :rtype: list[str or objetto.bases.BaseObject or QtGui.QBrush or None]
+        """
+        history = obj._parent
+        if isinstance(history, HistoryObject) and role == QtCore.Qt.ForegroundRole:
+            return [_foreground(history, row) for row in range(first_row, last_row + 1)]
+        return super(OQHistoryWidgetDefaultHeader, self).data_range(
+            obj, first_row, last_row, role=role
+        )
+
+    def roles_data(self, obj, row, roles):
+        """
+        Dim/brighten text depending on the history's index, for multiple roles.
+
+        :param obj: History changes list.
+        :type obj: objetto.objects.ListObject
+
+        :param row: Row.
+        :type row: int
+
+        :param roles: Roles.
+        :type roles: collections.abc.Sequence[QtCore.Qt.ItemDataRole]
+
+        :return: Data per role.
+        :rtype: dict[QtCore.Qt.ItemDataRole, Any]
+        """
+        roles_data = super(OQHistoryWidgetDefaultHeader, self).roles_data(
+            obj, row, roles
+        )
+        history = obj._parent
+        if isinstance(history, HistoryObject) and QtCore.Qt.ForegroundRole in roles:
+            roles_data[QtCore.Qt.ForegroundRole] = _foreground(history, row)
+        return roles_data
+
 
 class _OQHistoryWidgetModel(OQListModel):
     def setObj(self, obj):
@@ -144,9 +202,8 @@ objettoqt.models.AbstractListModelHeader or str] or None
                     new_index = change.new_values["index"]
                     first_index = min((old_index, new_index))
                     last_index = len(history.changes) - 1
-                    self.__model.dataChanged.emit(
-                        self.__model.index(first_index, 0, QtCore.QModelIndex()),
-                        self.__model.index(last_index, 0, QtCore.QModelIndex()),
+                    self.__model.queueDataChanged(
+                        first_index, last_index, roles=(QtCore.Qt.ForegroundRole,)
                     )
 
     @QtCore.Slot(QtCore.QModelIndex)
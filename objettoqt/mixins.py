@@ -2,17 +2,23 @@
 """Mix-in classes for `Qt` types."""
 
 from ._mixins import (
+    ActionSubscription,
     OQAbstractItemModelMixin,
     OQAbstractItemViewMixin,
     OQObjectMixin,
     OQWidgetMixin,
+    SubscriberToken,
+    detach_all,
 )
 from ._views import OQListViewMixin
 
 __all__ = [
+    "ActionSubscription",
+    "SubscriberToken",
     "OQObjectMixin",
     "OQWidgetMixin",
     "OQAbstractItemModelMixin",
     "OQAbstractItemViewMixin",
     "OQListViewMixin",
+    "detach_all",
 ]
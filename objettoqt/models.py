@@ -1,10 +1,32 @@
 # -*- coding: utf-8 -*-
 """Mixed `Qt` model classes."""
 
-from ._models.list import AbstractListModelHeader, ListModelHeader, OQListModel
+from ._models.codecs import (
+    AbstractMimeCodec,
+    BinaryJsonMimeCodec,
+    YamlMimeCodec,
+    find_mime_codec,
+    get_mime_codec,
+    register_mime_codec,
+)
+from ._models.list import (
+    AbstractListModelHeader,
+    AsyncListModelHeader,
+    ListModelHeader,
+    OQListModel,
+)
+from ._models.sort_filter_list import OQSortFilterListModel
 
 __all__ = [
     "OQListModel",
+    "OQSortFilterListModel",
     "AbstractListModelHeader",
     "ListModelHeader",
+    "AsyncListModelHeader",
+    "AbstractMimeCodec",
+    "BinaryJsonMimeCodec",
+    "YamlMimeCodec",
+    "register_mime_codec",
+    "get_mime_codec",
+    "find_mime_codec",
 ]
@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+"""Dispatch timing and counters for mixed `Qt` objects."""
+
+from ._profiling import (
+    HookStats,
+    disable,
+    enable,
+    format_stats,
+    is_enabled,
+    reset,
+    stats,
+)
+
+__all__ = [
+    "HookStats",
+    "enable",
+    "disable",
+    "is_enabled",
+    "reset",
+    "stats",
+    "format_stats",
+]
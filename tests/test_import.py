@@ -8,6 +8,7 @@ def test_import():
     import objettoqt.widgets
     import objettoqt.mixins
     import objettoqt.objects
+    import objettoqt.profiling
 
     assert objettoqt
     assert objettoqt.models
@@ -15,6 +16,7 @@ def test_import():
     assert objettoqt.widgets
     assert objettoqt.mixins
     assert objettoqt.objects
+    assert objettoqt.profiling
 
 
 if __name__ == "__main__":
@@ -1,11 +1,23 @@
 # -*- coding: utf-8 -*-
+import threading
+
 import pytest
 from objetto.applications import Application
-from objetto.constants import POST
-from objetto.objects import Object, attribute
+from objetto.changes import ListInsert, Update
+from objetto.constants import POST, PRE
+from objetto.objects import Object, attribute, list_attribute, list_cls
+from objetto.observers import ActionObserver
 from Qt import QtCore
 
-from objettoqt.mixins import OQObjectMixin
+from objettoqt.mixins import (
+    ActionSubscription,
+    OQObjectMixin,
+    OQWidgetMixin,
+    SubscriberToken,
+    detach_all,
+)
+from objettoqt.models import OQListModel
+from objettoqt.widgets import OQWidget
 
 
 def test_mixin():
@@ -46,5 +58,451 @@ def test_mixin():
     assert dummy.changed == (None, thing, POST)
 
 
+def test_shared_observer(qt_app):
+    class Thing(Object):
+        name = attribute(str, default="Foo")
+
+    received = []
+
+    class DummyQObject(OQObjectMixin, QtCore.QObject):
+        dependency = None
+
+        def _onActionReceived(self, action, phase):
+            if self.dependency is not None:
+                self.dependency.objToken().wait()
+            received.append((self, phase))
+
+    app = Application()
+    thing = Thing(app)
+
+    dummy_a = DummyQObject()
+    dummy_b = DummyQObject()
+    dummy_b.dependency = dummy_a
+    dummy_c = DummyQObject()
+    dummy_c.dependency = dummy_b
+    for dummy in (dummy_c, dummy_b, dummy_a):
+        dummy.setObj(thing)
+    assert dummy_a.objToken() is not dummy_b.objToken()
+    assert isinstance(dummy_a.objToken(), SubscriberToken)
+    assert isinstance(dummy_a.objToken().observer, ActionObserver)
+    assert dummy_a.objToken().observer is dummy_b.objToken().observer
+    assert dummy_a.objToken().obj is thing
+    assert dummy_a.objToken().qobj is dummy_a
+
+    thing.name = "Bar"
+    assert received == [
+        (dummy_a, PRE),
+        (dummy_b, PRE),
+        (dummy_c, PRE),
+        (dummy_a, POST),
+        (dummy_b, POST),
+        (dummy_c, POST),
+    ]
+
+    del received[:]
+    dummy_c.dependency = None
+    dummy_b.deleteLater()
+    qt_app.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+    thing.name = "Foo"
+    assert received == [
+        (dummy_c, PRE),
+        (dummy_a, PRE),
+        (dummy_c, POST),
+        (dummy_a, POST),
+    ]
+
+
+def test_detach_all(qt_app):
+    class Thing(Object):
+        name = attribute(str, default="Foo")
+
+    class DummyQObject(OQObjectMixin, QtCore.QObject):
+        received = None
+        changed = None
+
+        def _onObjChanged(self, obj, old_obj, phase):
+            self.changed.append(phase)
+
+        def _onActionReceived(self, action, phase):
+            self.received.append(phase)
+
+    app = Application()
+    thing = Thing(app)
+
+    root = DummyQObject()
+    child = DummyQObject(root)
+    QtCore.QObject(child)
+    grandchild = DummyQObject(child)
+    idle = DummyQObject(root)
+    for dummy in (root, child, grandchild, idle):
+        dummy.received = []
+        dummy.changed = []
+    for dummy in (root, child, grandchild):
+        dummy.setObj(thing)
+        del dummy.changed[:]
+
+    assert detach_all(root) == 3
+    assert detach_all(root) == 0
+    for dummy in (root, child, grandchild):
+        assert dummy.obj() is None
+        assert dummy.objToken() is None
+        assert dummy.changed == []
+
+    thing.name = "Bar"
+    for dummy in (root, child, grandchild):
+        assert dummy.received == []
+
+    root.deleteLater()
+    qt_app.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+
+
+def test_mixin_bases():
+    class DummyQObject(OQWidgetMixin, QtCore.QObject):
+        pass
+
+    for _ in range(2):
+        with pytest.raises(TypeError):
+            DummyQObject()
+
+    class Thing(Object):
+        name = attribute(str, default="Foo")
+
+    app = Application()
+    model = OQListModel()
+    with pytest.raises(TypeError):
+        model.setObj(Thing(app))
+    assert model.obj() is None
+
+    lst = list_cls(int)(app, range(3))
+    model.setObj(lst)
+    assert model.obj() is lst
+
+
+def test_batch_actions(qt_app):
+    class Thing(Object):
+        name = attribute(str, default="Foo")
+
+    class DummyQObject(OQObjectMixin, QtCore.QObject):
+        received = None
+
+        def _onActionReceived(self, action, phase):
+            self.received.append((action, phase))
+
+        def _onActionsReceived(self, actions):
+            self.received.append(actions)
+
+    app = Application()
+    thing = Thing(app)
+
+    dummy = DummyQObject()
+    dummy.received = []
+    dummy.setBatchActions(True)
+    assert dummy.batchActions() is True
+    dummy.setObj(thing)
+
+    thing.name = "Bar"
+    thing.name = "Foo"
+    assert dummy.received == []
+
+    qt_app.processEvents()
+    assert len(dummy.received) == 1
+    assert [phase for _, phase in dummy.received[0]] == [PRE, POST, PRE, POST]
+
+    thing.name = "Bar"
+    dummy.setBatchActions(False)
+    assert len(dummy.received) == 2
+    assert len(dummy.received[-1]) == 2
+
+    thing.name = "Foo"
+    assert len(dummy.received) == 4
+    qt_app.processEvents()
+    assert len(dummy.received) == 4
+
+
+def test_marshal_actions(qt_app):
+    class Thing(Object):
+        name = attribute(str, default="Foo")
+
+    class DummyQObject(OQObjectMixin, QtCore.QObject):
+        received = None
+        changed = None
+
+        def _onObjChanged(self, obj, old_obj, phase):
+            self.changed.append((obj, old_obj, phase))
+
+        def _onActionReceived(self, action, phase):
+            self.received.append((threading.current_thread(), phase))
+
+    app = Application()
+    thing = Thing(app)
+
+    dummy = DummyQObject()
+    dummy.received = []
+    dummy.changed = []
+    dummy.setMarshalActions(True)
+    dummy.setObj(thing)
+
+    def worker():
+        thing.name = "Bar"
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    assert dummy.received == []
+
+    qt_app.processEvents()
+    assert dummy.received == [
+        (threading.current_thread(), PRE),
+        (threading.current_thread(), POST),
+    ]
+
+    # Exceed backlog limit.
+    dummy.setActionBacklogLimit(3)
+    del dummy.changed[:]
+
+    def worker():
+        for i in range(3):
+            thing.name = str(i)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    qt_app.processEvents()
+    assert len(dummy.received) == 2
+    assert dummy.droppedActionCount() == 6
+    assert dummy.changed == [(thing, thing, PRE), (thing, thing, POST)]
+
+
+def test_marshal_actions_list_model(qt_app):
+    app = Application()
+    lst = list_cls(int)(app, range(10))
+
+    model = OQListModel()
+    model.setDebugChecks(True)
+    model.setMarshalActions(True)
+    model.setObj(lst)
+
+    def rows():
+        return [model.data(model.index(i)) for i in range(model.rowCount())]
+
+    # Rows are served as last notified until the actions are delivered.
+    def worker():
+        lst.delete(slice(0, 6))
+        lst.insert(1, 20)
+        lst.move(slice(0, 2), 5)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    assert rows() == [str(i) for i in range(10)]
+
+    qt_app.processEvents()
+    assert rows() == [str(v) for v in lst]
+
+
+def test_subscriptions():
+    class Thing(Object):
+        name = attribute(str, default="Foo")
+        age = attribute(int, default=0)
+        things = list_attribute(int)
+
+    class DummyQObject(OQObjectMixin, QtCore.QObject):
+        Subscriptions = (
+            ActionSubscription(
+                change_types=(Update,),
+                names=("name",),
+                phases=(POST,),
+                from_children=False,
+            ),
+        )
+        received = None
+
+        def _onActionReceived(self, action, phase):
+            self.received.append((type(action.change), phase))
+
+    app = Application()
+    thing = Thing(app)
+
+    dummy = DummyQObject()
+    dummy.received = []
+    dummy.setObj(thing)
+
+    thing.age = 1
+    thing.things.append(1)
+    assert dummy.received == []
+    thing.name = "Bar"
+    assert dummy.received == [(Update, POST)]
+
+    del dummy.received[:]
+    dummy.setSubscriptions(
+        [ActionSubscription(change_types=[ListInsert], from_self=False)]
+    )
+    thing.name = "Foo"
+    thing.things.append(2)
+    assert dummy.received == [(ListInsert, PRE), (ListInsert, POST)]
+
+    del dummy.received[:]
+    dummy.setSubscriptions(None)
+    thing.age = 2
+    assert dummy.received == [(Update, PRE), (Update, POST)]
+
+
+def test_observed_paths():
+    class Leaf(Object):
+        value = attribute(int, default=0)
+
+    class Branch(Object):
+        leaves = list_attribute(Leaf)
+
+    class Tree(Object):
+        name = attribute(str, default="Foo")
+        left = attribute(Branch)
+        right = attribute(Branch)
+
+    class DummyQObject(OQObjectMixin, QtCore.QObject):
+        received = None
+
+        def _onActionReceived(self, action, phase):
+            if phase is POST:
+                self.received.append(tuple(action.locations))
+
+    app = Application()
+    tree = Tree(
+        app,
+        left=Branch(app, leaves=[Leaf(app)]),
+        right=Branch(app, leaves=[Leaf(app)]),
+    )
+
+    dummy = DummyQObject()
+    dummy.received = []
+    dummy.setObj(tree)
+
+    tree.name = "Bar"
+    tree.left.leaves[0].value = 1
+    assert dummy.received == [(), ("left", "leaves", 0)]
+
+    del dummy.received[:]
+    dummy.setObservedDepth(0)
+    assert dummy.observedDepth() == 0
+    tree.name = "Foo"
+    tree.left.leaves[0].value = 2
+    assert dummy.received == [()]
+
+    del dummy.received[:]
+    dummy.setObservedDepth(None)
+    dummy.setObservedPaths([("right",)])
+    assert dummy.observedPaths() == frozenset([("right",)])
+    tree.name = "Bar"
+    tree.left.leaves[0].value = 3
+    tree.right.leaves[0].value = 3
+    tree.right.leaves.append(Leaf(app))
+    assert dummy.received == [("right", "leaves", 0), ("right", "leaves")]
+
+    del dummy.received[:]
+    dummy.setObservedDepth(2)
+    tree.right.leaves[0].value = 4
+    tree.right.leaves.append(Leaf(app))
+    assert dummy.received == [("right", "leaves")]
+
+    del dummy.received[:]
+    dummy.setObservedDepth(None)
+    dummy.setObservedPaths(None)
+    tree.left.leaves[0].value = 4
+    assert dummy.received == [("left", "leaves", 0)]
+
+    with pytest.raises(ValueError):
+        dummy.setObservedDepth(-1)
+
+
+def test_pause_observation():
+    class Thing(Object):
+        name = attribute(str, default="Foo")
+        things = list_attribute(int)
+
+    class DummyQObject(OQObjectMixin, QtCore.QObject):
+        received = None
+        changed = None
+
+        def _onObjChanged(self, obj, old_obj, phase):
+            self.changed.append((obj, old_obj, phase))
+
+        def _onActionReceived(self, action, phase):
+            self.received.append((type(action.change), phase))
+
+    app = Application()
+    thing = Thing(app)
+
+    dummy = DummyQObject()
+    dummy.received = []
+    dummy.changed = []
+    dummy.setObj(thing)
+    del dummy.changed[:]
+
+    with dummy.pauseObservationContext():
+        assert dummy.isObservationPaused()
+        thing.name = "Bar"
+        thing.things.append(1)
+        thing.name = "Foo"
+        assert dummy.received == []
+    assert not dummy.isObservationPaused()
+    assert dummy.received == [
+        (ListInsert, PRE),
+        (ListInsert, POST),
+        (Update, PRE),
+        (Update, POST),
+    ]
+    assert dummy.droppedActionCount() == 2
+    assert dummy.changed == []
+
+    # Exceed replay limit.
+    del dummy.received[:]
+    dummy.setReplayLimit(3)
+    dummy.pauseObservation()
+    thing.things.append(2)
+    thing.things.append(3)
+    dummy.resumeObservation()
+    assert dummy.received == []
+    assert dummy.changed == [(thing, thing, PRE), (thing, thing, POST)]
+
+    with pytest.raises(RuntimeError):
+        dummy.resumeObservation()
+
+
+def test_defer_while_hidden(qt_app):
+    class Thing(Object):
+        name = attribute(str, default="Foo")
+
+    class DummyWidget(OQWidget):
+        received = None
+
+        def _onActionReceived(self, action, phase):
+            self.received.append(phase)
+
+    app = Application()
+    thing = Thing(app)
+
+    widget = DummyWidget()
+    widget.received = []
+    widget.setObj(thing)
+    widget.setDeferWhileHidden(True)
+    assert widget.isObservationPaused()
+
+    thing.name = "Bar"
+    assert widget.received == []
+
+    widget.show()
+    assert not widget.isObservationPaused()
+    assert widget.received == [PRE, POST]
+
+    widget.hide()
+    thing.name = "Foo"
+    assert widget.received == [PRE, POST]
+
+    widget.setDeferWhileHidden(False)
+    assert widget.received == [PRE, POST, PRE, POST]
+    widget.deleteLater()
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
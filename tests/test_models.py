@@ -1,10 +1,25 @@
 # -*- coding: utf-8 -*-
+import gc
+import os
+import subprocess
+import sys
+import threading
+
 import pytest
 from objetto.applications import Application
-from objetto.objects import list_cls
+from objetto.objects import Object, attribute, list_cls
 from Qt import QtCore
 
-from objettoqt._models import OQListModel
+from objettoqt._models import (
+    AsyncListModelHeader,
+    BinaryJsonMimeCodec,
+    ListModelHeader,
+    OQListModel,
+    OQSortFilterListModel,
+    YamlMimeCodec,
+    find_mime_codec,
+)
+from objettoqt.views import OQTreeListView
 
 
 def test_list_model():
@@ -25,5 +40,1008 @@ def test_list_model():
         assert model.data(model.index(i), role=QtCore.Qt.UserRole) == v
 
 
+def test_list_model_row_snapshot():
+    app = Application()
+    lst = list_cls(int)(app, range(10))
+
+    model = OQListModel()
+    model.setDebugChecks(True)
+    model.setObj(lst)
+
+    def rows():
+        return [
+            model.data(model.index(i), role=QtCore.Qt.UserRole)
+            for i in range(model.rowCount())
+        ]
+
+    lst.insert(2, 20, 21)
+    lst.delete(slice(0, 3))
+    lst[1] = 30
+    lst.move(slice(0, 2), 6)
+    lst.move(slice(4, 6), 1)
+    assert rows() == list(lst)
+    assert not model.index(len(lst)).isValid()
+
+    with model.pauseObservationContext():
+        lst.append(40)
+        assert model.rowCount() == len(lst) - 1
+    assert rows() == list(lst)
+
+    # Data comes from the rows last notified to Qt while paused.
+    shown = rows()
+    with model.pauseObservationContext():
+        lst.delete(slice(5, 10))
+        assert model.rowCount() == len(shown)
+        assert rows() == shown
+        assert model.data(model.index(9)) == str(shown[9])
+        assert model.flags(model.index(9)) & QtCore.Qt.ItemIsEnabled
+    assert rows() == list(lst)
+
+    model.setObj(None)
+    assert model.rowCount() == 0
+
+
+def test_list_model_row_snapshot_marshaled(qt_app):
+    app = Application()
+    lst = list_cls(int)(app, range(10))
+
+    model = OQListModel()
+    model.setDebugChecks(True)
+    model.setDataCacheSize(100)
+    model.setMarshalActions(True)
+    model.setObj(lst)
+
+    # Data comes from the rows last notified to Qt until actions are delivered.
+    thread = threading.Thread(target=lambda: lst.delete(slice(5, 10)))
+    thread.start()
+    thread.join()
+    assert model.rowCount() == 10
+    assert [model.data(model.index(i)) for i in range(10)] == [
+        str(i) for i in range(10)
+    ]
+    assert model.itemData(model.index(9))[int(QtCore.Qt.DisplayRole)] == "9"
+
+    qt_app.processEvents()
+    assert model.rowCount() == 5
+    assert [model.data(model.index(i)) for i in range(5)] == [str(i) for i in range(5)]
+
+
+def test_list_model_paging():
+    app = Application()
+    lst = list_cls(int)(app, range(25))
+
+    model = OQListModel()
+    model.setObj(lst)
+    model.setPageSize(10)
+    assert model.rowCount() == 10
+    assert model.canFetchMore(QtCore.QModelIndex())
+
+    # Rows not loaded yet don't have valid indexes.
+    assert model.index(9).isValid()
+    assert not model.index(10).isValid()
+    model.fetchMore(QtCore.QModelIndex())
+    assert model.index(10).isValid()
+    assert model.rowCount() == 20
+    assert not model.index(20).isValid()
+    model.setPageSize(5)
+    assert model.rowCount() == 5
+    assert not model.index(5).isValid()
+
+    # Proxies still see every row.
+    proxy = OQSortFilterListModel()
+    proxy.setSourceModel(model)
+    assert proxy.rowCount() == 25
+    assert proxy.data(proxy.index(24), role=QtCore.Qt.UserRole) == 24
+    proxy.setSourceModel(None)
+    model.setPageSize(10)
+
+    inserted = []
+    removed = []
+    model.rowsInserted.connect(lambda _, first, last: inserted.append((first, last)))
+    model.rowsRemoved.connect(lambda _, first, last: removed.append((first, last)))
+
+    # Changes past the loaded rows only adjust the count.
+    lst.insert(20, 100, 101)
+    del lst[15:18]
+    assert not inserted and not removed
+    assert model.rowCount() == 10
+
+    lst.insert(2, 200)
+    del lst[8:12]
+    assert inserted == [(2, 2)]
+    assert removed == [(8, 10)]
+    assert model.rowCount() == 8
+
+    model.fetchMore(QtCore.QModelIndex())
+    model.fetchMore(QtCore.QModelIndex())
+    assert inserted[1:] == [(8, 17), (18, 20)]
+    assert not model.canFetchMore(QtCore.QModelIndex())
+    rows = [model.data(model.index(i), role=QtCore.Qt.UserRole) for i in range(21)]
+    assert rows == list(lst)
+
+    # All rows loaded, appending shows new rows.
+    lst.append(300)
+    assert model.rowCount() == len(lst) == 22
+
+    model.setPageSize(None)
+    assert model.rowCount() == 22
+    with pytest.raises(ValueError):
+        model.setPageSize(0)
+
+
+def test_list_model_reset_threshold(qt_app):
+    app = Application()
+    lst = list_cls(int)(app, range(10))
+
+    model = OQListModel()
+    model.setObj(lst)
+    model.setResetThreshold(5)
+
+    signals = []
+    model.rowsInserted.connect(lambda *_: signals.append("inserted"))
+    model.modelAboutToBeReset.connect(lambda: signals.append("about to reset"))
+    model.modelReset.connect(lambda: signals.append("reset"))
+    model.layoutAboutToBeChanged.connect(lambda *_: signals.append("about to layout"))
+    model.layoutChanged.connect(lambda *_: signals.append("layout"))
+    row_counts = []
+    model.layoutChanged.connect(lambda *_: row_counts.append(model.rowCount()))
+
+    # Changes over the threshold, per change or per event loop iteration.
+    lst.extend(range(2))
+    lst.extend(range(2))
+    lst.extend(range(2))
+    lst.extend(range(2))
+    assert signals == ["inserted", "inserted", "about to reset"]
+    qt_app.processEvents()
+    assert signals[-1] == "reset"
+    assert model.rowCount() == len(lst) == 18
+    assert model.fallbackCount() == 1
+    assert model.rowSignalCount() == 2
+
+    lst.extend(range(6))
+    qt_app.processEvents()
+    assert signals[-2:] == ["about to reset", "reset"]
+    del signals[:]
+
+    # Keep persistent indexes when falling back to a layout change.
+    model.setResetPolicy("layout")
+    first = QtCore.QPersistentModelIndex(model.index(0))
+    third = QtCore.QPersistentModelIndex(model.index(2))
+    last = QtCore.QPersistentModelIndex(model.index(len(lst) - 1))
+    with app.write_context():
+        lst.move(slice(0, 6), 10)
+        lst.move(slice(0, 1), 5)
+    assert signals == ["about to layout"]
+    qt_app.processEvents()
+    assert signals == ["about to layout", "layout"]
+    assert row_counts == [len(lst)]
+    assert first.row() == 3
+    assert third.row() == 6
+    assert last.row() == len(lst) - 1
+    assert model.data(model.index(3), QtCore.Qt.UserRole) == 0
+    del signals[:]
+
+    # Insertions and deletions change the row count, so they reset instead.
+    with app.write_context():
+        lst.move(slice(0, 6), 10)
+        lst.insert(1, *range(100, 110))
+        del lst[12]
+    qt_app.processEvents()
+    assert signals == ["about to layout", "layout", "about to reset", "reset"]
+    assert row_counts[-1] == len(lst) - 9
+    assert model.rowCount() == len(lst)
+    assert model.fallbackCount() == 5
+
+    with pytest.raises(ValueError):
+        model.setResetThreshold(0)
+    with pytest.raises(ValueError):
+        model.setResetPolicy("foo")
+
+
+def test_list_model_paused():
+    app = Application()
+    lst = list_cls(int)(app, range(10))
+
+    model = OQListModel()
+    model.setObj(lst)
+    model.setReplayLimit(4)
+
+    resets = []
+    model.modelReset.connect(lambda: resets.append(True))
+
+    with model.pauseObservationContext():
+        lst.append(10)
+        lst.append(11)
+    assert not resets
+    assert model.rowCount() == 12
+
+    with model.pauseObservationContext():
+        lst.extend(range(12, 15))
+        lst.extend(range(15, 20))
+        lst.extend(range(20, 25))
+    assert resets == [True]
+    assert model.rowCount() == len(lst) == 25
+
+
+def test_list_model_data_cache():
+    class Thing(Object):
+        name = attribute(str, default="Foo")
+
+    app = Application()
+    lst = list_cls(Thing)(app, (Thing(app, name=str(i)) for i in range(10)))
+
+    model = OQListModel(headers=("name",))
+    model.setObj(lst)
+    model.setDataCacheSize(5)
+
+    def names(start=0):
+        return [model.data(model.index(i)) for i in range(start, model.rowCount())]
+
+    # Each miss gets the data for a range of rows.
+    assert names() == [str(i) for i in range(10)]
+    assert model.dataCacheMissCount() == 2
+    assert names(5) == [str(i) for i in range(5, 10)]
+    assert model.dataCacheHitCount() == 13
+    assert model.dataCacheMissCount() == 2
+
+    lst[7].name = "Seven"
+    assert model.data(model.index(7)) == "Seven"
+
+    lst.insert(0, Thing(app, name="A"))
+    lst.move(slice(1, 3), 6)
+    lst.pop(4)
+    misses = model.dataCacheMissCount()
+    assert names(6) == ["6", "Seven", "8", "9"]
+    assert model.dataCacheMissCount() == misses
+    assert names() == [t.name for t in lst]
+
+    lst[8] = Thing(app, name="Eight")
+    model.setHeaders(("name", "name"))
+    assert model.data(model.index(8, 1)) == "Eight"
+
+    model.setDataCacheSize(None)
+    assert names() == [t.name for t in lst]
+
+    with pytest.raises(ValueError):
+        model.setDataCacheSize(0)
+
+
+def test_list_model_data_range():
+    class Thing(Object):
+        name = attribute(str, default="Foo")
+
+    class Other(Object):
+        pass
+
+    app = Application()
+    lst = list_cls((Thing, Other))(app, (Thing(app, name=str(i)) for i in range(100)))
+    header = ListModelHeader(title="name", fallback="?")
+    assert header.data_range(lst, 2, 4) == ["2", "3", "4"]
+    assert header.data_range(lst, 2, 3, QtCore.Qt.UserRole) == list(lst[2:4])
+
+    lst.insert(3, Other(app))
+    assert header.data_range(lst, 2, 4) == ["2", "?", "3"]
+
+    class CountingHeader(ListModelHeader):
+        def data_range(self, obj, first_row, last_row, role=QtCore.Qt.DisplayRole):
+            ranges.append((first_row, last_row))
+            return super(CountingHeader, self).data_range(
+                obj, first_row, last_row, role
+            )
+
+    ranges = []
+    model = OQListModel(headers=(CountingHeader(title="name", fallback="?"),))
+    model.setObj(lst)
+    model.setDataCacheSize(100)
+    names = [model.data(model.index(i)) for i in range(40, 80)]
+    assert names == header.data_range(lst, 40, 79)
+    assert ranges == [(32, 63), (64, 95)]
+
+
+def test_list_model_item_data(qt_app):
+    class Thing(Object):
+        name = attribute(str, default="Foo")
+
+    class ToolTipHeader(ListModelHeader):
+        def data(self, obj, row, role=QtCore.Qt.DisplayRole):
+            if role == QtCore.Qt.ToolTipRole:
+                return "Tip {}".format(row)
+            return super(ToolTipHeader, self).data(obj, row, role)
+
+    app = Application()
+    lst = list_cls(Thing)(app, (Thing(app, name=str(i)) for i in range(3)))
+
+    header = ListModelHeader(title="name")
+    assert header.roles_data(lst, 1, (QtCore.Qt.DisplayRole, QtCore.Qt.UserRole)) == {
+        QtCore.Qt.DisplayRole: "1",
+        QtCore.Qt.UserRole: lst[1],
+    }
+
+    model = OQListModel(headers=(ToolTipHeader(title="name"),))
+    model.setObj(lst)
+    expected = {int(QtCore.Qt.DisplayRole): "2", int(QtCore.Qt.ToolTipRole): "Tip 2"}
+    assert model.itemData(model.index(2)) == expected
+
+    # Called by `Qt` through a proxy.
+    proxy = OQSortFilterListModel()
+    proxy.setSourceModel(model)
+    assert proxy.itemData(proxy.index(2)) == expected
+
+    model.setDataCacheSize(10)
+    assert model.itemData(model.index(2)) == expected
+    misses = model.dataCacheMissCount()
+    assert model.data(model.index(2), QtCore.Qt.ToolTipRole) == "Tip 2"
+    assert model.itemData(model.index(2)) == expected
+    assert model.dataCacheMissCount() == misses
+
+    lst[2].name = "Two"
+    assert model.itemData(model.index(2))[int(QtCore.Qt.DisplayRole)] == "Two"
+
+
+def test_list_model_data_changed(qt_app):
+    class Thing(Object):
+        name = attribute(str, default="Foo")
+        size = attribute(int, default=0)
+
+    app = Application()
+    lst = list_cls(Thing)(app, (Thing(app, name=str(i)) for i in range(10)))
+
+    model = OQListModel(headers=("name", "size"))
+    model.setObj(lst)
+
+    signals = []
+    model.dataChanged.connect(
+        lambda top_left, bottom_right, roles: signals.append(
+            (
+                (top_left.row(), top_left.column()),
+                (bottom_right.row(), bottom_right.column()),
+                sorted(int(role) for role in roles),
+            )
+        )
+    )
+    model.rowsInserted.connect(lambda *_: signals.append("inserted"))
+
+    # Adjacent updates are merged and emitted on the next event loop iteration.
+    for i in (2, 3, 4, 7):
+        lst[i] = Thing(app, name=str(i))
+    lst[4].name = "Four"
+    assert not signals
+    qt_app.processEvents()
+    assert signals == [
+        ((2, 0), (4, 1), []),
+        ((7, 0), (7, 1), []),
+        ((4, 0), (4, 0), [0, 256]),
+        ((4, 1), (4, 1), [256]),
+    ]
+    assert model.dataChangedRequestCount() == 6
+    assert model.dataChangedEmitCount() == 4
+    assert model.dataChangedMergeCount() == 2
+    del signals[:]
+
+    # Only roles affected by the attribute are signaled, before inserting rows.
+    lst[5].size = 5
+    lst[6].size = 6
+    lst.insert(0, Thing(app))
+    assert signals == [
+        ((5, 1), (6, 1), [0, 256]),
+        ((5, 0), (6, 0), [256]),
+        "inserted",
+    ]
+
+    qt_app.processEvents()
+    assert len(signals) == 3
+
+
+def test_list_model_render_pass(qt_app):
+    class Thing(Object):
+        name = attribute(str, default="Foo")
+
+    app = Application()
+    lst = list_cls(Thing)(app, (Thing(app, name=str(i)) for i in range(3)))
+
+    model = OQListModel(headers=("name", "name"))
+    model.setObj(lst)
+
+    with model.renderPass():
+        assert model.rowCount() == 3
+        assert [model.data(model.index(i, 1)) for i in range(3)] == ["0", "1", "2"]
+        assert model.headerData(0) == "Name"
+        with pytest.raises(RuntimeError):
+            lst.append(Thing(app))
+
+    lst[1].name = "One"
+    view = OQTreeListView()
+    view.setModel(model)
+    view.resizeColumnToContents(0)
+    assert view.sizeHintForRow(1) > 0
+    view.viewport().repaint()
+    assert model.data(model.index(1)) == "One"
+    view.deleteLater()
+    qt_app.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+
+
+def test_list_model_mime_codecs(qt_app):
+    app = Application()
+    source = list_cls(str)(app, ("a", "b", "c", "d"))
+    target = list_cls(str)(app, ("x",))
+
+    source_model = OQListModel(mime_type="application/x-test")
+    source_model.setObj(source)
+    target_model = OQListModel(mime_type="application/x-test")
+    target_model.setObj(target)
+    assert source_model.mimeCodec() == "binary_json"
+
+    def external_mime_data(data):
+        mime_data = QtCore.QMimeData()
+        mime_data.setData("application/x-test", data)
+        return mime_data
+
+    indexes = [source_model.index(1), source_model.index(2)]
+    data = bytes(source_model.mimeData(indexes).data("application/x-test").data())
+    assert find_mime_codec(data).name == "binary_json"
+    mime_data = external_mime_data(data)
+    assert target_model.dropMimeData(mime_data, QtCore.Qt.CopyAction, 1, 0)
+    assert list(target) == ["x", "b", "c"]
+
+    # YAML is still decoded.
+    source_model.setMimeCodec("yaml")
+    data = bytes(source_model.mimeData(indexes).data("application/x-test").data())
+    assert isinstance(find_mime_codec(data), YamlMimeCodec)
+    mime_data = external_mime_data(data)
+    assert target_model.dropMimeData(mime_data, QtCore.Qt.CopyAction, -1, 0)
+    assert list(target) == ["x", "b", "c", "b", "c"]
+
+    # Truncated data is rejected.
+    source_model.setMimeCodec("binary_json")
+    data = bytes(source_model.mimeData(indexes).data("application/x-test").data())
+    mime_data = external_mime_data(data[:-1])
+    assert not target_model.dropMimeData(mime_data, QtCore.Qt.CopyAction, -1, 0)
+    assert len(target) == 5
+
+    with pytest.raises(KeyError):
+        source_model.setMimeCodec("unknown")
+
+
+def test_list_model_mime_data_in_process(qt_app):
+    class Thing(Object):
+        name = attribute(str, default="Foo")
+
+    app = Application()
+    source = list_cls(Thing)(app, (Thing(app, name=str(i)) for i in range(4)))
+    target = list_cls(Thing)(app)
+
+    source_model = OQListModel(mime_type="application/x-test")
+    source_model.setObj(source)
+    target_model = OQListModel(mime_type="application/x-test")
+    target_model.setObj(target)
+    indexes = [source_model.index(1), source_model.index(2)]
+
+    # Copies are deserialized from memory.
+    mime_data = source_model.mimeData(indexes)
+    assert target_model.dropMimeData(mime_data, QtCore.Qt.CopyAction, -1, 0)
+    assert [t.name for t in target] == ["1", "2"]
+    assert target[0] is not source[1]
+
+    # Moves between lists take the actual objects out of the source list.
+    moved = list(source[1:3])
+    mime_data = source_model.mimeData(indexes)
+    assert target_model.dropMimeData(mime_data, QtCore.Qt.MoveAction, 0, 0)
+    assert all(a is b for a, b in zip(target[:2], moved))
+    assert not any(t in moved for t in source)
+    assert [t.name for t in source] == ["0", "3"]
+
+    # Moves within the same list.
+    mime_data = target_model.mimeData([target_model.index(0)])
+    assert target_model.dropMimeData(mime_data, QtCore.Qt.MoveAction, -1, 0)
+    assert [t.name for t in target] == ["2", "1", "2", "1"]
+
+    # Moves are rejected if the source changed since the drag started.
+    mime_data = source_model.mimeData([source_model.index(0)])
+    source.append(Thing(app, name="4"))
+    assert not target_model.dropMimeData(mime_data, QtCore.Qt.MoveAction, 0, 0)
+    assert [t.name for t in source] == ["0", "3", "4"]
+    assert [t.name for t in target] == ["2", "1", "2", "1"]
+    assert target_model.dropMimeData(mime_data, QtCore.Qt.CopyAction, 0, 0)
+    assert [t.name for t in target] == ["0", "2", "1", "2", "1"]
+    del target[0]
+
+    # Rows are encoded for other consumers from the state when dragged.
+    mime_data = target_model.mimeData([target_model.index(0)])
+    target.clear()
+    data = bytes(mime_data.data("application/x-test").data())
+    contents = find_mime_codec(data).decode(data)
+    assert contents["serialized_objs"][0]["name"] == "2"
+
+
+_DROP_SCRIPT = """
+import sys
+from objetto.applications import Application
+from objetto.objects import list_cls
+from Qt import QtCore, QtWidgets
+from objettoqt.models import OQListModel
+
+qt_app = QtWidgets.QApplication([])
+target = list_cls(str)(Application())
+model = OQListModel(mime_type="application/x-test")
+model.setObj(target)
+mime_data = QtCore.QMimeData()
+mime_data.setData("application/x-test", bytes.fromhex(sys.argv[1]))
+assert model.dropMimeData(mime_data, QtCore.Qt.CopyAction, -1, 0)
+print(",".join(target))
+"""
+
+
+def test_list_model_shared_memory(qt_app):
+    pytest.importorskip("multiprocessing.shared_memory")
+    from objettoqt._models.transports import is_descriptor, open_descriptor
+
+    app = Application()
+    source = list_cls(str)(app, (str(i) for i in range(1000)))
+    model = OQListModel(mime_type="application/x-test")
+    model.setObj(source)
+    model.setSharedMemoryThreshold(1024)
+    with pytest.raises(ValueError):
+        model.setSharedMemoryThreshold(-1)
+
+    # Small payloads are carried inline.
+    mime_data = model.mimeData([model.index(0)])
+    assert not is_descriptor(bytes(mime_data.data("application/x-test").data()))
+
+    # Large payloads are decoded by another process from shared memory.
+    mime_data = model.mimeData([model.index(i) for i in range(1000)])
+    descriptor = bytes(mime_data.data("application/x-test").data())
+    assert is_descriptor(descriptor)
+    assert len(descriptor) < 64
+
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (root, env.get("PYTHONPATH")) if p)
+    output = subprocess.check_output(
+        [sys.executable, "-c", _DROP_SCRIPT, descriptor.hex()], env=env
+    )
+    assert output.decode("utf8").strip().split(",") == list(source)
+
+    # Segment is released with the mime data.
+    del mime_data
+    gc.collect()
+    with pytest.raises(OSError):
+        with open_descriptor(descriptor):
+            pass
+
+
+def test_list_model_async_drop(qt_app):
+    class Thing(Object):
+        name = attribute(str, default="Foo")
+
+    app = Application()
+    target = list_cls(Thing)(app, (Thing(app, name="x"),))
+    model = OQListModel(mime_type="application/x-test")
+    model.setObj(target)
+    model.setAsyncDropThreshold(3)
+    model.setDropChunkSize(2)
+
+    progress = []
+    finished = []
+    model.asyncDropProgressed.connect(lambda *args: progress.append(args))
+    model.asyncDropFinished.connect(lambda *args: finished.append(args))
+
+    def drop(serialized_objs, action=QtCore.Qt.CopyAction):
+        mime_data = QtCore.QMimeData()
+        contents = {"serialized_objs": serialized_objs}
+        mime_data.setData("application/x-test", BinaryJsonMimeCodec().encode(contents))
+        return model.dropMimeData(mime_data, action, 1, 0)
+
+    def wait():
+        QtCore.QThreadPool.globalInstance().waitForDone()
+        qt_app.processEvents()
+
+    serialized = [target.serialize_value(Thing(app, name=str(i))) for i in range(5)]
+
+    # Invalid items are skipped, valid ones are inserted at once.
+    assert drop(serialized[:2] + [3] + serialized[2:])
+    assert model.isAsyncDropRunning()
+    assert len(target) == 1
+    wait()
+    assert not model.isAsyncDropRunning()
+    assert [t.name for t in target] == ["x", "0", "1", "2", "3", "4"]
+    assert progress[-1] == (6, 6)
+    assert len(progress) == 3
+    assert finished == [(True, 5, 1)]
+
+    # Cancelled.
+    del finished[:]
+    assert drop(serialized)
+    assert model.cancelAsyncDrop()
+    assert not model.cancelAsyncDrop()
+    wait()
+    assert len(target) == 6
+    assert finished == [(False, 0, 0)]
+
+    # Below the threshold and moves are synchronous.
+    assert drop(serialized[:2])
+    assert drop(serialized, action=QtCore.Qt.MoveAction)
+    assert not model.isAsyncDropRunning()
+    assert len(target) == 13
+
+
+def test_list_model_indexes(qt_app):
+    class Thing(Object):
+        name = attribute(str, default="Foo")
+
+    class IndexedHeader(ListModelHeader):
+        def indexes(self):
+            return {QtCore.Qt.DisplayRole: "sorted"}
+
+    app = Application()
+    names = ["apple", "Banana", "apricot", "cherry", "Apple"]
+    lst = list_cls(Thing)(app, (Thing(app, name=n) for n in names))
+
+    model = OQListModel(headers=(IndexedHeader(title="name"),))
+    model.setObj(lst)
+    model.addIndex("name", attribute="name")
+    model.addIndex("lower", kind="sorted", case_sensitive=False)
+    assert model.indexKeys() == [(0, QtCore.Qt.DisplayRole), "name", "lower"]
+    with pytest.raises(ValueError):
+        model.addIndex("bad", kind="tree")
+
+    assert model.findRows("name", "apple") == [0]
+    assert model.findRows("lower", "APPLE") == [0, 4]
+    assert model.findRows((0, QtCore.Qt.DisplayRole), "cherry") == [3]
+
+    # Indexed matches give the same results as going through every row.
+    def match(value, flags, start=0, hits=-1):
+        indexes = model.match(
+            model.index(start), QtCore.Qt.DisplayRole, value, hits, flags
+        )
+        return [index.row() for index in indexes]
+
+    def scan(value, flags, start=0, hits=-1):
+        indexes = super(OQListModel, model).match(
+            model.index(start), QtCore.Qt.DisplayRole, value, hits, flags
+        )
+        return [index.row() for index in indexes]
+
+    for value, flags, start, hits in (
+        ("apple", QtCore.Qt.MatchExactly, 0, -1),
+        ("ap", QtCore.Qt.MatchStartsWith | QtCore.Qt.MatchCaseSensitive, 0, -1),
+        ("ap", QtCore.Qt.MatchStartsWith | QtCore.Qt.MatchWrap, 3, -1),
+        ("APPLE", QtCore.Qt.MatchFixedString | QtCore.Qt.MatchWrap, 1, 1),
+        ("err", QtCore.Qt.MatchContains, 0, -1),
+    ):
+        assert match(value, flags, start, hits) == scan(value, flags, start, hits)
+
+    # Updates are patched, other changes rebuild the index.
+    lst[1].name = "apple"
+    assert model.findRows("name", "apple") == [0, 1]
+    del lst[0]
+    assert model.findRows("name", "apple") == [0]
+    assert model.findRows("lower", "apple") == [0, 3]
+    lst.append(Thing(app, name="apple"))
+    assert model.findRows("name", "apple") == [0, 4]
+    assert match("app", QtCore.Qt.MatchStartsWith) == [0, 3, 4]
+
+    model.removeIndex("name")
+    with pytest.raises(KeyError):
+        model.findRows("name", "apple")
+
+
+def test_list_model_indexes_shift():
+    fetched = []
+
+    class CountingHeader(ListModelHeader):
+        def data_range(self, obj, first_row, last_row, role=QtCore.Qt.DisplayRole):
+            fetched.append(last_row - first_row + 1)
+            return super(CountingHeader, self).data_range(
+                obj, first_row, last_row, role=role
+            )
+
+    app = Application()
+    lst = list_cls(int)(app, (i % 4 for i in range(20)))
+    model = OQListModel(headers=(CountingHeader(),))
+    model.setObj(lst)
+    model.addIndex("hash")
+    model.addIndex("sorted", kind="sorted")
+
+    def check():
+        for value in range(6):
+            expected = [r for r, v in enumerate(lst) if str(v) == str(value)]
+            assert model.findRows("hash", str(value)) == expected
+            assert model.findRows("sorted", str(value)) == expected
+
+    check()
+    del fetched[:]
+
+    # Rows are shifted, only values for inserted rows are retrieved.
+    lst.insert(3, 4, 5, 4)
+    lst.insert(0, 5)
+    lst.append(4)
+    lst.insert(10, *range(20))
+    lst.delete(slice(2, 7))
+    lst.move(slice(0, 4), 12)
+    lst.move(slice(20, 30), 1)
+    lst[5] = 5
+    check()
+    assert sum(fetched) == 2 * (3 + 1 + 1 + 20 + 1)
+
+    # Keep inserting at the same position, so rows need to be relabeled.
+    for i in range(40):
+        lst.insert(1, i % 5)
+    check()
+
+
+def test_list_model_async_header(qt_app):
+    class Thing(Object):
+        name = attribute(str, default="Foo")
+
+    gate = threading.Event()
+
+    class UpperHeader(AsyncListModelHeader):
+        def compute(self, snapshot, role):
+            gate.wait(5)
+            return snapshot["name"].upper()
+
+    app = Application()
+    lst = list_cls(Thing)(app, (Thing(app, name=n) for n in "abcd"))
+    model = OQListModel(headers=(UpperHeader(title="name"),))
+    model.setObj(lst)
+    model.setAsyncDataLimit(1)
+    proxy = OQSortFilterListModel()
+    proxy.setSourceModel(model)
+    with pytest.raises(ValueError):
+        model.setAsyncDataLimit(0)
+
+    changed = []
+    model.dataChanged.connect(lambda first, last, _: changed.append((first, last)))
+    proxy_changed = []
+    proxy.dataChanged.connect(
+        lambda first, last, _: proxy_changed.append((first.row(), last.row()))
+    )
+
+    def data(row):
+        return model.data(model.index(row))
+
+    def wait():
+        gate.set()
+        while model.asyncDataInFlightCount():
+            QtCore.QThreadPool.globalInstance().waitForDone()
+            qt_app.processEvents()
+        qt_app.processEvents()
+        gate.clear()
+
+    # Placeholders while computing, one at a time.
+    assert data(0) == "..."
+    assert data(1) == "..."
+    assert model.asyncDataInFlightCount() == 1
+
+    # Results for rows that changed meanwhile are discarded.
+    lst[0].name = "x"
+    assert model.asyncDataDiscardCount() == 1
+    qt_app.processEvents()
+    del changed[:]
+    del proxy_changed[:]
+    wait()
+    assert [(f.row(), l.row()) for f, l in changed] == [(1, 1)]
+    assert proxy_changed == [(1, 1)]
+    assert data(1) == "B"
+    assert proxy.data(proxy.index(1)) == "B"
+    assert data(0) == "..."
+    wait()
+    assert data(0) == "X"
+
+    # Stale data is shown until computed again.
+    lst[1].name = "y"
+    assert data(1) == "B"
+    wait()
+    assert data(1) == "Y"
+
+    # Data moves with rows.
+    lst.insert(0, Thing(app, name="z"))
+    assert data(2) == "Y"
+    assert data(1) == "X"
+    assert model.asyncDataInFlightCount() == 0
+
+    # Raising the limit starts queued requests.
+    for row in (0, 3, 4):
+        data(row)
+    assert model.asyncDataInFlightCount() == 1
+    model.setAsyncDataLimit(3)
+    assert model.asyncDataInFlightCount() == 3
+    wait()
+    assert [data(row) for row in range(5)] == ["Z", "X", "Y", "C", "D"]
+
+    # Computed synchronously when not going through the model.
+    gate.set()
+    assert model.headers()[0].data(lst, 4) == "D"
+
+
+def test_sort_filter_list_model_mixed_keys():
+    class Thing(Object):
+        name = attribute((str, None), default=None)
+
+    app = Application()
+    names = ["b", None, "a", None, "c"]
+    lst = list_cls(Thing)(app, (Thing(app, name=n) for n in names))
+
+    source = OQListModel(headers=("name",))
+    source.setObj(lst)
+    proxy = OQSortFilterListModel()
+    proxy.setSourceModel(source)
+
+    def rows():
+        return [
+            proxy.data(proxy.index(i), role=QtCore.Qt.UserRole).name
+            for i in range(proxy.rowCount())
+        ]
+
+    proxy.sort(0)
+    assert rows() == [None, None, "a", "b", "c"]
+    lst.append(Thing(app))
+    lst[0].name = None
+    assert rows() == [None, None, None, None, "a", "c"]
+    proxy.sort(0, QtCore.Qt.DescendingOrder)
+    assert rows() == ["c", "a", None, None, None, None]
+
+
+def test_sort_filter_list_model_move():
+    class Thing(Object):
+        size = attribute(int, default=0)
+
+    calls = []
+
+    class CountingHeader(ListModelHeader):
+        def sort_key(self, obj, row):
+            calls.append(row)
+            return super(CountingHeader, self).sort_key(obj, row)
+
+    app = Application()
+    lst = list_cls(Thing)(app, (Thing(app, size=i % 3) for i in range(12)))
+    source = OQListModel(headers=(CountingHeader(title="size"),))
+    source.setObj(lst)
+    proxy = OQSortFilterListModel()
+    proxy.setSourceModel(source)
+    proxy.sort(0)
+    proxy.setFilterFunction(lambda t: t.size != 1)
+
+    def rows():
+        return [
+            proxy.data(proxy.index(i), role=QtCore.Qt.UserRole)
+            for i in range(proxy.rowCount())
+        ]
+
+    def expected():
+        return sorted((t for t in lst if t.size != 1), key=lambda t: t.size)
+
+    # Moves don't compute sort keys again, and persistent indexes follow rows.
+    thing = lst[9]
+    persistent = QtCore.QPersistentModelIndex(proxy.mapFromSource(source.index(9)))
+    del calls[:]
+    lst.move(slice(0, 4), 10)
+    lst.move(slice(8, 12), 0)
+    lst.move(slice(5, 7), 6)
+    assert not calls
+    assert rows() == expected()
+    assert proxy.data(proxy.index(persistent.row()), role=QtCore.Qt.UserRole) is thing
+    for i in range(proxy.rowCount()):
+        source_index = proxy.mapToSource(proxy.index(i))
+        assert proxy.mapFromSource(source_index).row() == i
+
+    proxy.sort(0, QtCore.Qt.DescendingOrder)
+    lst.move(slice(2, 9), 12)
+    assert rows() == sorted(
+        (t for t in lst if t.size != 1), key=lambda t: t.size, reverse=True
+    )
+
+
+def test_sort_filter_list_model(qt_app):
+    class Thing(Object):
+        name = attribute(str, default="Foo")
+        size = attribute(int, default=0)
+
+    app = Application()
+    lst = list_cls(Thing)(
+        app, (Thing(app, name=str(i), size=(i * 7) % 10) for i in range(10))
+    )
+
+    source = OQListModel(headers=("name", "size"))
+    source.setObj(lst)
+    proxy = OQSortFilterListModel()
+    proxy.setSourceModel(source)
+
+    def rows():
+        return [
+            proxy.data(proxy.index(i), role=QtCore.Qt.UserRole)
+            for i in range(proxy.rowCount())
+        ]
+
+    def expected(reverse=False):
+        accepted = [t for t in lst if t.size % 2 == 0]
+        return sorted(accepted, key=lambda t: t.size, reverse=reverse)
+
+    assert rows() == list(lst)
+
+    proxy.sort(1)
+    proxy.setFilterFunction(lambda t: t.size % 2 == 0)
+    assert rows() == expected()
+
+    inserted = []
+    removed = []
+    proxy.rowsInserted.connect(lambda _, first, last: inserted.append((first, last)))
+    proxy.rowsRemoved.connect(lambda _, first, last: removed.append((first, last)))
+
+    lst.insert(0, Thing(app, name="A", size=5), Thing(app, name="B", size=-2))
+    assert inserted == [(0, 0)]
+    assert rows() == expected()
+
+    lst[3].size = 100
+    lst[4].size = 3
+    lst.pop(6)
+    lst[0] = Thing(app, name="C", size=4)
+    assert rows() == expected()
+
+    persistent = QtCore.QPersistentModelIndex(proxy.index(0))
+    thing = rows()[0]
+    proxy.sort(1, QtCore.Qt.DescendingOrder)
+    assert rows() == expected(reverse=True)
+    assert proxy.data(persistent, role=QtCore.Qt.UserRole) is thing
+
+    lst.move(slice(0, 3), 8)
+    lst.extend([Thing(app, size=6), Thing(app, size=7)])
+    del lst[2:4]
+    assert rows() == expected(reverse=True)
+    for i, thing in enumerate(rows()):
+        assert proxy.mapFromSource(proxy.mapToSource(proxy.index(i))).row() == i
+
+    view = OQTreeListView()
+    view.setModel(proxy)
+    view.selectionModel().select(
+        QtCore.QItemSelection(proxy.index(0), proxy.index(1)),
+        QtCore.QItemSelectionModel.Select,
+    )
+    deleted = rows()[:2]
+    view.deleteSelected()
+    assert not any(t in deleted for t in lst)
+    assert rows() == expected(reverse=True)
+    view.deleteLater()
+    qt_app.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+
+    # Keep inserting at the same position, so rows need to be relabeled.
+    for i in range(40):
+        lst.insert(1, Thing(app, size=i % 3 * 2))
+    assert rows() == expected(reverse=True)
+
+    # Data changes queued on the source are signaled by the proxy, for its rows.
+    changed = []
+    proxy.dataChanged.connect(
+        lambda first, last, roles: changed.extend(range(first.row(), last.row() + 1))
+    )
+    source.queueDataChanged(0, len(lst) - 1, roles=(QtCore.Qt.ForegroundRole,))
+    qt_app.processEvents()
+    assert sorted(changed) == list(range(proxy.rowCount()))
+
+    # Rows are sorted again, since their keys might have changed.
+    ranks = {}
+
+    class RankHeader(ListModelHeader):
+        def data(self, obj, row, role=QtCore.Qt.DisplayRole):
+            if role == QtCore.Qt.DisplayRole:
+                return ranks.get(id(obj[row]), 0)
+            return super(RankHeader, self).data(obj, row, role=role)
+
+    rank_source = OQListModel(headers=(RankHeader(),))
+    rank_source.setObj(lst)
+    rank_proxy = OQSortFilterListModel()
+    rank_proxy.setSourceModel(rank_source)
+    rank_proxy.sort(0)
+    assert rank_proxy.mapToSource(rank_proxy.index(0)).row() == 0
+    ranks[id(lst[0])] = 1
+    rank_source.queueDataChanged(0, 0)
+    qt_app.processEvents()
+    last_row = rank_proxy.rowCount() - 1
+    assert rank_proxy.mapToSource(rank_proxy.index(last_row)).row() == 0
+
+    source.setObj(None)
+    assert proxy.rowCount() == 0
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+import pytest
+from objetto.applications import Application
+from objetto.objects import Object, attribute
+from Qt import QtCore
+
+from objettoqt import profiling
+from objettoqt.mixins import OQObjectMixin
+
+
+def test_profiling():
+    class Thing(Object):
+        name = attribute(str, default="Foo")
+
+    class DummyQObject(OQObjectMixin, QtCore.QObject):
+        def _onActionReceived(self, action, phase):
+            pass
+
+    app = Application()
+    thing = Thing(app)
+
+    dummy = DummyQObject()
+    dummy.setObj(thing)
+    thing.name = "Bar"
+    assert not profiling.is_enabled()
+    assert profiling.stats() == ()
+
+    profiling.enable(per_instance=True)
+    try:
+        thing.name = "Foo"
+        dummy.setObj(None)
+    finally:
+        profiling.disable()
+
+    stats = dict(
+        (row.hook, row) for row in profiling.stats() if row.owner is DummyQObject
+    )
+    assert stats["_onActionReceived"].count == 2
+    assert stats["actionReceived"].count == 2
+    assert stats["objChanged broadcast (PRE)"].count == 1
+    assert stats["objChanged broadcast (POST)"].count == 1
+    assert "__onActionReceived__" not in stats
+
+    instance_stats = profiling.stats(sort_by="count", per_instance=True)
+    assert instance_stats[0].owner is dummy
+    assert instance_stats[0].count == 2
+    assert "_onActionReceived" in profiling.format_stats()
+
+    with pytest.raises(ValueError):
+        profiling.stats(sort_by="foo")
+
+    profiling.reset()
+    assert profiling.stats() == ()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])